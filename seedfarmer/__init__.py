@@ -179,6 +179,72 @@ class Config(object):
             self._load_config_data()
         return cast(ProjectSpec, self._project_spec).manifest_validation_fail_on_unknown_fields
 
+    @property
+    def CHECKSUM_WORKERS(self) -> int:
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).checksum_workers
+
+    @property
+    def CHECKSUM_MODE(self) -> str:
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).checksum_mode
+
+    @property
+    def CHECKSUM_ALGORITHM(self) -> str:
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).checksum_algorithm
+
+    @property
+    def BUNDLE_CACHE_SIZE(self) -> int:
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).bundle_cache_size
+
+    @property
+    def BUNDLE_UPLOAD_MODE(self) -> str:
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).bundle_upload_mode
+
+    @property
+    def BUNDLE_COMPRESSION_LEVEL(self) -> int:
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).bundle_compression_level
+
+    @property
+    def UPLOAD_MAX_POOL_CONNECTIONS(self) -> int:
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).upload_max_pool_connections
+
+    @property
+    def UPLOAD_MAX_CONCURRENCY(self) -> Optional[int]:
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).upload_max_concurrency
+
+    @property
+    def UPLOAD_MULTIPART_THRESHOLD(self) -> int:
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).upload_multipart_threshold
+
+    @property
+    def UPLOAD_MULTIPART_CHUNKSIZE(self) -> int:
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).upload_multipart_chunksize
+
+    @property
+    def SERVICE_QUOTA_DISCOVERY(self) -> bool:
+        if self._project_spec is None:
+            self._load_config_data()
+        return cast(ProjectSpec, self._project_spec).service_quota_discovery
+
     @property
     def BUCKET_STORAGE_PATH(self) -> str:
         if self._project_spec is None:
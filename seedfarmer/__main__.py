@@ -107,7 +107,8 @@ def version() -> None:
 @click.option(
     "--enable-session-timeout/--disable-session-timeout",
     default=False,
-    help="Enable boto3 Session timeouts. If enabled, boto3 Sessions will be reset on the timeout interval",
+    help="Enable boto3 Session timeouts. If enabled, boto3 Sessions will be reset on the timeout interval "
+    "(not needed for long deployments, role credentials are refreshed before they expire)",
     show_default=True,
     type=bool,
 )
@@ -146,6 +147,60 @@ def version() -> None:
     show_default=True,
     type=bool,
 )
+@click.option(
+    "--dag-scheduler/--no-dag-scheduler",
+    default=False,
+    help="""Deploy each module as soon as the modules it references are deployed,
+    instead of waiting for all modules in earlier groups to complete""",
+    show_default=True,
+    type=bool,
+)
+@click.option(
+    "--verify-workers",
+    default=10,
+    help="The number of modules to verify (fetch, checksum and resolve parameters) concurrently",
+    show_default=True,
+    type=int,
+)
+@click.option(
+    "--hash-cache/--no-hash-cache",
+    default=True,
+    help="Reuse file hashes cached in .seedfarmer.out for files that have not changed since the last run",
+    show_default=True,
+    type=bool,
+)
+@click.option(
+    "--live/--no-live",
+    default=False,
+    help="Show a live table of the remote builds in progress with their phase, elapsed time and last log line",
+    show_default=True,
+    type=bool,
+)
+@click.option(
+    "--follow",
+    "follow_modules",
+    default=[],
+    help="""Print the build log lines of a module (<group_name>-<module_name>) above the --live table.
+    Multiple modules can be followed by repeating this flag""",
+    multiple=True,
+    required=False,
+)
+@click.option(
+    "--on-failure",
+    default="continue",
+    help="""What happens to the other modules of a group once one fails: stop their builds (stop),
+    let the started ones finish (drain) or let all of them finish (continue)""",
+    show_default=True,
+    type=click.Choice(["stop", "drain", "continue"]),
+)
+@click.option(
+    "--resume/--no-resume",
+    default=False,
+    help="""Resume the last apply of the manifest if it was interrupted or failed: re-attach to the builds
+    still running and skip the modules it deployed, as recorded in .seedfarmer.out/journal""",
+    show_default=True,
+    type=bool,
+)
 @safe_execute("Deployment Apply")
 def apply(
     spec: str,
@@ -163,6 +218,13 @@ def apply(
     update_project_policy: bool,
     local: bool,
     enable_self_access_logs: bool,
+    dag_scheduler: bool,
+    verify_workers: int,
+    hash_cache: bool,
+    live: bool,
+    follow_modules: List[str],
+    on_failure: str,
+    resume: bool,
 ) -> None:
     """Apply manifests to a SeedFarmer managed deployment"""
     if debug:
@@ -189,6 +251,13 @@ def apply(
         update_project_policy=update_project_policy,
         local=local,
         enable_self_access_logs=enable_self_access_logs,
+        dag_scheduler=dag_scheduler,
+        verify_workers=verify_workers,
+        use_hash_cache=hash_cache,
+        live_view=live,
+        follow_modules=follow_modules,
+        on_failure=on_failure,
+        resume=resume,
     )
 
 
@@ -256,7 +325,8 @@ def apply(
 @click.option(
     "--enable-session-timeout/--disable-session-timeout",
     default=False,
-    help="Enable boto3 Session timeouts. If enabled, boto3 Sessions will be reset on the timeout interval",
+    help="Enable boto3 Session timeouts. If enabled, boto3 Sessions will be reset on the timeout interval "
+    "(not needed for long deployments, role credentials are refreshed before they expire)",
     show_default=True,
     type=bool,
 )
@@ -284,6 +354,30 @@ def apply(
     show_default=True,
     type=bool,
 )
+@click.option(
+    "--live/--no-live",
+    default=False,
+    help="Show a live table of the remote builds in progress with their phase, elapsed time and last log line",
+    show_default=True,
+    type=bool,
+)
+@click.option(
+    "--follow",
+    "follow_modules",
+    default=[],
+    help="""Print the build log lines of a module (<group_name>-<module_name>) above the --live table.
+    Multiple modules can be followed by repeating this flag""",
+    multiple=True,
+    required=False,
+)
+@click.option(
+    "--on-failure",
+    default="continue",
+    help="""What happens to the other modules of a group once one fails: stop their builds (stop),
+    let the started ones finish (drain) or let all of them finish (continue)""",
+    show_default=True,
+    type=click.Choice(["stop", "drain", "continue"]),
+)
 @safe_execute("Deployment Destroy")
 def destroy(
     deployment: str,
@@ -299,6 +393,9 @@ def destroy(
     session_timeout_interval: int,
     remove_seedkit: bool,
     local: bool,
+    live: bool,
+    follow_modules: List[str],
+    on_failure: str,
 ) -> None:
     """Destroy a SeedFarmer managed deployment"""
     if debug:
@@ -327,6 +424,9 @@ def destroy(
         session_timeout_interval=session_timeout_interval,
         remove_seedkit=remove_seedkit,
         local=local,
+        live_view=live,
+        follow_modules=follow_modules,
+        on_failure=on_failure,
     )
 
 
@@ -13,19 +13,118 @@
 #    limitations under the License.
 
 
+import concurrent.futures
 import hashlib
+import json
+import logging
+import mmap
 import os
+import re
+import tempfile
+import threading
+import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Pattern, Protocol, Set, Tuple, Union, cast
 
-from gitignore_parser import parse_gitignore
+import git
+from gitignore_parser import parse_gitignore, rule_from_pattern
 
+from seedfarmer.errors import InvalidConfigurationError
 from seedfarmer.models.manifests._module_manifest import DataFile
 
+_logger: logging.Logger = logging.getLogger(__name__)
 
-def _evaluate_gitignore(project_path: str, module_path: str) -> Dict[str, Any]:
+DIGEST_ALGORITHM_MD5 = "md5"
+DIGEST_ALGORITHM_BLAKE2B = "blake2b"
+DIGEST_ALGORITHM_XXH3 = "xxh3"
+DIGEST_ALGORITHMS = [DIGEST_ALGORITHM_MD5, DIGEST_ALGORITHM_BLAKE2B, DIGEST_ALGORITHM_XXH3]
+
+CHECKSUM_MODE_CONTENT = "content"
+CHECKSUM_MODE_GIT_INDEX = "git-index"
+CHECKSUM_MODES = [CHECKSUM_MODE_CONTENT, CHECKSUM_MODE_GIT_INDEX]
+# Digests produced in git-index mode are tagged (and versioned) so they never compare equal to content digests
+GIT_INDEX_DIGEST_PREFIX = "git-index-v1:"
+
+HASH_CACHE_VERSION = 2
+HASH_CACHE_FILE = os.path.join(".seedfarmer.out", "hash-cache.json")
+# Files modified this recently are not cached, as a later change within the filesystem timestamp
+# granularity would leave the stat signature unchanged
+_RACY_WINDOW_NS = 2_000_000_000
+# Files at least this large are hashed from a memory map rather than chunked reads
+_MMAP_THRESHOLD = 4 * 1024 * 1024
+
+
+class _Hasher(Protocol):
+    def update(self, data: Union[bytes, mmap.mmap], /) -> None: ...
+
+    def hexdigest(self) -> str: ...
+
+
+def _new_hasher(algorithm: str) -> _Hasher:
+    if algorithm == DIGEST_ALGORITHM_MD5:
+        return hashlib.md5(usedforsecurity=False)
+    elif algorithm == DIGEST_ALGORITHM_BLAKE2B:
+        return hashlib.blake2b(digest_size=32)
+    elif algorithm == DIGEST_ALGORITHM_XXH3:
+        try:
+            import xxhash
+        except ImportError:
+            raise InvalidConfigurationError(
+                "The xxh3 checksum algorithm requires the xxhash package, "
+                "install it with: pip install seed-farmer[xxhash]"
+            )
+        return cast(_Hasher, xxhash.xxh3_128())
+    raise InvalidConfigurationError(f"Unsupported checksum algorithm {algorithm}, must be one of {DIGEST_ALGORITHMS}")
+
+
+def _tag_digest(hexdigest: str, algorithm: str) -> str:
+    # md5 digests are untagged so values persisted before algorithms were configurable remain valid
+    return hexdigest if algorithm == DIGEST_ALGORITHM_MD5 else f"{algorithm}:{hexdigest}"
+
+
+def get_digest_algorithm(digest: str) -> str:
+    """
+    Get the algorithm a digest was generated with
+
+    Parameters
+    ----------
+    digest : str
+        A digest returned by get_module_md5 or get_digest
+
+    Returns
+    -------
+    str
+        One of DIGEST_ALGORITHMS
+    """
+    if digest.startswith(GIT_INDEX_DIGEST_PREFIX):
+        digest = digest[len(GIT_INDEX_DIGEST_PREFIX) :]
+    return digest.split(":", 1)[0] if ":" in digest else DIGEST_ALGORITHM_MD5
+
+
+def get_digest(data: bytes, algorithm: str = DIGEST_ALGORITHM_MD5) -> str:
+    """
+    Generate the tagged digest of data, used for the manifest and deployspec of a module
+
+    Parameters
+    ----------
+    data : bytes
+        The data to hash
+    algorithm : str, optional
+        One of DIGEST_ALGORITHMS
+        By default DIGEST_ALGORITHM_MD5
+
+    Returns
+    -------
+    str
+        The hex digest, prefixed with the algorithm unless it is md5
+    """
+    hash = _new_hasher(algorithm)
+    hash.update(data)
+    return _tag_digest(hash.hexdigest(), algorithm)
+
+
+def _get_gitignore_paths(project_path: str, module_path: str) -> List[str]:
     ignore_paths: List[str] = []
-    ignore_maps: Dict[str, Any] = {}
 
     def _get_paths(working_dir: str) -> None:
         gitignore_path = os.path.join(working_dir, ".gitignore")
@@ -33,8 +132,15 @@ def _evaluate_gitignore(project_path: str, module_path: str) -> Dict[str, Any]:
         if os.path.realpath(working_dir) != os.path.realpath(project_path):
             _get_paths(str(Path(os.path.join(working_dir, os.pardir)).resolve()))
 
-    # If the .gitignore path exists, parse_gitignore returns a function that is callable
     _get_paths(os.path.join(project_path, module_path))
+    return ignore_paths
+
+
+def _evaluate_gitignore(project_path: str, module_path: str) -> Dict[str, Any]:
+    ignore_maps: Dict[str, Any] = {}
+    ignore_paths = _get_gitignore_paths(project_path=project_path, module_path=module_path)
+
+    # If the .gitignore path exists, parse_gitignore returns a function that is callable
     for ignore_path in ignore_paths:
         if os.path.exists(ignore_path):
             ignore_maps[ignore_path] = parse_gitignore(ignore_path)
@@ -58,14 +164,83 @@ def _evaluate_file(filename: str, ignore_maps: Dict[str, Any]) -> bool:
     return False
 
 
-def _generate_file_hash(filepath: str) -> str:
-    hash = hashlib.md5(usedforsecurity=False)
+class _GitignoreMatcher:
+    """
+    All .gitignore layers from the module up to the project root compiled into a single matcher.
+
+    A path is ignored if any layer ignores it.  Layers without negation rules are compiled into one
+    regex, layers with negation rules keep their ordered rules where the last match wins.
+    """
+
+    def __init__(self, gitignore_paths: List[str]) -> None:
+        self._layers: List[Tuple[str, Optional[Pattern[str]], List[Tuple[Pattern[str], bool]]]] = []
+        for gitignore_path in gitignore_paths:
+            base_dir = os.path.dirname(os.path.abspath(gitignore_path))
+            with open(gitignore_path, encoding="utf-8") as gitignore_file:
+                rules = [
+                    rule
+                    for rule in (rule_from_pattern(line.rstrip("\n"), base_path=base_dir) for line in gitignore_file)
+                    if rule
+                ]
+            if not rules:
+                continue
+            if any(rule.negation for rule in rules):
+                ordered = [(re.compile(rule.regex), bool(rule.negation)) for rule in reversed(rules)]
+                self._layers.append((base_dir, None, ordered))
+            else:
+                combined = re.compile("|".join(f"(?:{rule.regex})" for rule in rules))
+                self._layers.append((base_dir, combined, []))
+
+    def __call__(self, path: str) -> bool:
+        for base_dir, combined, ordered in self._layers:
+            rel_path = (
+                path[len(base_dir) + 1 :] if path.startswith(base_dir + os.sep) else os.path.relpath(path, base_dir)
+            )
+            if combined is not None:
+                if combined.search(rel_path):
+                    return True
+            else:
+                for regex, negation in ordered:
+                    if regex.search(rel_path):
+                        if not negation:
+                            return True
+                        break
+        return False
+
+
+def _walk_module_files(root: str, excluded_files: Set[str], is_ignored: Callable[[str], bool]) -> List[str]:
+    # A single scandir pass per directory, ignored and hidden directories are pruned before descending
+    all_files: List[str] = []
+    pending = [os.path.abspath(root)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if entry.name not in excluded_files and not is_ignored(entry.path):
+                        all_files.append(entry.path)
+                elif entry.is_dir():
+                    if not entry.name.startswith(".") and not is_ignored(entry.path):
+                        pending.append(entry.path)
+    return all_files
+
+
+def _generate_file_hash(filepath: str, algorithm: str = DIGEST_ALGORITHM_MD5) -> str:
+    hash = _new_hasher(algorithm)
     blocksize = 64 * 1024
 
     if not os.path.exists(filepath):
         return hash.hexdigest()
 
     with open(filepath, "rb") as fp:
+        if os.fstat(fp.fileno()).st_size >= _MMAP_THRESHOLD:
+            try:
+                with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hash.update(mapped)
+                return hash.hexdigest()
+            except (OSError, ValueError):
+                # Not mappable (special or changing file), fall back to chunked reads
+                hash = _new_hasher(algorithm)
+                fp.seek(0)
         while True:
             data = fp.read(blocksize)
             if not data:
@@ -75,10 +250,212 @@ def _generate_file_hash(filepath: str) -> str:
     return digest
 
 
-def _consolidate_hash(hashlist: List[str]) -> str:
-    hash = hashlib.md5(
-        usedforsecurity=False,
-    )
+def get_file_digest(filepath: str, algorithm: str = DIGEST_ALGORITHM_MD5) -> str:
+    """
+    Generate the tagged digest of a file's content
+
+    Parameters
+    ----------
+    filepath : str
+        The file to hash
+    algorithm : str, optional
+        One of DIGEST_ALGORITHMS
+        By default DIGEST_ALGORITHM_MD5
+
+    Returns
+    -------
+    str
+        The hex digest, prefixed with the algorithm unless it is md5
+    """
+    return _tag_digest(_generate_file_hash(filepath, algorithm), algorithm)
+
+
+def get_file_digests(
+    filepaths: List[str], algorithm: str = DIGEST_ALGORITHM_MD5, project_path: Optional[str] = None
+) -> List[str]:
+    """
+    Generate the tagged digest of several files' content, reusing the hashes in the persistent hash cache
+
+    Parameters
+    ----------
+    filepaths : List[str]
+        The files to hash
+    algorithm : str, optional
+        One of DIGEST_ALGORITHMS
+        By default DIGEST_ALGORITHM_MD5
+    project_path : Optional[str], optional
+        The project whose .seedfarmer.out holds the hash cache, the current directory by default
+
+    Returns
+    -------
+    List[str]
+        The hex digest of each file, prefixed with the algorithm unless it is md5
+    """
+    hash_cache = _get_hash_cache(project_path if project_path else os.getcwd())
+    digests = [
+        _tag_digest(
+            hash_cache.get_file_hash(
+                filepath, file_hash=lambda path: _generate_file_hash(path, algorithm), kind=algorithm
+            ),
+            algorithm,
+        )
+        for filepath in filepaths
+    ]
+    hash_cache.save()
+    return digests
+
+
+def _generate_git_blob_hash(filepath: str) -> str:
+    # The object id git computes for a file's content, sha1 over the header "blob <size>\0" and the content
+    hash = hashlib.sha1(usedforsecurity=False)
+    blocksize = 64 * 1024
+
+    if not os.path.exists(filepath):
+        hash.update(b"blob 0\0")
+        return hash.hexdigest()
+
+    with open(filepath, "rb") as fp:
+        hash.update(f"blob {os.fstat(fp.fileno()).st_size}\0".encode("utf-8"))
+        while True:
+            data = fp.read(blocksize)
+            if not data:
+                break
+            hash.update(data)
+    return hash.hexdigest()
+
+
+def _get_git_index_hashes(module_dir: str) -> Dict[str, str]:
+    # Blob ids from the git index of the tracked files in module_dir that are unmodified in the
+    # working tree, keyed by path relative to module_dir
+    try:
+        repo = git.Repo(module_dir, search_parent_directories=True)
+    except (git.InvalidGitRepositoryError, git.NoSuchPathError):
+        _logger.debug("%s is not in a git repo, hashing all files", module_dir)
+        return {}
+    if repo.working_tree_dir is None:
+        return {}
+
+    repo_root = os.path.realpath(repo.working_tree_dir)
+    module_real_path = os.path.realpath(module_dir)
+    try:
+        staged = repo.git.ls_files("-s", "-z", "--", module_real_path)
+        modified = set(repo.git.ls_files("-m", "-z", "--", module_real_path).split("\0"))
+    except git.GitCommandError as ge:
+        _logger.debug("Unable to read the git index for %s, hashing all files: %s", module_dir, ge)
+        return {}
+
+    index_hashes: Dict[str, str] = {}
+    for entry in staged.split("\0"):
+        if not entry:
+            continue
+        meta, path = entry.split("\t", 1)
+        mode, blob_id, stage = meta.split(" ")
+        # Skip conflicted entries, symlinks and submodules, those are read from the working tree
+        if stage != "0" or mode in ("120000", "160000") or path in modified:
+            continue
+        index_hashes[os.path.relpath(os.path.join(repo_root, path), module_real_path)] = blob_id
+    return index_hashes
+
+
+def get_digest_mode(digest: str) -> str:
+    """
+    Get the checksum mode a module digest was generated with
+
+    Parameters
+    ----------
+    digest : str
+        The digest returned by get_module_md5
+
+    Returns
+    -------
+    str
+        One of CHECKSUM_MODES
+    """
+    return CHECKSUM_MODE_GIT_INDEX if digest.startswith(GIT_INDEX_DIGEST_PREFIX) else CHECKSUM_MODE_CONTENT
+
+
+class _FileHashCache:
+    """
+    A persistent cache of file hashes keyed by absolute path, only valid while the file's
+    (size, mtime_ns, inode) stat signature is unchanged.  Each entry holds a digest per hash kind.
+    """
+
+    def __init__(self, cache_path: str) -> None:
+        self.cache_path = cache_path
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._entries: Dict[str, List[Any]] = {}
+        try:
+            with open(cache_path, encoding="utf-8") as cache_file:
+                cache = json.load(cache_file)
+            if cache.get("version") == HASH_CACHE_VERSION and isinstance(cache.get("entries"), dict):
+                self._entries = cache["entries"]
+            else:
+                _logger.debug("Discarding hash cache at %s, version mismatch", cache_path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            _logger.debug("Discarding unreadable hash cache at %s: %s", cache_path, e)
+
+    def get_file_hash(self, filepath: str, file_hash: Optional[Callable[[str], str]] = None, kind: str = "md5") -> str:
+        file_hash = file_hash if file_hash else _generate_file_hash
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return file_hash(filepath)
+        key = os.path.abspath(filepath)
+        signature = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry and entry[:3] == signature and kind in entry[3]:
+            return str(entry[3][kind])
+
+        digest = file_hash(filepath)
+        try:
+            after = os.stat(filepath)
+        except OSError:
+            return digest
+        # Only cache if the file did not change while hashing and is not racily new
+        if [after.st_size, after.st_mtime_ns, after.st_ino] == signature and (
+            time.time_ns() - stat.st_mtime_ns > _RACY_WINDOW_NS
+        ):
+            with self._lock:
+                entry = self._entries.get(key)
+                digests = entry[3] if entry and entry[:3] == signature else {}
+                self._entries[key] = signature + [{**digests, kind: digest}]
+                self._dirty = True
+        return digest
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            self._entries = {path: entry for path, entry in self._entries.items() if os.path.exists(path)}
+            try:
+                os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.cache_path), suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                    json.dump({"version": HASH_CACHE_VERSION, "entries": self._entries}, tmp_file)
+                os.replace(tmp_path, self.cache_path)
+                self._dirty = False
+            except OSError as e:
+                _logger.debug("Unable to write hash cache at %s: %s", self.cache_path, e)
+
+
+_hash_caches: Dict[str, _FileHashCache] = {}
+_hash_caches_lock = threading.Lock()
+
+
+def _get_hash_cache(project_path: str) -> _FileHashCache:
+    cache_path = os.path.abspath(os.path.join(project_path, HASH_CACHE_FILE))
+    with _hash_caches_lock:
+        if cache_path not in _hash_caches:
+            _hash_caches[cache_path] = _FileHashCache(cache_path)
+        return _hash_caches[cache_path]
+
+
+def _consolidate_hash(hashlist: List[str], algorithm: str = DIGEST_ALGORITHM_MD5) -> str:
+    hash = _new_hasher(algorithm)
     for hashvalue in sorted(hashlist):
         hash.update(hashvalue.encode("utf-8"))
     return hash.hexdigest()
@@ -89,6 +466,10 @@ def get_module_md5(
     module_path: str,
     data_files: Optional[List[DataFile]] = None,
     excluded_files: Optional[List[str]] = [],
+    use_hash_cache: bool = False,
+    hash_workers: int = 1,
+    checksum_mode: str = CHECKSUM_MODE_CONTENT,
+    algorithm: str = DIGEST_ALGORITHM_MD5,
 ) -> str:
     """
     This will generate an MD5 of the module source code, respecting .gitingore starting at
@@ -106,36 +487,34 @@ def get_module_md5(
         A list of additional files not in .gitignore that will be exclude from the bundle md5
             NOTE: this list of files is ONLY at the module level, not subdirecties of
             the module...use .gitignore for that
+    use_hash_cache : bool, optional
+        Reuse file hashes persisted under the project's .seedfarmer.out for files whose
+        size, mtime and inode are unchanged.  The resulting md5 is identical either way.
+        By default False
+    hash_workers : int, optional
+        The number of threads used to hash file contents
+        By default 1
+    checksum_mode : str, optional
+        CHECKSUM_MODE_CONTENT hashes the content of every file.  CHECKSUM_MODE_GIT_INDEX takes the blob id
+        of clean tracked files from the git index and only reads modified or untracked files, the returned
+        digest is prefixed with GIT_INDEX_DIGEST_PREFIX
+        By default CHECKSUM_MODE_CONTENT
+    algorithm : str, optional
+        One of DIGEST_ALGORITHMS, any algorithm other than md5 is recorded as a prefix of the digest
+        By default DIGEST_ALGORITHM_MD5
 
     Returns
     -------
     str
         the md5 of the module code
     """
-    ignore_maps = _evaluate_gitignore(project_path=project_path, module_path=module_path)
-
-    excluded_files = [] if excluded_files is None else excluded_files
-
-    all_files = []
-
-    def scandir(dirname: str) -> List[str]:
-        files = [
-            f.path
-            for f in os.scandir(dirname)
-            if f.is_file() and os.path.split(f)[1] not in excluded_files and not _evaluate_file(f.path, ignore_maps)
-        ]
-        all_files.extend(files)
-        subfolders = [f.path for f in os.scandir(dirname) if f.is_dir()]
-        for dirname in list(subfolders):
-            # ignore all hidden directories and any dir already in .gitignore
-            (
-                subfolders.extend(scandir(dirname))
-                if not os.path.split(dirname)[1].startswith(".") and not _evaluate_file(dirname, ignore_maps)
-                else None
-            )
-        return subfolders
+    is_ignored = _GitignoreMatcher(_get_gitignore_paths(project_path=project_path, module_path=module_path))
 
-    _ = scandir(os.path.join(project_path, module_path))
+    all_files = _walk_module_files(
+        root=os.path.join(project_path, module_path),
+        excluded_files=set(excluded_files) if excluded_files else set(),
+        is_ignored=is_ignored,
+    )
 
     # Add in the extra files
     if data_files is not None:
@@ -146,7 +525,41 @@ def get_module_md5(
                 else None
             )
 
+    hash_cache = _get_hash_cache(project_path) if use_hash_cache else None
+
+    def _content_file_hash(filepath: str) -> str:
+        if hash_cache:
+            return hash_cache.get_file_hash(
+                filepath, file_hash=lambda path: _generate_file_hash(path, algorithm), kind=algorithm
+            )
+        return _generate_file_hash(filepath, algorithm)
+
+    file_hash: Callable[[str], str] = _content_file_hash
+    if checksum_mode == CHECKSUM_MODE_GIT_INDEX:
+        module_dir = os.path.abspath(os.path.join(project_path, module_path))
+        index_hashes = _get_git_index_hashes(module_dir)
+
+        def _git_file_hash(filepath: str) -> str:
+            blob_id = index_hashes.get(os.path.relpath(filepath, module_dir))
+            if blob_id:
+                return blob_id
+            if hash_cache:
+                return hash_cache.get_file_hash(filepath, file_hash=_generate_git_blob_hash, kind="git-blob")
+            return _generate_git_blob_hash(filepath)
+
+        file_hash = _git_file_hash
+
     hashvalues: List[str] = []
-    for viable_file in all_files:
-        hashvalues.append(_generate_file_hash(viable_file))
-    return _consolidate_hash(hashvalues)
+    if hash_workers > 1 and len(all_files) > 1:
+        # hashlib releases the GIL while digesting, so file contents hash in parallel
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(hash_workers, len(all_files)), thread_name_prefix="Checksum"
+        ) as workers:
+            hashvalues = list(workers.map(file_hash, all_files))
+    else:
+        hashvalues = [file_hash(viable_file) for viable_file in all_files]
+
+    if hash_cache:
+        hash_cache.save()
+    digest = _tag_digest(_consolidate_hash(hashvalues, algorithm), algorithm)
+    return f"{GIT_INDEX_DIGEST_PREFIX}{digest}" if checksum_mode == CHECKSUM_MODE_GIT_INDEX else digest
@@ -13,6 +13,7 @@
 #    limitations under the License.
 
 import logging
+import os
 import sys
 from typing import Optional
 
@@ -79,6 +80,19 @@ def bundle() -> None:
     help="Full path of the bundle object in SeedKit bucket",
     required=True,
 )
+@click.option(
+    "--file",
+    "bundle_file",
+    default=None,
+    help="Local bundle to store instead of copying the origin, the origin is copied if the file does not exist",
+    required=False,
+)
+@click.option(
+    "--manifest",
+    default=None,
+    help="Local bundle manifest to store with the bundle",
+    required=False,
+)
 @click.option(
     "--region",
     default=None,
@@ -86,7 +100,14 @@ def bundle() -> None:
     required=False,
 )
 def store_bundle(
-    deployment: str, group: str, module: str, bucket: str, origin: str, region: Optional[str] = None
+    deployment: str,
+    group: str,
+    module: str,
+    bucket: str,
+    origin: str,
+    bundle_file: Optional[str] = None,
+    manifest: Optional[str] = None,
+    region: Optional[str] = None,
 ) -> None:
     _load_project()
     print(f"{deployment} - {group} - {module} -{bucket} - {origin}")
@@ -97,9 +118,26 @@ def store_bundle(
         .get_deployment_session(account_id="000000000000", region_name=str(region))
     )
 
-    bundle_support.copy_bundle_to_sf(
-        deployment=deployment, group=group, module=module, bucket=bucket, bundle_src_path=origin, session=session
-    )
+    if bundle_file and os.path.isfile(bundle_file):
+        bundle_support.store_bundle_in_sf(
+            deployment=deployment,
+            group=group,
+            module=module,
+            bucket=bucket,
+            bundle_file=bundle_file,
+            manifest_file=manifest,
+            session=session,
+        )
+    else:
+        bundle_support.copy_bundle_to_sf(
+            deployment=deployment,
+            group=group,
+            module=module,
+            bucket=bucket,
+            bundle_src_path=origin,
+            session=session,
+            manifest_file=manifest,
+        )
 
 
 @bundle.command(
@@ -13,12 +13,11 @@
 #    limitations under the License.
 
 import concurrent.futures
-import hashlib
 import json
 import logging
 import os
 import threading
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 import yaml
 
@@ -28,13 +27,16 @@ import seedfarmer.messages as messages
 import seedfarmer.mgmt.archive_support as sf_archive
 import seedfarmer.mgmt.deploy_utils as du
 import seedfarmer.mgmt.git_support as sf_git
+import seedfarmer.mgmt.journal as journal
 from seedfarmer import commands, config
 from seedfarmer.commands._parameter_commands import load_parameter_values, resolve_params_for_checksum
 from seedfarmer.commands._stack_commands import create_module_deployment_role, destroy_module_deployment_role
 from seedfarmer.deployment.deploy_factory import DeployModuleFactory
+from seedfarmer.deployment.deploy_remote import DeployRemoteModule
 from seedfarmer.error_handler import log_error_safely, safe_execute
 from seedfarmer.input_validators import InputValidator
 from seedfarmer.mgmt.module_info import (
+    ModuleConst,
     get_deployspec_path,
     get_module_metadata,
     get_modulestack_path,
@@ -54,14 +56,30 @@ from seedfarmer.output_utils import (
     print_manifest_inventory,
     print_manifest_json,
     print_modules_build_info,
+    show_build_progress,
+)
+from seedfarmer.services import get_client_cache_stats, get_sts_identity_info
+from seedfarmer.services._governor import (
+    GOVERNOR_CLOUDFORMATION,
+    GOVERNOR_CODEBUILD,
+    configure_governor,
+    discover_codebuild_concurrency,
+    get_governor_stats,
+    governed,
+    reset_governor,
 )
-from seedfarmer.services import get_sts_identity_info
 from seedfarmer.services._iam import get_role, get_role_arn
-from seedfarmer.services.session_manager import SessionManager, bind_session_mgr
+from seedfarmer.services.session_manager import ISessionManager, SessionManager, bind_session_mgr
 from seedfarmer.utils import get_generic_module_deployment_role_name
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+# What happens to the other modules being deployed or destroyed once one of them fails
+ON_FAILURE_STOP = "stop"  # stop their builds and skip the modules not started yet
+ON_FAILURE_DRAIN = "drain"  # let the started modules finish, skip the modules not started yet
+ON_FAILURE_CONTINUE = "continue"  # let every module of the group finish
+ON_FAILURE_POLICIES = [ON_FAILURE_STOP, ON_FAILURE_DRAIN, ON_FAILURE_CONTINUE]
+
 
 def _process_git_module_path(module: ModuleManifest) -> None:
     working_dir, module_directory, commit_hash = sf_git.clone_module_repo(module.path)
@@ -196,18 +214,19 @@ def _execute_deploy(
     role_prefix = mdo.deployment_manifest.get_account_region_role_prefix(account_id=account_id, region=region)
 
     if module_stack_path:
-        _, module_role_name = commands.deploy_module_stack(
-            module_stack_path=module_stack_path,
-            deployment_name=cast(str, mdo.deployment_manifest.name),
-            group_name=str(mdo.group_name),
-            module_name=str(mdo.module_name),
-            account_id=account_id,
-            region=region,
-            parameters=mdo.parameters,
-            docker_credentials_secret=mdo.docker_credentials_secret,
-            permissions_boundary_arn=mdo.permissions_boundary_arn,
-            role_prefix=role_prefix,
-        )
+        with governed(account_id=account_id, region=region, service=GOVERNOR_CLOUDFORMATION):
+            _, module_role_name = commands.deploy_module_stack(
+                module_stack_path=module_stack_path,
+                deployment_name=cast(str, mdo.deployment_manifest.name),
+                group_name=str(mdo.group_name),
+                module_name=str(mdo.module_name),
+                account_id=account_id,
+                region=region,
+                parameters=mdo.parameters,
+                docker_credentials_secret=mdo.docker_credentials_secret,
+                permissions_boundary_arn=mdo.permissions_boundary_arn,
+                role_prefix=role_prefix,
+            )
 
     # Get the current module's SSM if it was already loaded...
     session = SessionManager().get_or_create().get_deployment_session(account_id=account_id, region_name=region)
@@ -310,23 +329,207 @@ def _execute_destroy(mdo: ModuleDeployObject) -> Optional[ModuleDeploymentRespon
     resp = DeployModuleFactory().create(mdo).destroy_module()
 
     if resp.status == StatusType.SUCCESS.value and module_stack_exists:
-        commands.destroy_module_stack(
-            cast(str, mdo.deployment_manifest.name),
-            str(mdo.group_name),
-            str(mdo.module_name),
-            account_id=target_account_id,
-            region=target_region,
-            docker_credentials_secret=mdo.docker_credentials_secret,
-        )
+        with governed(account_id=target_account_id, region=target_region, service=GOVERNOR_CLOUDFORMATION):
+            commands.destroy_module_stack(
+                cast(str, mdo.deployment_manifest.name),
+                str(mdo.group_name),
+                str(mdo.module_name),
+                account_id=target_account_id,
+                region=target_region,
+                docker_credentials_secret=mdo.docker_credentials_secret,
+            )
 
     return resp
 
 
+def _exec_deploy(mdo: ModuleDeployObject) -> ModuleDeploymentResponse:
+    threading.current_thread().name = (f"{threading.current_thread().name}-{mdo.group_name}_{mdo.module_name}").replace(
+        "_", "-"
+    )
+    response = _execute_deploy(mdo)
+    execution_journal = journal.get_execution_journal()
+    if execution_journal:
+        module = mdo.deployment_manifest.get_module(str(mdo.group_name), str(mdo.module_name))
+        execution_journal.module_completed(
+            module=f"{mdo.group_name}-{mdo.module_name}",
+            status=response.status,
+            build_id=response.codebuild_metadata.codebuild_build_id if response.codebuild_metadata else None,
+            bundle_md5=module.bundle_md5 if module else None,
+        )
+    return response
+
+
+def _failed(response: Optional[ModuleDeploymentResponse]) -> bool:
+    return response is not None and response.status in ["ERROR", "error", "Error", StatusType.CANCELLED.value]
+
+
+def _cancelled_response(mdo: ModuleDeployObject) -> ModuleDeploymentResponse:
+    return ModuleDeploymentResponse(
+        deployment=str(mdo.deployment_manifest.name),
+        group=mdo.group_name,
+        module=str(mdo.module_name),
+        status=StatusType.CANCELLED.value,
+    )
+
+
+def _execute_modules(
+    execute: Callable[[ModuleDeployObject], Optional[ModuleDeploymentResponse]],
+    mdos: List[ModuleDeployObject],
+    max_workers: int,
+    thread_name_prefix: str,
+    cancel_event: threading.Event,
+    on_failure: str = ON_FAILURE_CONTINUE,
+) -> List[Optional[ModuleDeploymentResponse]]:
+    """Deploy or destroy the modules of a group concurrently, applying the on_failure policy once one fails
+
+    The responses are returned in the order of the modules, modules skipped or stopped because another one
+    failed have a CANCELLED status. ``cancel_event`` is the event the modules were created with, it is set to
+    stop their builds. The first exception raised by a module is raised once all modules are done.
+    """
+    skip_event = threading.Event()
+
+    def _fail(mdo: ModuleDeployObject) -> None:
+        if on_failure != ON_FAILURE_CONTINUE and not skip_event.is_set():
+            _logger.warning(
+                "Module %s-%s failed, %s the other modules",
+                mdo.group_name,
+                mdo.module_name,
+                "stopping" if on_failure == ON_FAILURE_STOP else "draining",
+            )
+            # Set by the failing thread itself, before its worker picks up the next queued module
+            skip_event.set()
+            if on_failure == ON_FAILURE_STOP:
+                cancel_event.set()
+
+    def _execute(mdo: ModuleDeployObject) -> Optional[ModuleDeploymentResponse]:
+        if skip_event.is_set():
+            return _cancelled_response(mdo)
+        try:
+            response = execute(mdo)
+        except Exception:
+            _fail(mdo)
+            raise
+        if _failed(response):
+            _fail(mdo)
+        return response
+
+    responses: List[Optional[ModuleDeploymentResponse]] = []
+    error: Optional[Exception] = None
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(max_workers, 1), thread_name_prefix=thread_name_prefix
+    ) as workers:
+        for future in [workers.submit(_execute, mdo) for mdo in mdos]:
+            try:
+                responses.append(future.result())
+            except Exception as e:
+                error = error if error else e
+                responses.append(None)
+    if error:
+        raise error
+    return responses
+
+
+def _deploy_module_dag(
+    deployment_manifest_wip: DeploymentManifest,
+    module_upstream_dep: Dict[str, List[str]],
+    on_failure: str = ON_FAILURE_CONTINUE,
+) -> List[ModuleDeploymentResponse]:
+    groups = [_group for _group in deployment_manifest_wip.groups if len(_group.modules) > 0]
+    module_dag = du.generate_module_dag(groups=groups, module_upstream_dep=module_upstream_dep)
+    _logger.debug("Module DAG for deploy: %s", json.dumps(module_dag))
+
+    group_limits = {_group.name: _group.concurrency if _group.concurrency else len(_group.modules) for _group in groups}
+    group_running = {_group.name: 0 for _group in groups}
+    deployable = [
+        (_group, _module) for _group in groups for _module in _group.modules if _module and _module.deploy_spec
+    ]
+    # Modules of every group may run at once, so the upload pool is shared by as many modules as can run together
+    upload_concurrency = min(len(deployable), sum(group_limits.values()))
+
+    cancel_event = threading.Event()
+    mdos: Dict[str, ModuleDeployObject] = {
+        f"{_group.name}-{_module.name}": ModuleDeployObject(
+            deployment_manifest=deployment_manifest_wip,
+            group_name=_group.name,
+            module_name=_module.name,
+            cancel_event=cancel_event,
+            upload_concurrency=upload_concurrency,
+        )
+        for _group, _module in deployable
+    }
+    # Modules without a deployspec are never deployed, so nothing should wait on them
+    pending = {key: set(dep for dep in module_dag[key] if dep in mdos) for key in mdos}
+
+    deploy_response: List[ModuleDeploymentResponse] = []
+    failed = False
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max(len(mdos), 1), thread_name_prefix="Deploy") as workers:
+        in_flight: Dict[concurrent.futures.Future[ModuleDeploymentResponse], str] = {}
+
+        def _submit_ready() -> None:
+            for key in list(pending.keys()):
+                group_name = str(mdos[key].group_name)
+                if not pending[key] and group_running[group_name] < group_limits[group_name]:
+                    del pending[key]
+                    group_running[group_name] += 1
+                    _logger.debug("Starting %s", key)
+                    in_flight[workers.submit(_exec_deploy, mdos[key])] = key
+
+        _submit_ready()
+        while in_flight:
+            done, _ = concurrent.futures.wait(in_flight.keys(), return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                key = in_flight.pop(future)
+                group_running[str(mdos[key].group_name)] -= 1
+                try:
+                    dep_resp_object = future.result()
+                except Exception:
+                    if on_failure == ON_FAILURE_STOP:
+                        cancel_event.set()
+                    raise
+                deploy_response.append(dep_resp_object)
+                if _failed(dep_resp_object):
+                    failed = True
+                    if on_failure == ON_FAILURE_STOP:
+                        cancel_event.set()
+                else:
+                    for waiting_on in pending.values():
+                        waiting_on.discard(key)
+            # After a failure, `continue` keeps scheduling the modules not depending on the failed ones,
+            # `stop` and `drain` only let the in-flight ones finish (unless stopped)
+            if not failed or on_failure == ON_FAILURE_CONTINUE:
+                _submit_ready()
+    # Modules never started, because they depend on a failed module or scheduling stopped
+    deploy_response.extend(_cancelled_response(mdos[key]) for key in pending)
+    return deploy_response
+
+
+def _check_deploy_response(deploy_response: List[ModuleDeploymentResponse]) -> None:
+    _logger.debug(deploy_response)
+    (
+        print_modules_build_info("Build Info Debug Data", deploy_response)  # type: ignore
+        if _logger.isEnabledFor(logging.DEBUG)
+        else None
+    )
+    for dep_resp_object in deploy_response:
+        if _failed(dep_resp_object):
+            _logger.error("At least one module failed to deploy...exiting deployment")
+            print_errored_modules_build_info(
+                "These modules had errors deploying",
+                deploy_response,  # type: ignore
+            )
+            raise seedfarmer.errors.ModuleDeploymentError(
+                error_message="At least one module failed to deploy...exiting deployment"
+            )
+
+
 def _deploy_validated_deployment(
     deployment_manifest: DeploymentManifest,
     deployment_manifest_wip: DeploymentManifest,
     groups_to_deploy: List[ModulesManifest],
     dryrun: bool,
+    module_upstream_dep: Optional[Dict[str, List[str]]] = None,
+    dag_scheduler: bool = False,
+    on_failure: str = ON_FAILURE_CONTINUE,
 ) -> None:
     if groups_to_deploy:
         if dryrun:
@@ -349,44 +552,44 @@ def _deploy_validated_deployment(
             _logger.debug(
                 "DeploymentManifest for deploy after filter =  %s", json.dumps(deployment_manifest_wip.model_dump())
             )
-        for _group in deployment_manifest_wip.groups:
-            if len(_group.modules) > 0:
-                threads = _group.concurrency if _group.concurrency else len(_group.modules)
-                with concurrent.futures.ThreadPoolExecutor(max_workers=threads, thread_name_prefix="Deploy") as workers:
-
-                    def _exec_deploy(mdo: ModuleDeployObject) -> ModuleDeploymentResponse:
-                        threading.current_thread().name = (
-                            f"{threading.current_thread().name}-{mdo.group_name}_{mdo.module_name}"
-                        ).replace("_", "-")
-                        return _execute_deploy(mdo)
-
-                    mdos = []
-                    for _module in _group.modules:
-                        if _module and _module.deploy_spec:
-                            mdo = ModuleDeployObject(
-                                deployment_manifest=deployment_manifest_wip,
-                                group_name=_group.name,
-                                module_name=_module.name,
-                            )
-                            mdos.append(mdo)
-
-                    deploy_response = list(workers.map(_exec_deploy, mdos))
-                    _logger.debug(deploy_response)
-                    (
-                        print_modules_build_info("Build Info Debug Data", deploy_response)  # type: ignore
-                        if _logger.isEnabledFor(logging.DEBUG)
-                        else None
+        if dag_scheduler:
+            _check_deploy_response(
+                _deploy_module_dag(
+                    deployment_manifest_wip=deployment_manifest_wip,
+                    module_upstream_dep=module_upstream_dep if module_upstream_dep else {},
+                    on_failure=on_failure,
+                )
+            )
+        else:
+            for _group in deployment_manifest_wip.groups:
+                if len(_group.modules) > 0:
+                    threads = _group.concurrency if _group.concurrency else len(_group.modules)
+                    cancel_event = threading.Event()
+                    modules = [_module for _module in _group.modules if _module and _module.deploy_spec]
+                    mdos = [
+                        ModuleDeployObject(
+                            deployment_manifest=deployment_manifest_wip,
+                            group_name=_group.name,
+                            module_name=_module.name,
+                            cancel_event=cancel_event,
+                            upload_concurrency=min(len(modules), threads),
+                        )
+                        for _module in modules
+                    ]
+
+                    _check_deploy_response(
+                        cast(
+                            List[ModuleDeploymentResponse],
+                            _execute_modules(
+                                _exec_deploy,
+                                mdos,
+                                max_workers=threads,
+                                thread_name_prefix="Deploy",
+                                cancel_event=cancel_event,
+                                on_failure=on_failure,
+                            ),
+                        )
                     )
-                    for dep_resp_object in deploy_response:
-                        if dep_resp_object.status in ["ERROR", "error", "Error"]:
-                            _logger.error("At least one module failed to deploy...exiting deployment")
-                            print_errored_modules_build_info(
-                                "These modules had errors deploying",
-                                deploy_response,  # type: ignore
-                            )
-                            raise seedfarmer.errors.ModuleDeploymentError(
-                                error_message="At least one module failed to deploy...exiting deployment"
-                            )
 
         print_manifest_inventory(f"Modules Deployed: {deployment_manifest_wip.name}", deployment_manifest_wip, False)
     else:
@@ -396,13 +599,52 @@ def _deploy_validated_deployment(
         du.write_deployed_deployment_manifest(deployment_manifest=deployment_manifest)
 
 
+def _warm_up_sessions(session_manager: ISessionManager, deployment_manifest: DeploymentManifest) -> None:
+    # Assume every deployment role up front instead of serially on first use
+    latencies = session_manager.warm_up_deployment_sessions(
+        accounts_regions=[
+            (str(account_region["account_id"]), str(account_region["region"]))
+            for account_region in deployment_manifest.target_accounts_regions
+        ]
+    )
+    _logger.debug("Deployment session latencies: %s", json.dumps(latencies))
+
+
+def _configure_governor(session_manager: ISessionManager, deployment_manifest: DeploymentManifest) -> None:
+    reset_governor()
+    for account_region in deployment_manifest.target_accounts_regions:
+        account_id, region = str(account_region["account_id"]), str(account_region["region"])
+        limits = deployment_manifest.get_region_concurrency_limits(account_id=account_id, region=region)
+        if limits[GOVERNOR_CODEBUILD] is None and config.SERVICE_QUOTA_DISCOVERY:
+            limits[GOVERNOR_CODEBUILD] = discover_codebuild_concurrency(
+                session=session_manager.get_deployment_session(account_id=account_id, region_name=region)
+            )
+        for service, limit in limits.items():
+            configure_governor(account_id=account_id, region=region, service=service, concurrency=limit)
+
+
+def _report_governor_delays() -> None:
+    for key, stats in get_governor_stats().items():
+        if stats["delayed"]:
+            _logger.info(
+                "%s: %s of %s operations queued by the concurrency governor, %.1fs in total (max %.1fs)",
+                key,
+                stats["delayed"],
+                stats["acquired"],
+                stats["total_delay"],
+                stats["max_delay"],
+            )
+
+
 def prime_target_accounts(
     deployment_manifest: DeploymentManifest,
     update_seedkit: bool = False,
     update_project_policy: bool = False,
     enable_self_access_logs: bool = False,
+    primed_accounts: Optional[Dict[Tuple[str, str], Dict[str, Any]]] = None,
 ) -> None:
     _logger.info("Priming Accounts")
+    primed_accounts = primed_accounts if primed_accounts else {}
 
     with concurrent.futures.ThreadPoolExecutor(
         max_workers=len(deployment_manifest.target_accounts_regions), thread_name_prefix="Prime-Accounts"
@@ -427,6 +669,11 @@ def prime_target_accounts(
                 deployment_manifest=deployment_manifest,
             )
 
+            execution_journal = journal.get_execution_journal()
+            if execution_journal:
+                execution_journal.account_primed(
+                    account_id=target_account_id, region=target_region, seedkit_outputs=seedkit_stack_outputs
+                )
             return [target_account_id, target_region, seedkit_stack_outputs]
 
         params: dict[tuple[str, str], Any] = {}
@@ -476,7 +723,17 @@ def prime_target_accounts(
                     f"with different values."
                 )
 
-        output_seedkit = list(workers.map(_prime_accounts, params.values()))
+        # Accounts primed by the interrupted apply being resumed reuse the recorded seedkit outputs
+        output_seedkit: List[List[Any]] = [
+            [account_id, region, primed_accounts[(account_id, region)]]
+            for account_id, region in params.keys()
+            if (account_id, region) in primed_accounts
+        ]
+        for out_s in output_seedkit:
+            _logger.info("Account %s in %s already primed, skipping", out_s[0], out_s[1])
+        output_seedkit += list(
+            workers.map(_prime_accounts, [param_d for key, param_d in params.items() if key not in primed_accounts])
+        )
         # add these to the region mappings for reference
         for out_s in output_seedkit:
             deployment_manifest.populate_metadata(
@@ -533,6 +790,7 @@ def destroy_deployment(
     dryrun: bool = False,
     show_manifest: bool = False,
     remove_seedkit: bool = False,
+    on_failure: str = ON_FAILURE_CONTINUE,
 ) -> None:
     """
     destroy_deployment
@@ -561,6 +819,11 @@ def destroy_deployment(
         project use it!!  Use with caution!!
 
         By default False
+    on_failure: str, optional
+        What happens to the other modules of a group once one fails to destroy: `stop` stops their builds,
+        `drain` lets the started ones finish and `continue` lets all of them finish.
+
+        By default `continue`
     """
     if not destroy_manifest.groups:
         print_bolded("Nothing to destroy", "white")
@@ -576,55 +839,67 @@ def destroy_deployment(
         for _group in reversed(destroy_manifest.groups):
             if len(_group.modules) > 0:
                 threads = _group.concurrency if _group.concurrency else len(_group.modules)
-                with concurrent.futures.ThreadPoolExecutor(
-                    max_workers=threads, thread_name_prefix="Destroy"
-                ) as workers:
-
-                    def _exec_destroy(mdo: ModuleDeployObject) -> Optional[ModuleDeploymentResponse]:
-                        threading.current_thread().name = (
-                            f"{threading.current_thread().name}-{mdo.group_name}_{mdo.module_name}"
-                        ).replace("_", "-")
-                        return _execute_destroy(mdo)
-
-                    mdos = []
-                    for _module in _group.modules:
-                        if _module.path.startswith("git::"):
-                            _process_git_module_path(module=_module)
-                        elif _module.path.startswith("archive::"):
-                            _process_archive_path(
-                                module=_module,
-                                secret_name=destroy_manifest.archive_secret,
-                            )
-
-                        if _module.data_files is not None:
-                            _process_data_files(
-                                data_files=_module.data_files,
-                                module_name=_module.name,
-                                group_name=_group.name,
-                                secret_name=destroy_manifest.archive_secret,
-                            )
-
-                        if _module and _module.deploy_spec:
-                            mdo = ModuleDeployObject(
-                                deployment_manifest=destroy_manifest, group_name=_group.name, module_name=_module.name
-                            )
-                            mdos.append(mdo)
-                    destroy_response = list(workers.map(_exec_destroy, mdos))
-                    _logger.debug(destroy_response)
-                    (
-                        print_modules_build_info("Build Info Debug Data", destroy_response)
-                        if _logger.isEnabledFor(logging.DEBUG)
-                        else None
+                cancel_event = threading.Event()
+
+                def _exec_destroy(mdo: ModuleDeployObject) -> Optional[ModuleDeploymentResponse]:
+                    threading.current_thread().name = (
+                        f"{threading.current_thread().name}-{mdo.group_name}_{mdo.module_name}"
+                    ).replace("_", "-")
+                    return _execute_destroy(mdo)
+
+                modules = []
+                for _module in _group.modules:
+                    if _module.path.startswith("git::"):
+                        _process_git_module_path(module=_module)
+                    elif _module.path.startswith("archive::"):
+                        _process_archive_path(
+                            module=_module,
+                            secret_name=destroy_manifest.archive_secret,
+                        )
+
+                    if _module.data_files is not None:
+                        _process_data_files(
+                            data_files=_module.data_files,
+                            module_name=_module.name,
+                            group_name=_group.name,
+                            secret_name=destroy_manifest.archive_secret,
+                        )
+
+                    if _module and _module.deploy_spec:
+                        modules.append(_module)
+                mdos = [
+                    ModuleDeployObject(
+                        deployment_manifest=destroy_manifest,
+                        group_name=_group.name,
+                        module_name=_module.name,
+                        cancel_event=cancel_event,
+                        upload_concurrency=min(len(modules), threads),
                     )
-                    for dep_resp_object in destroy_response:
-                        if dep_resp_object and dep_resp_object.status in ["ERROR", "error", "Error"]:
-                            _logger.error("At least one module failed to destroy...exiting deployment")
-                            print_errored_modules_build_info(
-                                "The following modules had errors destroying ", destroy_response
-                            )
-                            raise seedfarmer.errors.ModuleDeploymentError(
-                                error_message="At least one module failed to destroy...exiting deployment"
-                            )
+                    for _module in modules
+                ]
+                destroy_response = _execute_modules(
+                    _exec_destroy,
+                    mdos,
+                    max_workers=threads,
+                    thread_name_prefix="Destroy",
+                    cancel_event=cancel_event,
+                    on_failure=on_failure,
+                )
+                _logger.debug(destroy_response)
+                (
+                    print_modules_build_info("Build Info Debug Data", destroy_response)
+                    if _logger.isEnabledFor(logging.DEBUG)
+                    else None
+                )
+                for dep_resp_object in destroy_response:
+                    if _failed(dep_resp_object):
+                        _logger.error("At least one module failed to destroy...exiting deployment")
+                        print_errored_modules_build_info(
+                            "The following modules had errors destroying ", destroy_response
+                        )
+                        raise seedfarmer.errors.ModuleDeploymentError(
+                            error_message="At least one module failed to destroy...exiting deployment"
+                        )
 
         print_manifest_inventory(f"Modules Destroyed: {deployment_name}", destroy_manifest, False, "red")
         if remove_deploy_manifest:
@@ -636,12 +911,159 @@ def destroy_deployment(
         print_manifest_json(destroy_manifest)
 
 
+_MD5_EXCLUDED_MODULE_FILES = [
+    "README.md",
+    "modulestack.template",
+    "setup.cfg",
+    "requirements-dev.txt",
+    "requirements-dev.in",
+    ".gitignore",
+]
+
+
+def _get_bundle_md5(module: ModuleManifest, use_hash_cache: bool = True, algorithm: Optional[str] = None) -> str:
+    return checksum.get_module_md5(
+        project_path=config.OPS_ROOT,
+        module_path=str(module.get_local_path()),
+        data_files=module.data_files,
+        excluded_files=_MD5_EXCLUDED_MODULE_FILES,
+        use_hash_cache=use_hash_cache,
+        hash_workers=config.CHECKSUM_WORKERS,
+        checksum_mode=config.CHECKSUM_MODE,
+        algorithm=algorithm if algorithm else config.CHECKSUM_ALGORITHM,
+    )
+
+
+def _get_manifest_md5(module: ModuleManifest, algorithm: Optional[str] = None, bundle_md5: Optional[str] = None) -> str:
+    manifest = module.model_dump()
+    if bundle_md5:
+        # Reproduce the manifest as it was when first hashed, before its own digests were set
+        manifest.update(bundle_md5=bundle_md5, manifest_md5=None, deployspec_md5=None)
+    return checksum.get_digest(
+        json.dumps(manifest, sort_keys=True).encode("utf-8"),
+        algorithm=algorithm if algorithm else config.CHECKSUM_ALGORITHM,
+    )
+
+
+def _get_deployspec_md5(module: ModuleManifest, algorithm: Optional[str] = None) -> str:
+    with open(get_deployspec_path(str(module.get_local_path())), "rb") as deployspec_file:
+        return checksum.get_digest(
+            deployspec_file.read(), algorithm=algorithm if algorithm else config.CHECKSUM_ALGORITHM
+        )
+
+
+def _verify_module(
+    deployment_manifest: DeploymentManifest,
+    deployment_manifest_wip: DeploymentManifest,
+    group_name: str,
+    module: ModuleManifest,
+    use_hash_cache: bool = True,
+) -> None:
+    _logger.debug("Working on -- %s", module)
+    if not module.path:
+        raise seedfarmer.errors.InvalidManifestError("Unable to parse module manifest, `path` not specified")
+
+    if module.path.startswith("git::"):
+        _process_git_module_path(module=module)
+    elif module.path.startswith("archive::"):
+        _process_archive_path(
+            module=module,
+            secret_name=deployment_manifest.archive_secret,
+        )
+
+    if module.data_files is not None:
+        _process_data_files(
+            data_files=module.data_files,
+            module_name=module.name,
+            group_name=group_name,
+            secret_name=deployment_manifest.archive_secret,
+        )
+
+    deployspec_path = get_deployspec_path(str(module.get_local_path()))
+    with open(deployspec_path, encoding="utf-8") as module_spec_file:
+        module.deploy_spec = DeploySpec(**yaml.safe_load(module_spec_file))
+
+    module.bundle_md5 = _get_bundle_md5(module=module, use_hash_cache=use_hash_cache)
+    resolve_params_for_checksum(deployment_manifest=deployment_manifest_wip, module=module, group_name=group_name)
+
+    module.manifest_md5 = _get_manifest_md5(module=module)
+    module.deployspec_md5 = _get_deployspec_md5(module=module)
+
+
+def _get_module_rehash(module: ModuleManifest, use_hash_cache: bool = True) -> Dict[ModuleConst, Callable[[str], str]]:
+    # Regenerates the digests of a module with a given algorithm, used when the deployed digests
+    # were generated with a different algorithm than the one currently configured
+    bundle_md5s: Dict[str, str] = {}
+
+    def _bundle_md5(algorithm: str) -> str:
+        if algorithm not in bundle_md5s:
+            bundle_md5s[algorithm] = _get_bundle_md5(module=module, use_hash_cache=use_hash_cache, algorithm=algorithm)
+        return bundle_md5s[algorithm]
+
+    return {
+        ModuleConst.BUNDLE: _bundle_md5,
+        ModuleConst.DEPLOYSPEC: lambda algorithm: _get_deployspec_md5(module=module, algorithm=algorithm),
+        ModuleConst.MANIFEST: lambda algorithm: _get_manifest_md5(
+            module=module, algorithm=algorithm, bundle_md5=_bundle_md5(algorithm)
+        ),
+    }
+
+
+def _reattach_builds(
+    deployment_manifest_wip: DeploymentManifest, running_builds: Dict[str, Dict[str, Any]]
+) -> Dict[str, Optional[str]]:
+    # Waits for the builds an interrupted apply left running, returning the modules they deployed
+    # with the bundle md5 they deployed them from
+    mdos: Dict[str, ModuleDeployObject] = {}
+    for group in deployment_manifest_wip.groups:
+        for module in group.modules:
+            if f"{group.name}-{module.name}" in running_builds:
+                mdos[f"{group.name}-{module.name}"] = ModuleDeployObject(
+                    deployment_manifest=deployment_manifest_wip, group_name=group.name, module_name=module.name
+                )
+    if not mdos or DeployModuleFactory.is_local():
+        return {}
+
+    def _reattach(key: str) -> Optional[ModuleDeploymentResponse]:
+        build = running_builds[key]
+        response = DeployRemoteModule(mdos[key]).reattach_build(
+            build_id=build["build_id"], stream_name_prefix=build["stream_name_prefix"], log_file=build["log_file"]
+        )
+        execution_journal = journal.get_execution_journal()
+        if execution_journal:
+            execution_journal.module_completed(
+                module=key,
+                status=response.status if response else StatusType.ERROR.value,
+                build_id=build["build_id"],
+                bundle_md5=build.get("bundle_md5"),
+            )
+        return response
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(mdos), thread_name_prefix="Reattach") as workers:
+        responses = dict(zip(mdos.keys(), workers.map(_reattach, mdos.keys())))
+    for key, response in responses.items():
+        if response is None or _failed(response):
+            _logger.warning(
+                "The build of module %s started by the interrupted apply did not deploy it, deploying it again", key
+            )
+    return {
+        key: running_builds[key].get("bundle_md5")
+        for key, response in responses.items()
+        if response and response.status == StatusType.SUCCESS.value
+    }
+
+
 def deploy_deployment(
     deployment_manifest: DeploymentManifest,
     module_info_index: du.ModuleInfoIndex,
     module_upstream_dep: Dict[str, List[str]],
     dryrun: bool = False,
     show_manifest: bool = False,
+    dag_scheduler: bool = False,
+    verify_workers: int = 10,
+    use_hash_cache: bool = True,
+    on_failure: str = ON_FAILURE_CONTINUE,
+    resume_state: Optional[journal.JournalState] = None,
 ) -> None:
     """
     deploy_deployment
@@ -667,6 +1089,32 @@ def deploy_deployment(
         This flag indicates to print out the DeploymentManifest object as s dictionary.
 
         By default False
+    dag_scheduler : bool, optional
+        This flag indicates to schedule modules across groups as soon as the modules they reference
+        are deployed, rather than waiting for each group to complete.
+
+        By default False
+    verify_workers : int, optional
+        The number of modules to verify (fetch, checksum and resolve parameters) concurrently.
+
+        By default 10
+    use_hash_cache : bool, optional
+        This flag indicates to reuse the file hashes cached in .seedfarmer.out when calculating the
+        bundle md5 of each module.
+
+        By default True
+    on_failure : str, optional
+        What happens to the other modules of a group once one fails to deploy: `stop` stops their builds,
+        `drain` lets the started ones finish and `continue` lets all of them finish.
+        No later group is deployed in any case, with `dag_scheduler` `continue` still deploys the modules
+        not depending on the failed one.
+
+        By default `continue`
+    resume_state : Optional[JournalState], optional
+        The journal of an interrupted apply of the same manifest. The builds it left running are waited
+        for, and the modules it deployed are not deployed again unless their bundle md5 changed since.
+
+        By default None
     """
     deployment_manifest_wip = deployment_manifest.model_copy()
     deployment_name = cast(str, deployment_manifest_wip.name)
@@ -680,63 +1128,61 @@ def deploy_deployment(
         _logger.warn("You have configured your deployment to FORCE all dependent modules to redeploy")
         _logger.debug(f"Upstream Module Dependencies : {json.dumps(module_upstream_dep, indent=4)}")
 
-    groups_to_deploy = []
-    unchanged_modules = []
-    _group_mod_to_deploy: List[str] = []
     for group in deployment_manifest_wip.groups:
-        modules_to_deploy = []
         _logger.info(" Verifying all modules in %s for deploy ", group.name)
         du.validate_group_parameters(group=group)
-        for module in group.modules:
-            _logger.debug("Working on -- %s", module)
-            if not module.path:
-                raise seedfarmer.errors.InvalidManifestError("Unable to parse module manifest, `path` not specified")
-
-            if module.path.startswith("git::"):
-                _process_git_module_path(module=module)
-            elif module.path.startswith("archive::"):
-                _process_archive_path(
-                    module=module,
-                    secret_name=deployment_manifest.archive_secret,
-                )
 
-            if module.data_files is not None:
-                _process_data_files(
-                    data_files=module.data_files,
-                    module_name=module.name,
-                    group_name=group.name,
-                    secret_name=deployment_manifest.archive_secret,
-                )
+    # The modules deployed by the resumed apply, with the bundle md5 they were deployed from
+    resumed_bundle_md5s: Dict[str, Optional[str]] = {}
+    if resume_state:
+        resumed_bundle_md5s = {
+            **resume_state.deployed_modules,
+            **_reattach_builds(
+                deployment_manifest_wip=deployment_manifest_wip, running_builds=resume_state.running_builds
+            ),
+        }
 
-            deployspec_path = get_deployspec_path(str(module.get_local_path()))
-            with open(deployspec_path, encoding="utf-8") as module_spec_file:
-                module.deploy_spec = DeploySpec(**yaml.safe_load(module_spec_file))
-
-            md5_excluded_module_files = [
-                "README.md",
-                "modulestack.template",
-                "setup.cfg",
-                "requirements-dev.txt",
-                "requirements-dev.in",
-                ".gitignore",
-            ]
+    # Verification (fetch, checksum, param resolution) is independent per module, so it is fanned out.
+    # The need_to_build evaluation below stays sequential to preserve the _group_mod_to_deploy ordering.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=verify_workers, thread_name_prefix="Verify") as workers:
 
-            module.bundle_md5 = checksum.get_module_md5(
-                project_path=config.OPS_ROOT,
-                module_path=str(module.get_local_path()),
-                data_files=module.data_files,
-                excluded_files=md5_excluded_module_files,
+        def _exec_verify(group_module: Tuple[str, ModuleManifest]) -> None:
+            _verify_module(
+                deployment_manifest=deployment_manifest,
+                deployment_manifest_wip=deployment_manifest_wip,
+                group_name=group_module[0],
+                module=group_module[1],
+                use_hash_cache=use_hash_cache,
             )
-            resolve_params_for_checksum(
-                deployment_manifest=deployment_manifest_wip, module=module, group_name=group.name
+
+        list(
+            workers.map(
+                _exec_verify,
+                [(group.name, module) for group in deployment_manifest_wip.groups for module in group.modules],
             )
+        )
 
-            module.manifest_md5 = hashlib.md5(
-                json.dumps(module.model_dump(), sort_keys=True).encode("utf-8"),
-                usedforsecurity=False,
-            ).hexdigest()
-            module.deployspec_md5 = hashlib.md5(open(deployspec_path, "rb").read(), usedforsecurity=False).hexdigest()
+    # A module changed since the resumed apply deployed it is evaluated like any other
+    resumed_modules: List[str] = []
+    for group in deployment_manifest_wip.groups:
+        for module in group.modules:
+            key = f"{group.name}-{module.name}"
+            if key not in resumed_bundle_md5s:
+                continue
+            if resumed_bundle_md5s[key] and resumed_bundle_md5s[key] == module.bundle_md5:
+                resumed_modules.append(key)
+            else:
+                _logger.info("Module %s changed since the interrupted apply deployed it, evaluating it again", key)
 
+    groups_to_deploy = []
+    unchanged_modules = []
+    # Modules deployed by the resumed apply still force the redeploy of the modules depending on them
+    _group_mod_to_deploy: List[str] = list(resumed_modules)
+    for group in deployment_manifest_wip.groups:
+        modules_to_deploy = []
+        for module in group.modules:
+            if f"{group.name}-{module.name}" in resumed_modules:
+                continue
             _build_module = du.need_to_build(
                 deployment_name=deployment_name,
                 group_name=group.name,
@@ -750,6 +1196,7 @@ def deploy_deployment(
                     region=cast(str, module.target_region),
                     module_name=module.name,
                 ),
+                rehash=_get_module_rehash(module=module, use_hash_cache=use_hash_cache),
             )
             if not _build_module:
                 unchanged_modules.append(
@@ -772,16 +1219,62 @@ def deploy_deployment(
         if unchanged_modules
         else None
     )
+    (
+        _print_modules(
+            f"Modules deployed by the resumed apply (will not be changed): {deployment_name} ",
+            [
+                [module.target_account, module.target_region, deployment_name, group.name, module.name]
+                for group in deployment_manifest_wip.groups
+                for module in group.modules
+                if f"{group.name}-{module.name}" in resumed_modules
+            ],
+        )
+        if resumed_modules
+        else None
+    )
     _deploy_validated_deployment(
         deployment_manifest=deployment_manifest,
         deployment_manifest_wip=deployment_manifest_wip,
         groups_to_deploy=groups_to_deploy,
         dryrun=dryrun,
+        module_upstream_dep=module_upstream_dep,
+        dag_scheduler=dag_scheduler,
+        on_failure=on_failure,
     )
     print_bolded(f"To see all deployed modules, run seedfarmer list modules -d {deployment_name}")
     print_manifest_json(deployment_manifest) if show_manifest else None
 
 
+def _start_execution_journal(
+    deployment_manifest: DeploymentManifest, resume: bool
+) -> Tuple[journal.ExecutionJournal, Optional[journal.JournalState]]:
+    deployment_name = cast(str, deployment_manifest.name)
+    execution_journal = journal.ExecutionJournal(journal.get_journal_path(config.OPS_ROOT, deployment_name))
+    manifest_digest = journal.get_manifest_digest(deployment_manifest.model_dump())
+    resume_state = execution_journal.load() if resume else None
+    if resume_state and resume_state.manifest_digest != manifest_digest:
+        raise seedfarmer.errors.InvalidConfigurationError(
+            f"The manifest of {deployment_name} changed since the apply to resume, apply it without --resume"
+        )
+    if resume_state and not resume_state.completed:
+        _logger.info(
+            "Resuming the apply of %s: %s modules deployed, %s builds to re-attach to",
+            deployment_name,
+            len(resume_state.deployed_modules),
+            len(resume_state.running_builds),
+        )
+        execution_journal.resume()
+        return execution_journal, resume_state
+    if resume:
+        _logger.warning("There is no interrupted apply of %s to resume, applying it in full", deployment_name)
+    execution_journal.start(
+        deployment_name=deployment_name,
+        manifest_digest=manifest_digest,
+        modules=[f"{group.name}-{module.name}" for group in deployment_manifest.groups for module in group.modules],
+    )
+    return execution_journal, None
+
+
 @bind_session_mgr
 @safe_execute("Deployment Apply")
 def apply(
@@ -798,6 +1291,13 @@ def apply(
     update_project_policy: bool = False,
     local: bool = False,
     enable_self_access_logs: bool = False,
+    dag_scheduler: bool = False,
+    verify_workers: int = 10,
+    use_hash_cache: bool = True,
+    live_view: bool = False,
+    follow_modules: Optional[List[str]] = None,
+    on_failure: str = ON_FAILURE_CONTINUE,
+    resume: bool = False,
 ) -> None:
     """
     apply
@@ -842,6 +1342,30 @@ def apply(
         If set to true, use the credentials of active session and do not
         use the seedfarmer roles
         By default False
+    dag_scheduler: bool
+        If set to true, modules are deployed as soon as the modules they reference are deployed
+        instead of waiting for every module in all earlier groups to complete
+        By default False
+    verify_workers: int
+        The number of modules to verify (fetch, checksum and resolve parameters) concurrently
+        By default 10
+    use_hash_cache: bool
+        If set to true, reuse file hashes cached in .seedfarmer.out for unchanged files
+        By default True
+    live_view: bool
+        If set to true, show a live table of the remote builds in progress
+        By default False
+    follow_modules: Optional[List[str]]
+        The modules (<group_name>-<module_name>) whose build log lines are printed above the live table
+        By default None
+    on_failure: str
+        What happens to the other modules of a group once one fails: `stop` stops their builds,
+        `drain` lets the started ones finish and `continue` lets all of them finish
+        By default `continue`
+    resume: bool
+        If set to true, resume the last apply of the manifest as recorded in its execution journal:
+        wait for the builds it left running and skip the modules it deployed
+        By default False
 
     Raises
     ------
@@ -864,6 +1388,13 @@ def apply(
             session_timeout_interval, exception_type=seedfarmer.errors.InvalidConfigurationError
         )
 
+    InputValidator.validate_worker_count(verify_workers, exception_type=seedfarmer.errors.InvalidConfigurationError)
+    InputValidator.validate_choice(
+        on_failure, ON_FAILURE_POLICIES, "on-failure policy", exception_type=seedfarmer.errors.InvalidConfigurationError
+    )
+    if resume and dryrun:
+        raise seedfarmer.errors.InvalidConfigurationError("An apply cannot be resumed as a dry-run")
+
     manifest_path = os.path.join(config.OPS_ROOT, deployment_manifest_path)
     with open(manifest_path, encoding="utf-8") as manifest_file:
         manifest_input = yaml.safe_load(manifest_file)
@@ -890,6 +1421,8 @@ def apply(
     )
     _, _, partition = get_sts_identity_info(session=session_manager.toolchain_session)
     deployment_manifest._partition = partition
+    _warm_up_sessions(session_manager=session_manager, deployment_manifest=deployment_manifest)
+    _configure_governor(session_manager=session_manager, deployment_manifest=deployment_manifest)
     if not dryrun:
         write_deployment_manifest(
             cast(str, deployment_manifest.name),
@@ -933,40 +1466,58 @@ def apply(
                 raise seedfarmer.errors.InvalidManifestError(f"Cannot parse manifest file: {e}")
     deployment_manifest.validate_and_set_module_defaults()
 
-    prime_target_accounts(
-        deployment_manifest=deployment_manifest,
-        update_seedkit=update_seedkit,
-        update_project_policy=update_project_policy,
-        enable_self_access_logs=enable_self_access_logs,
+    execution_journal, resume_state = (
+        _start_execution_journal(deployment_manifest=deployment_manifest, resume=resume) if not dryrun else (None, None)
     )
-
-    module_info_index = du.populate_module_info_index(deployment_manifest=deployment_manifest)
-    destroy_manifest = du.filter_deploy_destroy(deployment_manifest, module_info_index)
-
-    module_depends_on_dict, module_dependencies_dict = du.generate_dependency_maps(manifest=deployment_manifest)
-    _logger.debug("module_depends_on_dict: %s", json.dumps(module_depends_on_dict))
-    _logger.debug("module_dependencies_dict: %s", json.dumps(module_dependencies_dict))
-    violations = du.validate_module_dependencies(module_dependencies_dict, destroy_manifest)
-    if violations:
-        print_dependency_error_list(
-            header_message="The following modules requested for destroy have dependencies that prevent destruction:",
-            errored_list=violations,
+    with journal.record_execution(execution_journal):
+        prime_target_accounts(
+            deployment_manifest=deployment_manifest,
+            update_seedkit=update_seedkit,
+            update_project_policy=update_project_policy,
+            enable_self_access_logs=enable_self_access_logs,
+            primed_accounts=resume_state.primed_accounts if resume_state else None,
         )
-        raise seedfarmer.errors.InvalidConfigurationError("Modules cannot be destroyed due to dependencies")
 
-    destroy_deployment(
-        destroy_manifest=destroy_manifest,
-        remove_deploy_manifest=False,
-        dryrun=dryrun,
-        show_manifest=show_manifest,
-    )
-    deploy_deployment(
-        deployment_manifest=deployment_manifest,
-        module_info_index=module_info_index,
-        module_upstream_dep=module_depends_on_dict,
-        dryrun=dryrun,
-        show_manifest=show_manifest,
-    )
+        # Destroys are not journaled, modules destroyed by the resumed apply are no longer in the index
+        module_info_index = du.populate_module_info_index(deployment_manifest=deployment_manifest)
+        destroy_manifest = du.filter_deploy_destroy(deployment_manifest, module_info_index)
+
+        module_depends_on_dict, module_dependencies_dict = du.generate_dependency_maps(manifest=deployment_manifest)
+        _logger.debug("module_depends_on_dict: %s", json.dumps(module_depends_on_dict))
+        _logger.debug("module_dependencies_dict: %s", json.dumps(module_dependencies_dict))
+        violations = du.validate_module_dependencies(module_dependencies_dict, destroy_manifest)
+        if violations:
+            print_dependency_error_list(
+                header_message="The following modules requested for destroy have dependencies "
+                "that prevent destruction:",
+                errored_list=violations,
+            )
+            raise seedfarmer.errors.InvalidConfigurationError("Modules cannot be destroyed due to dependencies")
+
+        with show_build_progress(enabled=live_view and not dryrun, follow=follow_modules):
+            destroy_deployment(
+                destroy_manifest=destroy_manifest,
+                remove_deploy_manifest=False,
+                dryrun=dryrun,
+                show_manifest=show_manifest,
+                on_failure=on_failure,
+            )
+            deploy_deployment(
+                deployment_manifest=deployment_manifest,
+                module_info_index=module_info_index,
+                module_upstream_dep=module_depends_on_dict,
+                dryrun=dryrun,
+                show_manifest=show_manifest,
+                dag_scheduler=dag_scheduler,
+                verify_workers=verify_workers,
+                use_hash_cache=use_hash_cache,
+                on_failure=on_failure,
+                resume_state=resume_state,
+            )
+        if execution_journal:
+            execution_journal.completed()
+    _report_governor_delays()
+    _logger.debug("boto3 client cache: %s", get_client_cache_stats())
 
 
 @bind_session_mgr
@@ -983,6 +1534,9 @@ def destroy(
     enable_session_timeout: bool = False,
     session_timeout_interval: int = 900,
     local: bool = False,
+    live_view: bool = False,
+    follow_modules: Optional[List[str]] = None,
+    on_failure: str = ON_FAILURE_CONTINUE,
 ) -> None:
     """
     destroy
@@ -1024,6 +1578,16 @@ def destroy(
         If set to true, use the credentials of active session and do not
         use the seedfarmer roles
         By default False
+    live_view: bool
+        If set to true, show a live table of the remote builds in progress
+        By default False
+    follow_modules: Optional[List[str]]
+        The modules (<group_name>-<module_name>) whose build log lines are printed above the live table
+        By default None
+    on_failure: str
+        What happens to the other modules of a group once one fails: `stop` stops their builds,
+        `drain` lets the started ones finish and `continue` lets all of them finish
+        By default `continue`
     Raises
     ------
     InvalidConfigurationError
@@ -1047,6 +1611,10 @@ def destroy(
             session_timeout_interval, exception_type=seedfarmer.errors.InvalidConfigurationError
         )
 
+    InputValidator.validate_choice(
+        on_failure, ON_FAILURE_POLICIES, "on-failure policy", exception_type=seedfarmer.errors.InvalidConfigurationError
+    )
+
     project = config.PROJECT
     _logger.debug("Preparing to destroy %s", deployment_name)
 
@@ -1063,6 +1631,8 @@ def destroy(
     if destroy_manifest:
         _, _, partition = get_sts_identity_info(session=session_manager.toolchain_session)
         destroy_manifest._partition = partition
+        _warm_up_sessions(session_manager=session_manager, deployment_manifest=destroy_manifest)
+        _configure_governor(session_manager=session_manager, deployment_manifest=destroy_manifest)
         destroy_manifest.validate_and_set_module_defaults()
         prime_target_accounts(
             deployment_manifest=destroy_manifest,
@@ -1070,13 +1640,15 @@ def destroy(
             update_project_policy=False,
             enable_self_access_logs=False,
         )
-        destroy_deployment(
-            destroy_manifest,
-            remove_deploy_manifest=True,
-            dryrun=dryrun,
-            show_manifest=show_manifest,
-            remove_seedkit=remove_seedkit,
-        )
+        with show_build_progress(enabled=live_view and not dryrun, follow=follow_modules):
+            destroy_deployment(
+                destroy_manifest,
+                remove_deploy_manifest=True,
+                dryrun=dryrun,
+                show_manifest=show_manifest,
+                remove_seedkit=remove_seedkit,
+                on_failure=on_failure,
+            )
     else:
         account_id, _, _ = get_sts_identity_info(session=session_manager.toolchain_session)
         region = session_manager.toolchain_session.region_name
@@ -1089,3 +1661,5 @@ def destroy(
             region,
         )
         print_bolded(message=messages.no_deployment_found(deployment_name=deployment_name), color="yellow")
+    _report_governor_delays()
+    _logger.debug("boto3 client cache: %s", get_client_cache_stats())
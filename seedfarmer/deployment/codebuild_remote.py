@@ -13,24 +13,36 @@
 #    limitations under the License.
 
 import logging
+import os
 import random
 import string
-from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Union
+import threading
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, ContextManager, Dict, Iterable, Optional, Union
 
 from boto3 import Session
 
+import seedfarmer.checksum as checksum
 import seedfarmer.errors
 import seedfarmer.services._cloudwatch as cloudwatch
 import seedfarmer.services._codebuild as codebuild
 import seedfarmer.services._s3 as s3
 from seedfarmer.error_handler import log_error_safely
+from seedfarmer.mgmt.bundle_support import BUNDLE_DIGEST_METADATA
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+# Content-addressed bundles are expired by the seedkit bucket lifecycle rule on this prefix (7 days), objects
+# older than BUNDLE_OBJECT_REUSE_DAYS are uploaded again rather than risk expiring while a build fetches them
+BUNDLE_OBJECT_PREFIX = "seedfarmer/bundles"
+BUNDLE_OBJECT_REUSE_DAYS = 3
+# Local copy of the CodeBuild logs of each module, rotated by cloudwatch.LogTailer
+CODEBUILD_LOG_DIR = os.path.join(".seedfarmer.out", "logs")
+
 
 def _print_codebuild_logs(
-    events: List[cloudwatch.CloudWatchEvent],
+    events: Iterable[cloudwatch.CloudWatchEvent],
     codebuild_log_callback: Optional[Callable[[str], None]] = None,
 ) -> None:
     for event in events:
@@ -45,23 +57,37 @@ def _wait_execution(
     stream_name_prefix: str,
     codebuild_log_callback: Optional[Callable[[str], None]] = None,
     session: Optional[Union[Callable[[], Session], Session]] = None,
+    codebuild_status_callback: Optional[Callable[[codebuild.BuildInfo], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+    log_file: Optional[str] = None,
 ) -> Optional[codebuild.BuildInfo]:
-    start_time: Optional[datetime] = None
-    stream_name: Optional[str] = None
+    tailer: Optional[cloudwatch.LogTailer] = None
     status: Optional[codebuild.BuildInfo] = None
-    for status in codebuild.wait(build_id=build_id, session=session):
-        if status.logs.enabled and status.logs.group_name:
-            if stream_name is None:
-                stream_name = cloudwatch.get_stream_name_by_prefix(
-                    group_name=status.logs.group_name, prefix=f"{stream_name_prefix}/", session=session
-                )
-            if stream_name is not None:
-                events = cloudwatch.get_log_events(
-                    group_name=status.logs.group_name, stream_name=stream_name, start_time=start_time, session=session
-                )
-                _print_codebuild_logs(events=events.events, codebuild_log_callback=codebuild_log_callback)
-                if events.last_timestamp is not None:
-                    start_time = events.last_timestamp + timedelta(milliseconds=1)
+    stop_requested = False
+    try:
+        for status in codebuild.wait(build_id=build_id, session=session):
+            if cancel_event is not None and cancel_event.is_set() and not stop_requested:
+                stop_requested = True
+                codebuild.stop(build_id=build_id, session=session)
+            if codebuild_status_callback:
+                codebuild_status_callback(status)
+            if status.logs.enabled and status.logs.group_name:
+                if tailer is None:
+                    stream_name = cloudwatch.get_stream_name_by_prefix(
+                        group_name=status.logs.group_name, prefix=f"{stream_name_prefix}/", session=session
+                    )
+                    if stream_name is not None:
+                        tailer = cloudwatch.LogTailer(
+                            group_name=status.logs.group_name,
+                            stream_name=stream_name,
+                            session=session,
+                            log_file=log_file,
+                        )
+                if tailer is not None:
+                    _print_codebuild_logs(events=tailer.tail(), codebuild_log_callback=codebuild_log_callback)
+    finally:
+        if tailer is not None:
+            tailer.close()
     return status
 
 
@@ -74,27 +100,66 @@ def _execute_codebuild(
     overrides: Optional[Dict[str, Any]] = None,
     codebuild_log_callback: Optional[Callable[[str], None]] = None,
     session: Optional[Union[Callable[[], Session], Session]] = None,
+    codebuild_status_callback: Optional[Callable[[codebuild.BuildInfo], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
     yaml_dumper: Optional[Any] = None,  # Accepts ruamel.yaml.YAML instance or PyYAML dump function
+    log_file: Optional[str] = None,
+    build_started_callback: Optional[Callable[[str, str, str], None]] = None,
+    acquire_slot: Optional[Callable[[], ContextManager[Any]]] = None,
 ) -> Optional[codebuild.BuildInfo]:
     _logger.debug("bundle_location: %s", bundle_location)
     stream_name_prefix = f"codeseeder-{execution_id}"  # (LEGACY)
     _logger.debug("stream_name_prefix: %s", stream_name_prefix)
-    build_id = codebuild.start(
-        project_name=stack_outputs["CodeBuildProject"],
-        stream_name=stream_name_prefix,
-        bundle_location=bundle_location,
-        buildspec=buildspec,
-        timeout=timeout,
-        overrides=overrides,
-        session=session,
-        yaml_dumper=yaml_dumper,
-    )
-    return _wait_execution(
-        build_id=build_id,
-        stream_name_prefix=stream_name_prefix,
-        codebuild_log_callback=codebuild_log_callback,
+    # The slot is only held while a build runs, not while its bundle is uploaded
+    with acquire_slot() if acquire_slot else nullcontext():
+        build_id = codebuild.start(
+            project_name=stack_outputs["CodeBuildProject"],
+            stream_name=stream_name_prefix,
+            bundle_location=bundle_location,
+            buildspec=buildspec,
+            timeout=timeout,
+            overrides=overrides,
+            session=session,
+            yaml_dumper=yaml_dumper,
+        )
+        if build_started_callback:
+            build_started_callback(build_id, stream_name_prefix, str(log_file))
+        return _wait_execution(
+            build_id=build_id,
+            stream_name_prefix=stream_name_prefix,
+            codebuild_log_callback=codebuild_log_callback,
+            session=session,
+            codebuild_status_callback=codebuild_status_callback,
+            cancel_event=cancel_event,
+            log_file=log_file,
+        )
+
+
+def _upload_content_addressed_bundle(
+    bundle_path: str,
+    bucket: str,
+    digest: str,
+    session: Optional[Union[Callable[[], Session], Session]] = None,
+    upload_concurrency: int = 1,
+) -> str:
+    key = f"{BUNDLE_OBJECT_PREFIX}/{digest.replace(':', '-')}.zip"
+    head = s3.head_object(bucket=bucket, key=key, session=session)
+    if (
+        head is not None
+        and head.get("Metadata", {}).get(BUNDLE_DIGEST_METADATA) == digest
+        and head["LastModified"] > datetime.now(timezone.utc) - timedelta(days=BUNDLE_OBJECT_REUSE_DAYS)
+    ):
+        _logger.debug("Bundle s3://%s/%s already uploaded, skipping upload", bucket, key)
+        return key
+    s3.upload_file(
+        src=bundle_path,
+        bucket=bucket,
+        key=key,
         session=session,
+        metadata={BUNDLE_DIGEST_METADATA: digest},
+        concurrency=upload_concurrency,
     )
+    return key
 
 
 def run(
@@ -108,6 +173,13 @@ def run(
     bundle_id: Optional[str] = None,
     prebuilt_bundle: Optional[str] = None,
     yaml_dumper: Optional[Any] = None,  # Accepts ruamel.yaml.YAML instance or PyYAML dump function
+    content_addressed: bool = False,
+    codebuild_status_callback: Optional[Callable[[codebuild.BuildInfo], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+    build_started_callback: Optional[Callable[[str, str, str], None]] = None,
+    bundle_digest: Optional[str] = None,
+    upload_concurrency: int = 1,
+    acquire_slot: Optional[Callable[[], ContextManager[Any]]] = None,
 ) -> Optional[codebuild.BuildInfo]:
     execution_id = "".join(random.choice(string.ascii_lowercase) for i in range(8))
 
@@ -117,14 +189,31 @@ def run(
         loc = f"{o[0]}/{o[1]}"
     else:
         try:
-            key: str = (
-                f"seedfarmer/{bundle_id}/{execution_id}/bundle.zip"
-                if bundle_id
-                else f"seedfarmer/{execution_id}/bundle.zip"
-            )
             bucket = stack_outputs["Bucket"]
-            s3.delete_objects(bucket=bucket, keys=[key], session=session)
-            s3.upload_file(src=bundle_path, bucket=bucket, key=key, session=session)
+            if content_addressed:
+                # Hashing the zip is only worth a full read of it when the digest names the object
+                key = _upload_content_addressed_bundle(
+                    bundle_path=bundle_path,
+                    bucket=bucket,
+                    digest=bundle_digest or checksum.get_file_digest(bundle_path, checksum.DIGEST_ALGORITHM_BLAKE2B),
+                    session=session,
+                    upload_concurrency=upload_concurrency,
+                )
+            else:
+                key = (
+                    f"seedfarmer/{bundle_id}/{execution_id}/bundle.zip"
+                    if bundle_id
+                    else f"seedfarmer/{execution_id}/bundle.zip"
+                )
+                # A known digest stored with the object lets `seedfarmer bundle store` skip unchanged copies
+                s3.upload_file(
+                    src=bundle_path,
+                    bucket=bucket,
+                    key=key,
+                    session=session,
+                    metadata={BUNDLE_DIGEST_METADATA: bundle_digest} if bundle_digest else None,
+                    concurrency=upload_concurrency,
+                )
             loc = f"{bucket}/{key}"
         except Exception as e:
             log_error_safely(
@@ -145,6 +234,11 @@ def run(
             overrides=overrides,
             session=session,
             yaml_dumper=yaml_dumper,
+            codebuild_status_callback=codebuild_status_callback,
+            cancel_event=cancel_event,
+            log_file=os.path.join(os.getcwd(), CODEBUILD_LOG_DIR, f"{bundle_id or execution_id}.log"),
+            build_started_callback=build_started_callback,
+            acquire_slot=acquire_slot,
         )
     except Exception as e:
         log_error_safely(_logger, e, "CodeBuild execution failed")
@@ -152,8 +246,8 @@ def run(
         _logger.error(f"CodeBuild execution failed: {e}")
         raise seedfarmer.errors.RemoteDeploymentRuntimeError(f"CodeBuild execution failed: {e}")
     finally:
-        # Clean up S3 bundle even if execution failed (unless it's prebuilt)
-        if not prebuilt_bundle:
+        # Clean up S3 bundle even if execution failed (unless it's prebuilt or shared by content)
+        if not prebuilt_bundle and not content_addressed:
             try:
                 s3.delete_objects(bucket=bucket, keys=[key], session=session)
             except Exception as e:
@@ -161,3 +255,33 @@ def run(
                 # Don't raise here - this is just cleanup
 
     return build_info
+
+
+def reattach(
+    build_id: str,
+    stream_name_prefix: str,
+    log_file: str,
+    codebuild_log_callback: Optional[Callable[[str], None]] = None,
+    session: Optional[Union[Callable[[], Session], Session]] = None,
+    codebuild_status_callback: Optional[Callable[[codebuild.BuildInfo], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Optional[codebuild.BuildInfo]:
+    """Wait for a build started by an earlier run, as `run` waits for the builds it starts
+
+    The logs are tailed again from the start of the stream, the local log file gets a `.resumed` suffix
+    so that the lines already written by the earlier run are not duplicated.
+    """
+    try:
+        return _wait_execution(
+            build_id=build_id,
+            stream_name_prefix=stream_name_prefix,
+            codebuild_log_callback=codebuild_log_callback,
+            session=session,
+            codebuild_status_callback=codebuild_status_callback,
+            cancel_event=cancel_event,
+            log_file=f"{os.path.splitext(log_file)[0]}.resumed.log",
+        )
+    except Exception as e:
+        log_error_safely(_logger, e, "CodeBuild execution failed")
+        _logger.error(f"CodeBuild execution failed: {e}")
+        raise seedfarmer.errors.RemoteDeploymentRuntimeError(f"CodeBuild execution failed: {e}")
@@ -56,6 +56,9 @@ class DeployModule:
     def destroy_module(self) -> ModuleDeploymentResponse:
         raise NotImplementedError("Subclasses must implement 'deploy_module'")
 
+    def _cancelled(self) -> bool:
+        return self.mdo.cancel_event is not None and self.mdo.cancel_event.is_set()
+
     def _prebuilt_bundle_check(self) -> Optional[str]:
         if self.mdo.seedfarmer_bucket:
             module_manifest = self.module_manifest
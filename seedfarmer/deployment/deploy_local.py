@@ -179,7 +179,9 @@ class DeployLocalModule(DeployModule):
         output_override = f".seedfarmerlocal-{bundle_id}"
 
         local_path = create_output_dir(f"{bundle_id}", output_override)
-        bundle.generate_bundle(dirs=dirs_tuples, files=files_tuples, bundle_id=bundle_id, path_override=output_override)
+        bundle.generate_bundle(
+            dirs=dirs_tuples, files=files_tuples, bundle_id=bundle_id, path_override=output_override, archive=False
+        )
         stack_outputs = deployment_manifest.get_region_seedfarmer_metadata(account_id=account_id, region=region)
 
         runtime_versions = get_runtimes(codebuild_image=codebuild_image, runtime_overrides=self.mdo.runtime_overrides)
@@ -295,7 +297,9 @@ class DeployLocalModule(DeployModule):
         output_override = f".seedfarmerlocal-{bundle_id}"
 
         local_path = create_output_dir(f"{bundle_id}", output_override)
-        bundle.generate_bundle(dirs=dirs_tuples, files=files_tuples, bundle_id=bundle_id, path_override=output_override)
+        bundle.generate_bundle(
+            dirs=dirs_tuples, files=files_tuples, bundle_id=bundle_id, path_override=output_override, archive=False
+        )
 
         _phases = module_manifest.deploy_spec.destroy.phases
         stack_outputs = self.mdo.deployment_manifest.get_region_seedfarmer_metadata(
@@ -15,19 +15,26 @@
 
 import logging
 import os
-from typing import Dict, List, Optional, cast
+from functools import partial
+from typing import Dict, List, Optional, Tuple, cast
+
+from boto3 import Session
 
 import seedfarmer
 import seedfarmer.deployment.codebuild_remote as codebuild_remote
 import seedfarmer.errors
 import seedfarmer.mgmt.bundle as bundle
+import seedfarmer.mgmt.bundle_support as bundle_support
+import seedfarmer.mgmt.journal as journal
 import seedfarmer.services._codebuild as codebuild
 from seedfarmer import config
-from seedfarmer.commands._runtimes import EnvironmentType, get_runtimes
+from seedfarmer.commands._runtimes import CuratedBuildImages, EnvironmentType, get_runtimes
 from seedfarmer.deployment.deploy_base import DeployModule
 from seedfarmer.error_handler import log_error_safely
 from seedfarmer.models.deploy_responses import CodeBuildMetadata, ModuleDeploymentResponse, StatusType
 from seedfarmer.models.manifests import ModuleManifest
+from seedfarmer.output_utils import get_build_progress_view
+from seedfarmer.services._governor import GOVERNOR_CODEBUILD, governed
 from seedfarmer.services.session_manager import SessionManager
 from seedfarmer.types.parameter_types import EnvVar
 
@@ -36,8 +43,60 @@ from seedfarmer.utils import apply_literalstr, create_output_dir, register_liter
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+CURATED_BUILD_IMAGES = [image.value for image in CuratedBuildImages.ImageEnums]
+
+
+def _response_status(build_info: codebuild.BuildInfo, cancelled: bool) -> str:
+    if build_info.status is codebuild.BuildStatus.succeeded:
+        return StatusType.SUCCESS.value
+    # A build stopped after another module failed did not fail itself
+    if cancelled and build_info.status is codebuild.BuildStatus.stopped:
+        return StatusType.CANCELLED.value
+    return StatusType.ERROR.value
+
 
 class DeployRemoteModule(DeployModule):
+    def _generate_bundle(
+        self,
+        module_manifest: ModuleManifest,
+        dirs: List[Tuple[str, str]],
+        files: List[Tuple[str, str]],
+        bundle_id: str,
+        delta_session: Optional[Session] = None,
+    ) -> str:
+        # Delta bundles only hold the files changed since the bundle stored in the seedfarmer bucket
+        if delta_session is not None:
+            deployment, group, module = (
+                str(self.mdo.deployment_manifest.name),
+                str(self.mdo.group_name),
+                str(module_manifest.name),
+            )
+            bucket = str(self.mdo.seedfarmer_bucket)
+            return bundle.delta_bundle(
+                base=bundle_support.get_bundle_sf_path(
+                    deployment=deployment, group=group, module=module, bucket=bucket
+                ),
+                base_manifest=bundle_support.get_bundle_manifest(
+                    deployment=deployment, group=group, module=module, bucket=bucket, session=delta_session
+                ),
+                dirs=dirs,
+                files=files,
+                bundle_id=bundle_id,
+                compresslevel=config.BUNDLE_COMPRESSION_LEVEL,
+            )
+        # Bundles of modules with a known checksum are shared through the local bundle cache
+        if module_manifest.bundle_md5 and config.BUNDLE_CACHE_SIZE > 0:
+            return bundle.cached_bundle(
+                bundle_md5=module_manifest.bundle_md5,
+                max_size=config.BUNDLE_CACHE_SIZE * 1024 * 1024,
+                dirs=dirs,
+                files=files,
+                compresslevel=config.BUNDLE_COMPRESSION_LEVEL,
+            )
+        return bundle.stream_bundle(
+            dirs=dirs, files=files, bundle_id=bundle_id, compresslevel=config.BUNDLE_COMPRESSION_LEVEL
+        )
+
     def _codebuild_install_commands(
         self,
         module_manifest: ModuleManifest,
@@ -161,10 +220,31 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
                 f"-d {deployment_manifest.name} -g {group} -m {module_manifest.name} --region {region} --local"
             ),
         ]
+        codebuild_image = (
+            module_manifest.codebuild_image if module_manifest.codebuild_image is not None else self.mdo.codebuild_image
+        )
+        # Delta bundles are rebuilt with python3 and the AWS CLI before the install commands run, which only
+        # the curated CodeBuild images are known to provide, custom images get the full bundle
+        delta = (
+            config.BUNDLE_UPLOAD_MODE == "delta"
+            and self.mdo.seedfarmer_bucket is not None
+            and (codebuild_image is None or codebuild_image in CURATED_BUILD_IMAGES)
+        )
+        if config.BUNDLE_UPLOAD_MODE == "delta" and not delta and codebuild_image is not None:
+            _logger.info(
+                "Uploading the full bundle of %s, built with the custom image %s", module_manifest.name, codebuild_image
+            )
         store_sf_bundle = [
             (
                 f"seedfarmer bundle store -d {deployment_manifest.name} -g {group} -m {module_manifest.name} "
-                f"-o $CODEBUILD_SOURCE_REPO_URL -b {self.mdo.seedfarmer_bucket} --region {region} || true"
+                f"-o $CODEBUILD_SOURCE_REPO_URL -b {self.mdo.seedfarmer_bucket} --region {region}"
+                + (
+                    f" --file ${{CODEBUILD_SRC_DIR}}/{bundle.BUNDLE_FULL_FILE}"
+                    f" --manifest ${{CODEBUILD_SRC_DIR}}/{bundle.BUNDLE_MANIFEST_FILE}"
+                    if delta
+                    else ""
+                )
+                + " || true"
             )
         ]
 
@@ -187,9 +267,6 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
         files_tuples = [(v, f"{k}") for k, v in extra_file_bundle.items()]
 
         _phases = module_manifest.deploy_spec.deploy.phases
-        codebuild_image = (
-            module_manifest.codebuild_image if module_manifest.codebuild_image is not None else self.mdo.codebuild_image
-        )
 
         codebuild_environment_type = EnvironmentType.get_type(codebuild_image=codebuild_image)
         bundle_id = f"{self.mdo.deployment_manifest.name}-{self.mdo.group_name}-{module_manifest.name}"
@@ -199,9 +276,24 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
 
         runtime_versions = get_runtimes(codebuild_image=codebuild_image, runtime_overrides=self.mdo.runtime_overrides)
         cmds_install = self._codebuild_install_commands(module_manifest, stack_outputs, runtime_versions)
+        if delta:
+            cmds_install = [
+                f"if [ -f ${{CODEBUILD_SRC_DIR}}/{bundle.BUNDLE_DELTA_FILE} ]; "
+                f"then python3 ${{CODEBUILD_SRC_DIR}}/{bundle.BUNDLE_DELTA_SCRIPT}; fi"
+            ] + cmds_install
 
         try:
-            bundle_zip = bundle.generate_bundle(dirs=dirs_tuples, files=files_tuples, bundle_id=bundle_id)
+            bundle_zip = self._generate_bundle(
+                module_manifest,
+                dirs=dirs_tuples,
+                files=files_tuples,
+                bundle_id=bundle_id,
+                delta_session=SessionManager()
+                .get_or_create()
+                .get_deployment_session(account_id=account_id, region_name=region)
+                if delta
+                else None,
+            )
         except Exception as e:
             log_error_safely(_logger, e, f"Failed to generate deployment bundle for {module_manifest.name}")
             _logger.error(f"Bundle generation failed for module {module_manifest.name}: {e}")
@@ -266,6 +358,9 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
                 }
                 for k, v in env_vars.items()
             ]
+        progress_view = get_build_progress_view()
+        progress_name = f"{self.mdo.group_name}-{module_manifest.name}"
+        execution_journal = journal.get_execution_journal()
         try:
             build_info = codebuild_remote.run(
                 stack_outputs=stack_outputs,  # type: ignore [arg-type]
@@ -273,13 +368,24 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
                 buildspec=buildspec,
                 timeout=120,
                 overrides=overrides,
-                codebuild_log_callback=None,
+                codebuild_log_callback=progress_view.log_callback(progress_name) if progress_view else None,
                 session=SessionManager()
                 .get_or_create()
                 .get_deployment_session(account_id=account_id, region_name=region),
                 bundle_id=bundle_id,
                 prebuilt_bundle=None,  # NEVER CHECK FOR THIS BUNDLE ON DEPLOY
                 yaml_dumper=yaml,
+                content_addressed=config.BUNDLE_UPLOAD_MODE == "content",
+                bundle_digest=bundle.get_cached_bundle_digest(bundle_zip),
+                upload_concurrency=self.mdo.upload_concurrency,
+                codebuild_status_callback=progress_view.status_callback(progress_name) if progress_view else None,
+                cancel_event=self.mdo.cancel_event,
+                acquire_slot=partial(governed, account_id=account_id, region=region, service=GOVERNOR_CODEBUILD),
+                build_started_callback=execution_journal.build_started_callback(
+                    module=progress_name, account_id=account_id, region=region, bundle_md5=module_manifest.bundle_md5
+                )
+                if execution_journal
+                else None,
             )
         except Exception as e:
             log_error_safely(_logger, e, f"Remote deployment failed for module {module_manifest.name}")
@@ -288,7 +394,9 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
                 f"Remote deployment execution failed for module {module_manifest.name}: {e}"
             )
 
-        bi = cast(codebuild.BuildInfo, build_info)
+        return self._deploy_response(cast(codebuild.BuildInfo, build_info), account_id=account_id, region=region)
+
+    def _deploy_response(self, bi: codebuild.BuildInfo, account_id: str, region: str) -> ModuleDeploymentResponse:
         deploy_info = {
             "aws_region": region,
             "aws_account_id": account_id,
@@ -301,11 +409,57 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
         return ModuleDeploymentResponse(
             deployment=self.mdo.deployment_manifest.name,
             group=self.mdo.group_name,
-            module=module_manifest.name,
-            status=StatusType.SUCCESS.value if bi.status.value in ["SUCCEEDED"] else StatusType.ERROR.value,
+            module=self.module_manifest.name,
+            status=_response_status(bi, cancelled=self._cancelled()),
             codebuild_metadata=CodeBuildMetadata(**deploy_info),
         )
 
+    def reattach_build(
+        self, build_id: str, stream_name_prefix: str, log_file: str
+    ) -> Optional[ModuleDeploymentResponse]:
+        """Wait for the deployment build of the module started by an interrupted apply
+
+        Parameters
+        ----------
+        build_id : str
+            The id of the CodeBuild build
+        stream_name_prefix : str
+            The prefix of the log stream of the build
+        log_file : str
+            The local log file of the build
+
+        Returns
+        -------
+        Optional[ModuleDeploymentResponse]
+            The outcome of the build, as if the module had been deployed by this run, None when the build
+            cannot be found (expired, or started in another account)
+        """
+        account_id = str(self.module_manifest.get_target_account_id())
+        region = str(self.module_manifest.target_region)
+        progress_view = get_build_progress_view()
+        progress_name = f"{self.mdo.group_name}-{self.module_manifest.name}"
+        _logger.info("Re-attaching to build %s of module %s", build_id, progress_name)
+        try:
+            with governed(account_id=account_id, region=region, service=GOVERNOR_CODEBUILD):
+                build_info = codebuild_remote.reattach(
+                    build_id=build_id,
+                    stream_name_prefix=stream_name_prefix,
+                    log_file=log_file,
+                    codebuild_log_callback=progress_view.log_callback(progress_name) if progress_view else None,
+                    session=SessionManager()
+                    .get_or_create()
+                    .get_deployment_session(account_id=account_id, region_name=region),
+                    codebuild_status_callback=progress_view.status_callback(progress_name) if progress_view else None,
+                    cancel_event=self.mdo.cancel_event,
+                )
+        except seedfarmer.errors.RemoteDeploymentRuntimeError as e:
+            _logger.warning("Cannot re-attach to build %s of module %s - %s", build_id, progress_name, e)
+            return None
+        if build_info is None:
+            _logger.warning("Cannot find build %s of module %s", build_id, progress_name)
+            return None
+        return self._deploy_response(build_info, account_id=account_id, region=region)
+
     def destroy_module(self) -> ModuleDeploymentResponse:
         import yaml
 
@@ -368,7 +522,9 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
                 if extra_files is not None:
                     extra_file_bundle.update(extra_files)  # type: ignore [arg-type]
                 files_tuples = [(v, f"{k}") for k, v in extra_file_bundle.items()]
-                bundle_zip = bundle.generate_bundle(dirs=dirs_tuples, files=files_tuples, bundle_id=bundle_id)
+                bundle_zip = self._generate_bundle(
+                    module_manifest, dirs=dirs_tuples, files=files_tuples, bundle_id=bundle_id
+                )
             except Exception as e:
                 log_error_safely(_logger, e, f"Failed to generate destroy bundle for {module_manifest.name}")
                 _logger.error(f"Destroy bundle generation failed for module {module_manifest.name}: {e}")
@@ -436,6 +592,8 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
                 for k, v in env_vars.items()
             ]
 
+        progress_view = get_build_progress_view()
+        progress_name = f"{self.mdo.group_name}-{module_manifest.name}"
         try:
             build_info = codebuild_remote.run(
                 stack_outputs=stack_outputs,  # type: ignore [arg-type]
@@ -443,12 +601,18 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
                 buildspec=buildspec,
                 timeout=90,
                 overrides=overrides,
-                codebuild_log_callback=None,
+                codebuild_log_callback=progress_view.log_callback(progress_name) if progress_view else None,
                 session=SessionManager()
                 .get_or_create()
                 .get_deployment_session(account_id=account_id, region_name=region),
                 bundle_id=bundle_id,
                 prebuilt_bundle=prebuilt_bundle,
+                content_addressed=config.BUNDLE_UPLOAD_MODE == "content",
+                bundle_digest=bundle.get_cached_bundle_digest(bundle_zip) if bundle_zip else None,
+                upload_concurrency=self.mdo.upload_concurrency,
+                codebuild_status_callback=progress_view.status_callback(progress_name) if progress_view else None,
+                cancel_event=self.mdo.cancel_event,
+                acquire_slot=partial(governed, account_id=account_id, region=region, service=GOVERNOR_CODEBUILD),
             )
         except Exception as e:
             log_error_safely(_logger, e, f"Remote destroy failed for module {module_manifest.name}")
@@ -471,6 +635,6 @@ log_arn=$(echo "$log_response" | jq -r '.arn')
             deployment=self.mdo.deployment_manifest.name,
             group=self.mdo.group_name,
             module=module_manifest.name,
-            status=StatusType.SUCCESS.value if bi.status.value in ["SUCCEEDED"] else StatusType.ERROR.value,
+            status=_response_status(bi, cancelled=self._cancelled()),
             codebuild_metadata=CodeBuildMetadata(**deploy_info),
         )
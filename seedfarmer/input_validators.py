@@ -13,7 +13,7 @@
 #    limitations under the License.
 
 import re
-from typing import Optional
+from typing import List, Optional
 
 
 class InputValidator:
@@ -134,6 +134,20 @@ class InputValidator:
         if timeout > 43200:
             raise exception_type("Session timeout must be 43200 seconds (12 hours) or less")
 
+    @staticmethod
+    def validate_worker_count(workers: int, exception_type: type[Exception] = ValueError) -> None:
+        """Validate a worker (thread) count and raise if invalid."""
+        if workers < 1:
+            raise exception_type("Worker count must be at least 1")
+
+    @staticmethod
+    def validate_choice(
+        value: str, choices: List[str], name: str, exception_type: type[Exception] = ValueError
+    ) -> None:
+        """Validate that a value is one of the allowed choices and raise if not."""
+        if value not in choices:
+            raise exception_type(f"Invalid {name} '{value}', must be one of {', '.join(choices)}")
+
     @staticmethod
     def validate_role_name_length(
         project_name: str, qualifier: Optional[str] = None, exception_type: type[Exception] = ValueError
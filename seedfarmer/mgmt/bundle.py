@@ -13,16 +13,24 @@
 #    limitations under the License.
 
 import glob
+import json
 import logging
 import os
 import pathlib
 import shutil
+import stat
+import sys
+import tempfile
+import threading
+import time
 import zipfile
+import zlib
 from pprint import pformat
-from typing import List, MutableSet, Optional, Tuple
+from typing import Any, Dict, List, MutableSet, Optional, Set, Tuple
 
+import seedfarmer.checksum as checksum
 from seedfarmer import CLI_ROOT
-from seedfarmer.utils import create_output_dir
+from seedfarmer.utils import create_output_dir, get_path_lock
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
@@ -39,6 +47,61 @@ BUNDLE_IGNORED_FILE_PATHS: MutableSet[str] = {
 
 BUNDLE_ALLOWED_HIDDEN_FILE_PATHS: MutableSet[str] = {".python-version"}
 
+BUNDLE_RESOURCE_FILES: List[str] = ["retrieve_docker_creds.py", "pypi_mirror_support.py", "npm_mirror_support.py"]
+
+# Files with these extensions are already compressed, deflating them costs CPU for no size benefit
+BUNDLE_STORED_EXTENSIONS: MutableSet[str] = {
+    ".zip",
+    ".jar",
+    ".war",
+    ".whl",
+    ".egg",
+    ".gz",
+    ".tgz",
+    ".bz2",
+    ".xz",
+    ".zst",
+    ".7z",
+    ".lz4",
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".webp",
+    ".mp3",
+    ".mp4",
+    ".mov",
+    ".avi",
+    ".pt",
+    ".pth",
+    ".onnx",
+    ".safetensors",
+    ".h5",
+    ".parquet",
+}
+
+BUNDLE_DEFAULT_COMPRESSION_LEVEL = 6
+
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+# Files of at least _SAMPLE_MIN_SIZE are stored when deflating a sample of _SAMPLE_SIZE bytes from the
+# start of the file saves less than 1 - _STORE_RATIO of it (already compressed or random content)
+_SAMPLE_MIN_SIZE = 64 * 1024
+_SAMPLE_SIZE = 64 * 1024
+_STORE_RATIO = 0.95
+
+BUNDLE_CACHE_DIR = os.path.join(".seedfarmer.out", "bundles")
+
+# Members at the root of delta mode bundles, see delta_bundle and resources/apply_bundle_delta.py
+BUNDLE_MANIFEST_FILE = "bundle-manifest.json"
+BUNDLE_DELTA_FILE = "bundle-delta.json"
+BUNDLE_DELTA_SCRIPT = "apply_bundle_delta.py"
+BUNDLE_FULL_FILE = "bundle-full.zip"
+
+# Cached bundles handed out by this process, never evicted while it runs as they may still be uploading
+_cached_bundles_in_use: Set[str] = set()
+_cached_bundles_guard = threading.Lock()
+
 
 def _is_valid_image_file(file_path: str, allowed_hidden_files: Optional[List[str]] = None) -> bool:
     if not all([word not in file_path for word in BUNDLE_IGNORED_FILE_PATHS]):
@@ -81,8 +144,32 @@ def _list_files(path: str) -> List[str]:
     return list(set(files))
 
 
+def _compress_type(path: str, compresslevel: int = BUNDLE_DEFAULT_COMPRESSION_LEVEL) -> int:
+    """Choose whether a file is deflated or stored in the bundle
+
+    Files are stored when compression is disabled (level 0), when their extension is in
+    ``BUNDLE_STORED_EXTENSIONS``, or when a fast deflate of a sample of the file barely shrinks it.
+    """
+    if compresslevel == 0 or os.path.splitext(path)[1].lower() in BUNDLE_STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    try:
+        if os.path.getsize(path) >= _SAMPLE_MIN_SIZE:
+            with open(path, "rb") as fp:
+                sample = fp.read(_SAMPLE_SIZE)
+            if len(zlib.compress(sample, 1)) >= len(sample) * _STORE_RATIO:
+                return zipfile.ZIP_STORED
+    except OSError:
+        pass
+    return zipfile.ZIP_DEFLATED
+
+
 def _make_zipfile(
-    base_name: str, root_dir: str, base_dir: str, dry_run: bool = False, logger: Optional[logging.Logger] = None
+    base_name: str,
+    root_dir: str,
+    base_dir: str,
+    dry_run: bool = False,
+    logger: Optional[logging.Logger] = None,
+    compresslevel: int = BUNDLE_DEFAULT_COMPRESSION_LEVEL,
 ) -> str:
     """Create a zip file from all the files under 'root_dir'/'base_dir'. Including 'base_dir' as a folder in the zip.
 
@@ -121,7 +208,12 @@ def _make_zipfile(
                     path = os.path.normpath(os.path.join(dirpath, name))
                     if os.path.isfile(path):
                         zip_relative_path = os.path.relpath(pathlib.Path(path), pathlib.Path(root_dir))
-                        zf.write(path, zip_relative_path)
+                        zf.write(
+                            path,
+                            zip_relative_path,
+                            compress_type=_compress_type(path, compresslevel),
+                            compresslevel=compresslevel,
+                        )
                         if logger is not None:
                             logger.debug("adding '%s'", path)
 
@@ -152,12 +244,348 @@ def generate_dir(out_dir: str, dir: str, name: str) -> str:
     return final_dir
 
 
+def _bundle_entries(
+    dirs: Optional[List[Tuple[str, str]]] = None, files: Optional[List[Tuple[str, str]]] = None
+) -> Dict[str, str]:
+    """Map each path in the bundle (relative to the bundle root) to the source file it is read from
+
+    Mirrors the staging order of ``generate_bundle``: resource scripts, then directories (replacing anything
+    already under the same name), then individual files (overwriting whatever is at the same path).
+    """
+    entries: Dict[str, str] = {name: os.path.join(CLI_ROOT, "resources", name) for name in BUNDLE_RESOURCE_FILES}
+
+    if dirs is not None:
+        for dir, name in dirs:
+            absolute_dir = os.path.realpath(dir)
+            dir_files = _list_files(path=absolute_dir)
+            if len(dir_files) == 0:
+                raise ValueError(f"{name} ({absolute_dir}) is empty!")
+            prefix = os.path.normpath(name)
+            for path in [p for p in entries if p == prefix or p.startswith(prefix + "/")]:
+                del entries[path]
+            for file in dir_files:
+                relpath = pathlib.Path(os.path.relpath(file, absolute_dir)).as_posix()
+                entries[os.path.normpath(os.path.join(prefix, relpath))] = file
+
+    if files is not None:
+        for src_file, name in files:
+            entries[os.path.normpath(name)] = src_file
+
+    return entries
+
+
+def _bundle_date_time() -> Tuple[int, int, int, int, int, int]:
+    # SOURCE_DATE_EPOCH (https://reproducible-builds.org/specs/source-date-epoch/) when set, otherwise the
+    # earliest timestamp a zip entry can hold
+    epoch = os.environ.get("SOURCE_DATE_EPOCH", "")
+    if epoch.isdigit():
+        return max(time.gmtime(int(epoch))[:6], ZIP_EPOCH)
+    return ZIP_EPOCH
+
+
+# Deflate level of an entry opened for writing, the ZipInfo attribute is public from Python 3.13
+_ZIPINFO_COMPRESS_LEVEL = "compress_level" if sys.version_info >= (3, 13) else "_compresslevel"
+
+
+def _file_mode(path: str) -> int:
+    return 0o755 if os.stat(path).st_mode & 0o111 else 0o644
+
+
+def _write_zipfile(
+    zip_filename: str,
+    base_dir: str,
+    entries: Dict[str, str],
+    compresslevel: int = BUNDLE_DEFAULT_COMPRESSION_LEVEL,
+    members: Optional[Dict[str, bytes]] = None,
+) -> str:
+    """Write ``entries`` into ``zip_filename`` under ``base_dir``, reading each file from its source path
+
+    Directory entries are added for every parent of a file so the archive extracts to the same layout
+    ``_make_zipfile`` produces from a staged directory.
+
+    The archive is reproducible: the same files and compression level always produce the same bytes. Entries
+    are sorted, every entry gets the same timestamp, and permissions are normalized to 755 for directories
+    and executables and 644 for other files. ``members`` are added at the root of the archive, outside
+    ``base_dir``.
+    """
+    dir_names = {base_dir}
+    for path in entries:
+        parent = os.path.dirname(path)
+        while parent:
+            dir_names.add(f"{base_dir}/{parent}")
+            parent = os.path.dirname(parent)
+
+    date_time = _bundle_date_time()
+    with zipfile.ZipFile(zip_filename, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for dir_name in sorted(dir_names):
+            dir_info = zipfile.ZipInfo(f"{dir_name}/", date_time=date_time)
+            dir_info.create_system = 3
+            dir_info.external_attr = ((stat.S_IFDIR | 0o755) << 16) | 0x10
+            zf.writestr(dir_info, b"")
+        for path in sorted(entries):
+            src = entries[path]
+            _logger.debug("adding '%s' as '%s/%s'", src, base_dir, path)
+            file_info = zipfile.ZipInfo(f"{base_dir}/{path}", date_time=date_time)
+            file_info.create_system = 3
+            file_info.external_attr = (stat.S_IFREG | _file_mode(src)) << 16
+            file_info.compress_type = _compress_type(src, compresslevel)
+            setattr(file_info, _ZIPINFO_COMPRESS_LEVEL, compresslevel)
+            file_info.file_size = os.stat(src).st_size
+            # Copied in chunks, so large data files never have to fit in memory
+            with open(src, "rb") as fsrc, zf.open(file_info, "w") as fdst:
+                shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+        for name, data in sorted((members or {}).items()):
+            member_info = zipfile.ZipInfo(name, date_time=date_time)
+            member_info.create_system = 3
+            member_info.external_attr = (stat.S_IFREG | 0o644) << 16
+            member_info.compress_type = zipfile.ZIP_DEFLATED
+            zf.writestr(member_info, data)
+
+    return zip_filename
+
+
+def stream_bundle(
+    dirs: Optional[List[Tuple[str, str]]] = None,
+    files: Optional[List[Tuple[str, str]]] = None,
+    bundle_id: Optional[str] = None,
+    path_override: Optional[str] = None,
+    compresslevel: int = BUNDLE_DEFAULT_COMPRESSION_LEVEL,
+) -> str:
+    """Create the bundle zip reading every file straight from its original path
+
+    Produces the same archive layout as ``generate_bundle`` without materializing the staging directory,
+    so each source file is read once and the only file written is the zip itself.
+
+    Parameters
+    ----------
+    dirs : Optional[List[Tuple[str, str]]], optional
+        Directories to add as (source directory, name in the bundle), by default None
+    files : Optional[List[Tuple[str, str]]], optional
+        Files to add as (source file, path in the bundle), by default None
+    bundle_id : Optional[str], optional
+        Name of the output directory the zip is written to, by default None
+    path_override : Optional[str], optional
+        Use instead of the .seedfarmer.out output directory, by default None
+    compresslevel : int, optional
+        Deflate level (1-9) for compressible files, 0 stores every file, by default 6
+
+    Returns
+    -------
+    str
+        The path to the bundle zip
+    """
+    out_dir = os.path.join(os.getcwd(), path_override if path_override else ".seedfarmer.out", bundle_id or "")
+    os.makedirs(out_dir, exist_ok=True)
+    # Drop any staging directory left behind by an earlier generate_bundle
+    shutil.rmtree(os.path.join(out_dir, "bundle"), ignore_errors=True)
+
+    _logger.debug(f"stream_bundle dirs={dirs}")
+    entries = _bundle_entries(dirs=dirs, files=files)
+    _logger.debug("files:\n%s", pformat(entries))
+
+    zip_filename = os.path.join(out_dir, "bundle.zip")
+    _logger.info("creating '%s'", zip_filename)
+    return _write_zipfile(zip_filename=zip_filename, base_dir="bundle", entries=entries, compresslevel=compresslevel)
+
+
+def delta_bundle(
+    base: Optional[str],
+    base_manifest: Optional[Dict[str, Any]],
+    dirs: Optional[List[Tuple[str, str]]] = None,
+    files: Optional[List[Tuple[str, str]]] = None,
+    bundle_id: Optional[str] = None,
+    compresslevel: int = BUNDLE_DEFAULT_COMPRESSION_LEVEL,
+) -> str:
+    """Create a bundle zip holding only the files changed since the last deployed bundle
+
+    Every file of the bundle is listed with its digest and mode in ``bundle-manifest.json`` at the root of
+    the zip, which ``seedfarmer bundle store`` keeps next to the stored bundle. When the manifest of the last
+    deployed bundle is available, only new or changed files are added along with ``bundle-delta.json`` and
+    the ``apply_bundle_delta.py`` script, which rebuilds the full bundle from ``base`` at the start of the
+    build. Otherwise the full bundle is written.
+
+    Parameters
+    ----------
+    base : Optional[str]
+        The s3:// path of the last deployed bundle, None if there is none
+    base_manifest : Optional[Dict[str, Any]]
+        The manifest stored with the last deployed bundle, None if there is none
+    dirs : Optional[List[Tuple[str, str]]], optional
+        Directories to add as (source directory, name in the bundle), by default None
+    files : Optional[List[Tuple[str, str]]], optional
+        Files to add as (source file, path in the bundle), by default None
+    bundle_id : Optional[str], optional
+        Name of the output directory the zip is written to, by default None
+    compresslevel : int, optional
+        Deflate level (1-9) for compressible files, 0 stores every file, by default 6
+
+    Returns
+    -------
+    str
+        The path to the bundle zip
+    """
+    out_dir = os.path.join(os.getcwd(), ".seedfarmer.out", bundle_id or "")
+    os.makedirs(out_dir, exist_ok=True)
+
+    entries = _bundle_entries(dirs=dirs, files=files)
+    manifest = {
+        path: [checksum.get_file_digest(src, checksum.DIGEST_ALGORITHM_BLAKE2B), _file_mode(src)]
+        for path, src in entries.items()
+    }
+    members = {BUNDLE_MANIFEST_FILE: json.dumps({"version": 1, "files": manifest}, sort_keys=True).encode("utf-8")}
+
+    if base and base_manifest and base_manifest.get("version") == 1:
+        base_files = base_manifest.get("files", {})
+        changed = {path: src for path, src in entries.items() if base_files.get(path) != manifest[path]}
+        _logger.info("Delta bundle for %s: %d of %d files changed", bundle_id, len(changed), len(entries))
+        entries = changed
+        members[BUNDLE_DELTA_FILE] = json.dumps({"version": 1, "base": base}).encode("utf-8")
+        with open(os.path.join(CLI_ROOT, "resources", BUNDLE_DELTA_SCRIPT), "rb") as f:
+            members[BUNDLE_DELTA_SCRIPT] = f.read()
+    else:
+        _logger.info("No manifest stored with the last deployed bundle of %s, uploading the full bundle", bundle_id)
+
+    return _write_zipfile(
+        zip_filename=os.path.join(out_dir, "bundle.zip"),
+        base_dir="bundle",
+        entries=entries,
+        compresslevel=compresslevel,
+        members=members,
+    )
+
+
+def _bundle_cache_key(
+    bundle_md5: str, entries: Dict[str, str], dirs: Optional[List[Tuple[str, str]]], compresslevel: int
+) -> str:
+    # bundle_md5 leaves out files that are still bundled (README.md, setup.cfg, gitignored files...), so every
+    # entry written to the zip is hashed along with its mode and the layout, the hash cache avoids re-reading
+    # unchanged files
+    dir_names = {os.path.normpath(name) for _, name in dirs or []}
+    paths = sorted(entries)
+    digests = checksum.get_file_digests([entries[path] for path in paths], checksum.DIGEST_ALGORITHM_BLAKE2B)
+    key_data = {
+        "bundle": bundle_md5,
+        "compresslevel": compresslevel,
+        "dirs": sorted(dir_names),
+        "files": {path: [digest, _file_mode(entries[path])] for path, digest in zip(paths, digests)},
+    }
+    return checksum.get_digest(
+        json.dumps(key_data, sort_keys=True).encode("utf-8"), checksum.DIGEST_ALGORITHM_BLAKE2B
+    ).replace(":", "-")
+
+
+def get_cached_bundle_digest(zip_filename: str) -> Optional[str]:
+    """Get the digest of a bundle from the local bundle cache without reading it
+
+    Cached bundles are reproducible and named by the digest of everything written to them, which identifies
+    the zip as well as a digest of its bytes.
+
+    Parameters
+    ----------
+    zip_filename : str
+        The path to the bundle zip
+
+    Returns
+    -------
+    Optional[str]
+        The tagged digest of the bundle, None if it is not a cached bundle
+    """
+    cache_dir = os.path.join(os.getcwd(), BUNDLE_CACHE_DIR)
+    name = os.path.basename(zip_filename)
+    if os.path.dirname(os.path.abspath(zip_filename)) != cache_dir or not name.endswith(".zip"):
+        return None
+    return name[: -len(".zip")].replace("-", ":", 1)
+
+
+def _evict_cached_bundles(cache_dir: str, max_size: int) -> None:
+    bundles = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".zip") and entry.is_file():
+            stat = entry.stat()
+            bundles.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+    total_size = sum(size for _, size, _ in bundles)
+    for _, size, path in sorted(bundles):
+        if total_size <= max_size:
+            break
+        with _cached_bundles_guard:
+            if path in _cached_bundles_in_use:
+                continue
+            _logger.debug("evicting cached bundle %s", path)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+        total_size -= size
+
+
+def cached_bundle(
+    bundle_md5: str,
+    max_size: int,
+    dirs: Optional[List[Tuple[str, str]]] = None,
+    files: Optional[List[Tuple[str, str]]] = None,
+    compresslevel: int = BUNDLE_DEFAULT_COMPRESSION_LEVEL,
+) -> str:
+    """Get the bundle zip from the local content-addressed bundle cache, creating it on a miss
+
+    Bundles are stored in ``.seedfarmer.out/bundles`` keyed by the module bundle checksum and the content of
+    every file in the bundle, so the same module deployed again (a re-run apply, another target account, another
+    deployment using the same source) reuses the zip. The least recently used bundles are evicted once the
+    cache grows past ``max_size``.
+
+    Parameters
+    ----------
+    bundle_md5 : str
+        The module bundle checksum, covering the module directory and its data files
+    max_size : int
+        Maximum total size of the cached bundles in bytes
+    dirs : Optional[List[Tuple[str, str]]], optional
+        Directories to add as (source directory, name in the bundle), by default None
+    files : Optional[List[Tuple[str, str]]], optional
+        Files to add as (source file, path in the bundle), by default None
+    compresslevel : int, optional
+        Deflate level (1-9) for compressible files, 0 stores every file, by default 6
+
+    Returns
+    -------
+    str
+        The path to the cached bundle zip
+    """
+    entries = _bundle_entries(dirs=dirs, files=files)
+    cache_dir = os.path.join(os.getcwd(), BUNDLE_CACHE_DIR)
+    os.makedirs(cache_dir, exist_ok=True)
+    zip_filename = os.path.join(cache_dir, f"{_bundle_cache_key(bundle_md5, entries, dirs, compresslevel)}.zip")
+
+    with get_path_lock(zip_filename):
+        with _cached_bundles_guard:
+            _cached_bundles_in_use.add(zip_filename)
+        if os.path.isfile(zip_filename):
+            _logger.info("reusing cached bundle '%s'", zip_filename)
+            os.utime(zip_filename)
+        else:
+            _logger.info("creating cached bundle '%s'", zip_filename)
+            fd, tmp_filename = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+            os.close(fd)
+            try:
+                _write_zipfile(
+                    zip_filename=tmp_filename, base_dir="bundle", entries=entries, compresslevel=compresslevel
+                )
+                os.replace(tmp_filename, zip_filename)
+            except Exception:
+                os.remove(tmp_filename)
+                raise
+
+    _evict_cached_bundles(cache_dir=cache_dir, max_size=max_size)
+    return zip_filename
+
+
 def generate_bundle(
     # fn_args: Dict[str, Any],
     dirs: Optional[List[Tuple[str, str]]] = None,
     files: Optional[List[Tuple[str, str]]] = None,
     bundle_id: Optional[str] = None,
     path_override: Optional[str] = None,
+    archive: bool = True,
 ) -> str:
     bundle_dir = (
         create_output_dir(f"{bundle_id}/bundle", path_override)
@@ -204,6 +632,9 @@ def generate_bundle(
     files_glob = glob.glob(bundle_dir + "/**", recursive=True)
     _logger.debug("files:\n%s", pformat(files_glob))
 
+    if not archive:
+        return bundle_dir
+
     zip_file = _make_zipfile(base_name=bundle_dir, root_dir=remote_dir, base_dir="bundle", logger=_logger)
     return zip_file
 
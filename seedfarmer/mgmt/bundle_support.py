@@ -13,8 +13,10 @@
 #    limitations under the License.
 
 
+import json
 import logging
-from typing import Optional
+import os
+from typing import Any, Dict, Optional, cast
 
 from boto3 import Session
 
@@ -25,6 +27,8 @@ _logger: logging.Logger = logging.getLogger(__name__)
 
 
 BUNDLE_PREFIX = "bundle"
+BUNDLE_DIGEST_METADATA = "seedfarmer-digest"
+BUNDLE_MANIFEST_KEY = "bundle-manifest.json"
 
 
 class BundleS3Support:
@@ -32,6 +36,7 @@ class BundleS3Support:
     seedkit_key: Optional[str] = None  # NEEDED This is for the seedkit along wih seedfarmer_bucket
     seedfarmer_bucket: Optional[str] = None
     seedfarmer_key: Optional[str] = None
+    seedfarmer_manifest_key: Optional[str] = None
 
     def __init__(
         self, deployment: str, group: str, module: str, bucket: str, bundle_src_path: Optional[str] = None
@@ -40,6 +45,7 @@ class BundleS3Support:
         self.ops_root_path = config.OPS_ROOT
         self.seedfarmer_bucket = bucket
         self.seedfarmer_key = f"{BUNDLE_PREFIX}/{deployment}/{group}/{module}/bundle.zip"
+        self.seedfarmer_manifest_key = f"{BUNDLE_PREFIX}/{deployment}/{group}/{module}/{BUNDLE_MANIFEST_KEY}"
 
         if bundle_src_path is not None:
             o = bundle_src_path.split("/", 1)
@@ -47,13 +53,46 @@ class BundleS3Support:
             self.seedkit_key = o[1]
 
 
+def _get_bundle_digest(bucket: str, key: str, session: Optional[Session] = None) -> Optional[str]:
+    head = s3.head_object(bucket=bucket, key=key, session=session)
+    return cast(Optional[str], head.get("Metadata", {}).get(BUNDLE_DIGEST_METADATA)) if head else None
+
+
+def _store_manifest(bundle: BundleS3Support, manifest_file: Optional[str], session: Optional[Session]) -> None:
+    if manifest_file and os.path.isfile(manifest_file):
+        s3.upload_file(
+            src=manifest_file,
+            bucket=str(bundle.seedfarmer_bucket),
+            key=str(bundle.seedfarmer_manifest_key),
+            session=session,
+        )
+
+
 def copy_bundle_to_sf(
-    deployment: str, group: str, module: str, bucket: str, bundle_src_path: str, session: Optional[Session] = None
+    deployment: str,
+    group: str,
+    module: str,
+    bucket: str,
+    bundle_src_path: str,
+    session: Optional[Session] = None,
+    manifest_file: Optional[str] = None,
 ) -> None:
     bundle = BundleS3Support(
         deployment=deployment, group=group, module=module, bucket=bucket, bundle_src_path=bundle_src_path
     )
     try:
+        # Bundles are uploaded with the digest of the (reproducible) zip, skip the copy if it is already stored
+        src_digest = _get_bundle_digest(bucket=str(bundle.seedkit_bucket), key=str(bundle.seedkit_key), session=session)
+        if src_digest is not None and src_digest == _get_bundle_digest(
+            bucket=str(bundle.seedfarmer_bucket), key=str(bundle.seedfarmer_key), session=session
+        ):
+            _logger.info("The bundle stored for %s-%s-%s is unchanged, skipping the copy", deployment, group, module)
+            _store_manifest(bundle=bundle, manifest_file=manifest_file, session=session)
+            return
+        # A manifest stored with a previous bundle no longer describes the copied one
+        s3.delete_objects(
+            bucket=str(bundle.seedfarmer_bucket), keys=[str(bundle.seedfarmer_manifest_key)], session=session
+        )
         s3.copy_s3_object(
             src_bucket=str(bundle.seedkit_bucket),
             src_key=str(bundle.seedkit_key),
@@ -61,10 +100,52 @@ def copy_bundle_to_sf(
             dest_key=str(bundle.seedfarmer_key),
             session=session,
         )
+        _store_manifest(bundle=bundle, manifest_file=manifest_file, session=session)
     except Exception as e:
         _logger.info("Cannot copy the bundle to S3 - %s", e)
 
 
+def store_bundle_in_sf(
+    deployment: str,
+    group: str,
+    module: str,
+    bucket: str,
+    bundle_file: str,
+    manifest_file: Optional[str] = None,
+    session: Optional[Session] = None,
+) -> None:
+    bundle = BundleS3Support(deployment=deployment, group=group, module=module, bucket=bucket)
+    try:
+        # The manifest is removed first and uploaded last so it never describes another bundle than the stored one
+        s3.delete_objects(
+            bucket=str(bundle.seedfarmer_bucket), keys=[str(bundle.seedfarmer_manifest_key)], session=session
+        )
+        s3.upload_file(
+            src=bundle_file, bucket=str(bundle.seedfarmer_bucket), key=str(bundle.seedfarmer_key), session=session
+        )
+        _store_manifest(bundle=bundle, manifest_file=manifest_file, session=session)
+    except Exception as e:
+        _logger.info("Cannot store the bundle in S3 - %s", e)
+
+
+def get_bundle_manifest(
+    deployment: str,
+    group: str,
+    module: str,
+    bucket: str,
+    session: Optional[Session] = None,
+) -> Optional[Dict[str, Any]]:
+    bundle = BundleS3Support(deployment=deployment, group=group, module=module, bucket=bucket)
+    try:
+        body = s3.get_object(
+            bucket=str(bundle.seedfarmer_bucket), key=str(bundle.seedfarmer_manifest_key), session=session
+        )
+        return cast(Dict[str, Any], json.loads(body)) if body else None
+    except Exception as e:
+        _logger.info("Cannot fetch the bundle manifest from S3 - %s", e)
+        return None
+
+
 def get_bundle_sf_path(
     deployment: str,
     group: str,
@@ -84,7 +165,11 @@ def delete_bundle_from_sf(
 ) -> None:
     bundle = BundleS3Support(deployment=deployment, group=group, module=module, bucket=bucket)
     try:
-        s3.delete_objects(bucket=str(bundle.seedfarmer_bucket), keys=[str(bundle.seedfarmer_key)], session=session)
+        s3.delete_objects(
+            bucket=str(bundle.seedfarmer_bucket),
+            keys=[str(bundle.seedfarmer_key), str(bundle.seedfarmer_manifest_key)],
+            session=session,
+        )
     except Exception as e:
         _logger.info("Cannot delete the bundle from S3 - %s", e)
 
@@ -16,7 +16,7 @@ import concurrent.futures
 import logging
 import os
 from threading import Lock
-from typing import Any, Dict, List, Optional, Set, Tuple, cast
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, cast
 
 import yaml
 from boto3 import Session
@@ -270,6 +270,49 @@ def generate_dependency_maps(manifest: DeploymentManifest) -> Tuple[Dict[str, Li
     return module_depends_on, module_dependencies
 
 
+def generate_module_dag(
+    groups: List[ModulesManifest], module_upstream_dep: Dict[str, List[str]]
+) -> Dict[str, List[str]]:
+    """
+    Takes the ordered groups of modules to deploy and returns, for each module, the list of modules
+    in those groups that must complete before it can start.
+
+    A module that references the metadata of other modules waits only on the referenced modules that are
+    in earlier groups and scheduled in this deployment (references to modules that are not being deployed
+    are already satisfied).  A module that has no module metadata references falls back to group ordering
+    and waits on every module in the earlier groups.  Edges only ever point to earlier groups, so the
+    result is always acyclic.
+
+    Parameters
+    ----------
+    groups : List[ModulesManifest]
+        The groups of modules to deploy, in deployment order
+    module_upstream_dep : Dict[str, List[str]]
+        A dict containing all the upstream dependencies of a module.  Each key in the dict is a module name
+        with the format <group_name>-<module_name> and the value is a list of modules, each with the format
+        of <group_name>-<module_name>
+
+    Returns
+    -------
+    Dict[str, List[str]]
+        A dict, in deployment order, with the module (in form of `<group>-<module_name>`) as the key and
+        the list of modules (in form of `[<group>-<module_name>]`) it must wait on as the value
+    """
+    module_dag: Dict[str, List[str]] = {}
+    earlier_modules: List[str] = []
+    for group in groups:
+        group_modules = [f"{group.name}-{module.name}" for module in group.modules]
+        for group_module_name in group_modules:
+            if group_module_name in module_upstream_dep:
+                module_dag[group_module_name] = [
+                    upstream for upstream in module_upstream_dep[group_module_name] if upstream in earlier_modules
+                ]
+            else:
+                module_dag[group_module_name] = list(earlier_modules)
+        earlier_modules.extend(group_modules)
+    return module_dag
+
+
 def prepare_ssm_for_deploy(
     deployment_name: str, group_name: str, module_manifest: ModuleManifest, account_id: str, region: str
 ) -> None:
@@ -478,6 +521,7 @@ def need_to_build(
     module_upstream_dep: Dict[str, List[str]] = {},
     force_redeploy_flag: bool = False,
     deployment_params_cache: Optional[Dict[str, Any]] = None,
+    rehash: Optional[Dict[mi.ModuleConst, Callable[[str], str]]] = None,
 ) -> bool:
     """
     This will indicated whether a module needs to be rebuilt based on
@@ -503,6 +547,9 @@ def need_to_build(
         Defaults to False
     deployment_params_cache: Dict[str, Any]
         A cache of deployment commands
+    rehash: Dict[ModuleConst, Callable[[str], str]]
+        Functions regenerating each hash of the module with a given digest algorithm, used when
+        the deployed hashes were generated with a different algorithm
 
     Returns
     -------
@@ -538,6 +585,7 @@ def need_to_build(
             mi.ModuleConst.BUNDLE,
             deployment_params_cache,
             session=session,
+            rehash=rehash.get(mi.ModuleConst.BUNDLE) if rehash else None,
         )
         and mi.does_md5_match(
             deployment_name,
@@ -547,6 +595,7 @@ def need_to_build(
             mi.ModuleConst.DEPLOYSPEC,
             deployment_params_cache,
             session=session,
+            rehash=rehash.get(mi.ModuleConst.DEPLOYSPEC) if rehash else None,
         )
         and mi.does_md5_match(
             deployment_name,
@@ -556,6 +605,7 @@ def need_to_build(
             mi.ModuleConst.MANIFEST,
             deployment_params_cache,
             session=session,
+            rehash=rehash.get(mi.ModuleConst.MANIFEST) if rehash else None,
         )
     ):
         return False
@@ -9,6 +9,7 @@ from git import Repo
 import seedfarmer.messages as messages
 from seedfarmer import config
 from seedfarmer.errors import InvalidConfigurationError
+from seedfarmer.utils import get_path_lock
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
@@ -66,31 +67,32 @@ def clone_module_repo(git_path: str) -> Tuple[str, str, Optional[str]]:
     working_dir = os.path.join(
         config.OPS_ROOT, "seedfarmer.gitmodules", f"{repo_directory}_{ref.replace('/', '_')}" if ref else repo_directory
     )
-    os.makedirs(working_dir, exist_ok=True)
-    repo = None
-    if not os.listdir(working_dir):
-        if ref is not None:
-            _logger.debug("Creating local repo and setting remote: %s into %s: ref=%s ", git_path, working_dir, ref)
-            repo = Repo.init(working_dir)
-            try:
-                git.Remote.create(repo, "origin", git_path, allow_unsafe_protocols)
-                repo.remotes["origin"].pull(ref, allow_unsafe_protocols=allow_unsafe_protocols)
-            except git.GitError as ge:
-                raise InvalidConfigurationError(f"\n Cannot Clone Repo: {ge} {messages.git_error_support()}")
+    with get_path_lock(working_dir):
+        os.makedirs(working_dir, exist_ok=True)
+        repo = None
+        if not os.listdir(working_dir):
+            if ref is not None:
+                _logger.debug("Creating local repo and setting remote: %s into %s: ref=%s ", git_path, working_dir, ref)
+                repo = Repo.init(working_dir)
+                try:
+                    git.Remote.create(repo, "origin", git_path, allow_unsafe_protocols)
+                    repo.remotes["origin"].pull(ref, allow_unsafe_protocols=allow_unsafe_protocols)
+                except git.GitError as ge:
+                    raise InvalidConfigurationError(f"\n Cannot Clone Repo: {ge} {messages.git_error_support()}")
+            else:
+                _logger.debug("Cloning %s into %s: ref=%s depth=%s", git_path, working_dir, ref, depth)
+                try:
+                    repo = Repo.clone_from(
+                        git_path, working_dir, branch=ref, depth=depth, allow_unsafe_protocols=allow_unsafe_protocols
+                    )
+                except git.GitError as ge:
+                    raise InvalidConfigurationError(f"\n Cannot Clone Repo: {ge} {messages.git_error_support()}")
         else:
-            _logger.debug("Cloning %s into %s: ref=%s depth=%s", git_path, working_dir, ref, depth)
+            _logger.debug("Pulling existing repo %s at %s: ref=%s", git_path, working_dir, ref)
+            repo = Repo(working_dir)
             try:
-                repo = Repo.clone_from(
-                    git_path, working_dir, branch=ref, depth=depth, allow_unsafe_protocols=allow_unsafe_protocols
-                )
+                repo.remotes["origin"].pull(ref, allow_unsafe_protocols=allow_unsafe_protocols)
             except git.GitError as ge:
                 raise InvalidConfigurationError(f"\n Cannot Clone Repo: {ge} {messages.git_error_support()}")
-    else:
-        _logger.debug("Pulling existing repo %s at %s: ref=%s", git_path, working_dir, ref)
-        repo = Repo(working_dir)
-        try:
-            repo.remotes["origin"].pull(ref, allow_unsafe_protocols=allow_unsafe_protocols)
-        except git.GitError as ge:
-            raise InvalidConfigurationError(f"\n Cannot Clone Repo: {ge} {messages.git_error_support()}")
-    commit_hash = get_commit_hash(repo)
+        commit_hash = get_commit_hash(repo)
     return (working_dir, module_directory, commit_hash)
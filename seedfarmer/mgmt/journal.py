@@ -0,0 +1,268 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License").
+#    You may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Execution journal of `seedfarmer apply`, used by `seedfarmer apply --resume`.
+
+Each apply of a deployment starts a new JSON lines file under .seedfarmer.out/journal that is only ever
+appended to: the plan, the accounts primed, the CodeBuild builds started and the outcome of each module.
+An interrupted apply can then be resumed without priming the accounts again, re-attaching to the builds
+still running and skipping the modules already deployed from a bundle that is unchanged.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import seedfarmer.checksum as checksum
+from seedfarmer.models.deploy_responses import StatusType
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+JOURNAL_DIR = os.path.join(".seedfarmer.out", "journal")
+JOURNAL_VERSION = 1
+
+EVENT_PLAN = "plan"
+EVENT_RESUME = "resume"
+EVENT_ACCOUNT_PRIMED = "account_primed"
+EVENT_BUILD_STARTED = "build_started"
+EVENT_MODULE_COMPLETED = "module_completed"
+EVENT_COMPLETED = "completed"
+
+
+def get_journal_path(project_path: str, deployment_name: str) -> str:
+    return os.path.join(project_path, JOURNAL_DIR, f"{deployment_name}.jsonl")
+
+
+def get_manifest_digest(manifest: Dict[str, Any]) -> str:
+    """Digest of a deployment manifest, identifying the plan a journal was written for
+
+    Parameters
+    ----------
+    manifest : Dict[str, Any]
+        The dumped deployment manifest, with the modules of every group loaded
+
+    Returns
+    -------
+    str
+        The tagged blake2b digest of the manifest
+    """
+    return checksum.get_digest(
+        json.dumps(manifest, sort_keys=True, default=str).encode("utf-8"), checksum.DIGEST_ALGORITHM_BLAKE2B
+    )
+
+
+class JournalState:
+    """What an execution journal records, replayed from its events
+
+    Parameters
+    ----------
+    events : List[Dict[str, Any]]
+        The events of the journal, in the order they were written
+    """
+
+    def __init__(self, events: List[Dict[str, Any]]) -> None:
+        self.manifest_digest: Optional[str] = None
+        self.completed = False
+        self.primed_accounts: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        # The modules deployed, with the bundle md5 they were deployed from
+        self.deployed_modules: Dict[str, Optional[str]] = {}
+        self.running_builds: Dict[str, Dict[str, Any]] = {}
+        for event in events:
+            kind = event.get("event")
+            if kind == EVENT_PLAN:
+                self.manifest_digest = event.get("manifest_digest")
+            elif kind == EVENT_ACCOUNT_PRIMED:
+                self.primed_accounts[(event["account_id"], event["region"])] = event["seedkit_outputs"]
+            elif kind == EVENT_BUILD_STARTED:
+                self.running_builds[event["module"]] = event
+            elif kind == EVENT_MODULE_COMPLETED:
+                self.running_builds.pop(event["module"], None)
+                if event.get("status") == StatusType.SUCCESS.value:
+                    self.deployed_modules[event["module"]] = event.get("bundle_md5")
+            elif kind == EVENT_COMPLETED:
+                self.completed = True
+
+
+class ExecutionJournal:
+    """Append-only journal of an apply, one JSON object per line
+
+    Events are flushed to disk as they are recorded so that they survive the process being killed,
+    a last line cut short by a crash is ignored when the journal is loaded.
+
+    Parameters
+    ----------
+    path : str
+        The path of the journal file
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _append(self, event: str, **fields: Any) -> None:
+        line = json.dumps({"event": event, "time": round(time.time(), 3), **fields}, default=str).encode("utf-8")
+        with self._lock:
+            try:
+                with open(self.path, "ab+") as journal_file:
+                    # Terminate a line cut short by a crash instead of appending to it
+                    if journal_file.seek(0, os.SEEK_END) > 0:
+                        journal_file.seek(-1, os.SEEK_END)
+                        if journal_file.read(1) != b"\n":
+                            line = b"\n" + line
+                    journal_file.write(line + b"\n")
+                    journal_file.flush()
+                    os.fsync(journal_file.fileno())
+            except OSError as e:
+                _logger.warning("Cannot write the execution journal %s - %s", self.path, e)
+
+    def start(self, deployment_name: str, manifest_digest: str, modules: List[str]) -> None:
+        """Start a new journal for the plan of an apply, replacing the journal of the previous apply"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with self._lock:
+            open(self.path, "w", encoding="utf-8").close()
+        self._append(
+            EVENT_PLAN,
+            version=JOURNAL_VERSION,
+            deployment=deployment_name,
+            manifest_digest=manifest_digest,
+            modules=modules,
+        )
+
+    def resume(self) -> None:
+        self._append(EVENT_RESUME)
+
+    def account_primed(self, account_id: str, region: str, seedkit_outputs: Dict[str, Any]) -> None:
+        self._append(EVENT_ACCOUNT_PRIMED, account_id=account_id, region=region, seedkit_outputs=seedkit_outputs)
+
+    def build_started(
+        self,
+        module: str,
+        account_id: str,
+        region: str,
+        build_id: str,
+        stream_name_prefix: str,
+        log_file: str,
+        bundle_md5: Optional[str] = None,
+    ) -> None:
+        self._append(
+            EVENT_BUILD_STARTED,
+            module=module,
+            account_id=account_id,
+            region=region,
+            build_id=build_id,
+            stream_name_prefix=stream_name_prefix,
+            log_file=log_file,
+            bundle_md5=bundle_md5,
+        )
+
+    def build_started_callback(
+        self, module: str, account_id: str, region: str, bundle_md5: Optional[str] = None
+    ) -> Callable[[str, str, str], None]:
+        """Get the callback recording the build of a module once CodeBuild has started it
+
+        Parameters
+        ----------
+        module : str
+            The module, as <group_name>-<module_name>
+        account_id : str
+            The account the build runs in
+        region : str
+            The region the build runs in
+        bundle_md5 : Optional[str]
+            The bundle md5 of the module the build deploys
+
+        Returns
+        -------
+        Callable[[str, str, str], None]
+            Callback taking the build id, its log stream name prefix and the local log file
+        """
+
+        def _callback(build_id: str, stream_name_prefix: str, log_file: str) -> None:
+            self.build_started(
+                module=module,
+                account_id=account_id,
+                region=region,
+                build_id=build_id,
+                stream_name_prefix=stream_name_prefix,
+                log_file=log_file,
+                bundle_md5=bundle_md5,
+            )
+
+        return _callback
+
+    def module_completed(
+        self, module: str, status: str, build_id: Optional[str] = None, bundle_md5: Optional[str] = None
+    ) -> None:
+        self._append(EVENT_MODULE_COMPLETED, module=module, status=status, build_id=build_id, bundle_md5=bundle_md5)
+
+    def completed(self) -> None:
+        self._append(EVENT_COMPLETED)
+
+    def load(self) -> Optional[JournalState]:
+        """Replay the journal
+
+        Returns
+        -------
+        Optional[JournalState]
+            The state recorded by the journal, None if there is no journal
+        """
+        events: List[Dict[str, Any]] = []
+        try:
+            with open(self.path, encoding="utf-8") as journal_file:
+                for line in journal_file:
+                    try:
+                        events.append(json.loads(line))
+                    except ValueError:
+                        _logger.debug("Ignoring the incomplete line of the execution journal %s", self.path)
+        except FileNotFoundError:
+            return None
+        return JournalState(events)
+
+
+_execution_journal: Optional[ExecutionJournal] = None
+
+
+def get_execution_journal() -> Optional[ExecutionJournal]:
+    """
+    Get the journal of the apply in progress, if one is recorded
+
+    Returns
+    -------
+    Optional[ExecutionJournal]
+        The journal deployments record their builds and outcomes to
+    """
+    return _execution_journal
+
+
+@contextmanager
+def record_execution(journal: Optional[ExecutionJournal]) -> Iterator[Optional[ExecutionJournal]]:
+    """
+    Record the builds and module outcomes of the block to ``journal``, nothing is recorded when it is None
+
+    Parameters
+    ----------
+    journal : Optional[ExecutionJournal]
+        The journal of the apply
+    """
+    global _execution_journal
+    _execution_journal = journal
+    try:
+        yield journal
+    finally:
+        _execution_journal = None
@@ -17,10 +17,11 @@ import logging
 import os
 import sys
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from boto3 import Session
 
+import seedfarmer.checksum as checksum
 import seedfarmer.errors
 from seedfarmer import config
 from seedfarmer.services import _secrets_manager as secrets
@@ -412,6 +413,7 @@ def does_md5_match(
     type: ModuleConst,
     deployment_params_cache: Optional[Dict[str, Any]] = None,
     session: Optional[Session] = None,
+    rehash: Optional[Callable[[str], str]] = None,
 ) -> bool:
     """
     does_md5_match
@@ -433,6 +435,9 @@ def does_md5_match(
         A populated dict with the key  of the parameter stored and its value
     session: Session, optional
         The boto3.Session to use to for SSM Parameter queries, default None
+    rehash: Callable[[str], str], optional
+        Regenerates the hash with a given digest algorithm.  If provided and the deployed hash was generated
+        with a different algorithm, the hash is regenerated with that algorithm before comparing, default None
 
     Returns
     -------
@@ -446,7 +451,20 @@ def does_md5_match(
         p = deployment_params_cache[name] if name in deployment_params_cache.keys() else None
     if not p:
         return False
-    elif hash != p["hash"]:
+    elif checksum.get_digest_mode(hash) != checksum.get_digest_mode(p["hash"]):
+        _logger.debug("The checksum mode of %s changed, treating it as changed", name)
+        return False
+
+    deployed_algorithm = checksum.get_digest_algorithm(p["hash"])
+    if rehash and deployed_algorithm != checksum.get_digest_algorithm(hash):
+        _logger.debug("Regenerating the hash of %s with the deployed %s algorithm", name, deployed_algorithm)
+        try:
+            hash = rehash(deployed_algorithm)
+        except seedfarmer.errors.InvalidConfigurationError as e:
+            _logger.debug("Unable to regenerate the hash of %s, treating it as changed: %s", name, e)
+            return False
+
+    if hash != p["hash"]:
         return False
     else:
         return True
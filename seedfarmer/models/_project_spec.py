@@ -32,6 +32,17 @@ class ProjectSpec(CamelModel):
     project_policy_path: Optional[str] = None
     seedfarmer_version: Optional[Union[int, str]] = None
     manifest_validation_fail_on_unknown_fields: bool = False
+    checksum_workers: int = 8
+    checksum_mode: str = "content"
+    checksum_algorithm: str = "md5"
+    bundle_cache_size: int = 2048
+    bundle_upload_mode: str = "execution"
+    bundle_compression_level: int = 6
+    upload_max_pool_connections: int = 50
+    upload_max_concurrency: Optional[int] = None
+    upload_multipart_threshold: int = 8
+    upload_multipart_chunksize: int = 8
+    service_quota_discovery: bool = False
 
     @model_validator(mode="after")
     def check_for_extra_fields(self) -> "ProjectSpec":
@@ -39,3 +50,58 @@ class ProjectSpec(CamelModel):
             raise InvalidManifestError(f"The following keys are not allowed: {self.model_extra}")
 
         return self
+
+    @model_validator(mode="after")
+    def check_checksum_workers(self) -> "ProjectSpec":
+        if self.checksum_workers < 1:
+            raise InvalidManifestError("checksumWorkers must be at least 1")
+
+        return self
+
+    @model_validator(mode="after")
+    def check_checksum_mode(self) -> "ProjectSpec":
+        if self.checksum_mode not in ["content", "git-index"]:
+            raise InvalidManifestError("checksumMode must be one of: content, git-index")
+
+        return self
+
+    @model_validator(mode="after")
+    def check_checksum_algorithm(self) -> "ProjectSpec":
+        if self.checksum_algorithm not in ["md5", "blake2b", "xxh3"]:
+            raise InvalidManifestError("checksumAlgorithm must be one of: md5, blake2b, xxh3")
+
+        return self
+
+    @model_validator(mode="after")
+    def check_bundle_cache_size(self) -> "ProjectSpec":
+        if self.bundle_cache_size < 0:
+            raise InvalidManifestError("bundleCacheSize must be 0 (disabled) or a positive number of MiB")
+
+        return self
+
+    @model_validator(mode="after")
+    def check_bundle_upload_mode(self) -> "ProjectSpec":
+        if self.bundle_upload_mode not in ["execution", "content", "delta"]:
+            raise InvalidManifestError("bundleUploadMode must be one of: execution, content, delta")
+
+        return self
+
+    @model_validator(mode="after")
+    def check_bundle_compression_level(self) -> "ProjectSpec":
+        if not 0 <= self.bundle_compression_level <= 9:
+            raise InvalidManifestError("bundleCompressionLevel must be between 0 (store) and 9")
+
+        return self
+
+    @model_validator(mode="after")
+    def check_upload_settings(self) -> "ProjectSpec":
+        if self.upload_max_pool_connections < 1:
+            raise InvalidManifestError("uploadMaxPoolConnections must be at least 1")
+        if self.upload_max_concurrency is not None and self.upload_max_concurrency < 1:
+            raise InvalidManifestError("uploadMaxConcurrency must be at least 1")
+        if self.upload_multipart_threshold < 5:
+            raise InvalidManifestError("uploadMultipartThreshold must be at least 5 (MiB)")
+        if self.upload_multipart_chunksize < 5:
+            raise InvalidManifestError("uploadMultipartChunksize must be at least 5 (MiB)")
+
+        return self
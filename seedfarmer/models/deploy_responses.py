@@ -24,6 +24,7 @@ from seedfarmer.utils import generate_codebuild_url
 class StatusType(Enum):
     SUCCESS = "SUCCESS"
     ERROR = "ERROR"
+    CANCELLED = "CANCELLED"
 
 
 class CodeBuildMetadata(CamelModel):
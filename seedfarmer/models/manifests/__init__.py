@@ -13,6 +13,7 @@
 #    limitations under the License.
 
 from seedfarmer.models.manifests._deployment_manifest import (
+    ConcurrencyLimits,
     DeploymentManifest,
     ModulesManifest,
     NameGenerator,
@@ -23,6 +24,7 @@ from seedfarmer.models.manifests._deployment_manifest import (
 from seedfarmer.models.manifests._module_manifest import DataFile, ModuleManifest, ModuleParameter
 
 __all__ = [
+    "ConcurrencyLimits",
     "DeploymentManifest",
     "ModulesManifest",
     "NameGenerator",
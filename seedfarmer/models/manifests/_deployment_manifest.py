@@ -15,7 +15,7 @@
 import os
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
-from pydantic import PrivateAttr
+from pydantic import PrivateAttr, model_validator
 
 import seedfarmer.errors
 from seedfarmer.models._base import CamelModel, ValueFromRef
@@ -46,6 +46,24 @@ class NetworkMapping(CamelModel):
     security_group_ids: Optional[Union[List[str], ValueFromRef]] = None
 
 
+class ConcurrencyLimits(CamelModel):
+    """
+    ConcurrencyLimits
+    This class provides the maximum number of concurrent builds and module stack deployments
+    in a target account and region
+    """
+
+    codebuild: Optional[int] = None
+    cloudformation: Optional[int] = None
+
+    @model_validator(mode="after")
+    def check_limits(self) -> "ConcurrencyLimits":
+        for name, limit in [("codebuild", self.codebuild), ("cloudformation", self.cloudformation)]:
+            if limit is not None and limit < 1:
+                raise seedfarmer.errors.InvalidManifestError(f"concurrencyLimits.{name} must be at least 1")
+        return self
+
+
 class RegionMapping(CamelModel):
     """
     RegionMapping
@@ -66,6 +84,7 @@ class RegionMapping(CamelModel):
     seedfarmer_artifact_bucket: Optional[str] = None
     role_prefix: Optional[str] = None
     policy_prefix: Optional[str] = None
+    concurrency_limits: Optional[ConcurrencyLimits] = None
 
 
 class TargetAccountMapping(CamelModel):
@@ -89,6 +108,7 @@ class TargetAccountMapping(CamelModel):
     _region_index: Dict[str, RegionMapping] = PrivateAttr(default_factory=dict)
     role_prefix: Optional[str] = None
     policy_prefix: Optional[str] = None
+    concurrency_limits: Optional[ConcurrencyLimits] = None
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -351,6 +371,42 @@ class DeploymentManifest(CamelModel):
         else:
             return None
 
+    def get_region_concurrency_limits(
+        self,
+        *,
+        account_alias: Optional[str] = None,
+        account_id: Optional[str] = None,
+        region: Optional[str] = None,
+    ) -> Dict[str, Optional[int]]:
+        if account_alias is not None and account_id is not None:
+            raise seedfarmer.errors.InvalidManifestError("Only one of 'account_alias' and 'account_id' is allowed")
+
+        use_default_account = account_alias is None and account_id is None
+        use_default_region = region is None
+
+        for target_account in self.target_account_mappings:
+            if (
+                account_alias == target_account.alias
+                or account_id == target_account.actual_account_id
+                or (use_default_account and target_account.default)
+            ):
+                for region_mapping in target_account.region_mappings:
+                    if region == region_mapping.region or (use_default_region and region_mapping.default):
+                        # Each limit set on the region overrides the one set on the account
+                        account_limits = (
+                            target_account.concurrency_limits.model_dump() if target_account.concurrency_limits else {}
+                        )
+                        region_limits = (
+                            region_mapping.concurrency_limits.model_dump() if region_mapping.concurrency_limits else {}
+                        )
+                        return {
+                            service: region_limits.get(service)
+                            if region_limits.get(service) is not None
+                            else account_limits.get(service)
+                            for service in ConcurrencyLimits.model_fields
+                        }
+        return {service: None for service in ConcurrencyLimits.model_fields}
+
     def get_region_npm_mirror(
         self,
         *,
@@ -1,5 +1,8 @@
+import threading
 from typing import Any, Dict, List, Optional, cast
 
+from pydantic import ConfigDict, Field
+
 import seedfarmer.errors
 from seedfarmer.models._base import CamelModel
 from seedfarmer.models.manifests._deployment_manifest import DeploymentManifest
@@ -7,6 +10,8 @@ from seedfarmer.models.manifests._module_manifest import ModuleManifest, ModuleP
 
 
 class ModuleDeployObject(CamelModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
     deployment_manifest: DeploymentManifest
     group_name: Optional[str] = None
     module_name: Optional[str] = None
@@ -24,6 +29,10 @@ class ModuleDeployObject(CamelModel):
     pypi_mirror: Optional[str] = None
     pypi_mirror_secret: Optional[str] = None
     seedfarmer_bucket: Optional[str] = None
+    # Set when the other modules fail and this module's build should be stopped
+    cancel_event: Optional[threading.Event] = Field(default=None, exclude=True)
+    # Number of modules that may upload a bundle alongside this one, sharing the transfer connection pool
+    upload_concurrency: int = Field(default=1, exclude=True)
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
@@ -12,16 +12,30 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
-from typing import Any, Dict, List, Optional
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
+from rich.text import Text
 
 from seedfarmer.models.deploy_responses import ModuleDeploymentResponse
 from seedfarmer.models.manifests import DeploymentManifest
 
+if TYPE_CHECKING:
+    from seedfarmer.services._codebuild import BuildInfo
+
 console = Console(record=True)
 
+BUILD_PROGRESS_REFRESH_PER_SECOND = 4
+BUILD_PROGRESS_MAX_QUEUED_EVENTS = 10_000
+
 
 def print_deployment_inventory(description: str, dep: List[str], color: str = "yellow") -> None:
     """
@@ -223,3 +237,177 @@ def print_dependency_list(header_message: str, modules: List[str]) -> None:
     """
     console.print(f"[bold yellow] {header_message}")
     console.print(f"  [cyan]{modules} ")
+
+
+class _BuildProgressRow:
+    __slots__ = ("module", "phase", "started", "lines", "last_line")
+
+    def __init__(self, module: str) -> None:
+        self.module = module
+        self.phase = "SUBMITTED"
+        self.started = time.monotonic()
+        self.lines = 0
+        self.last_line = ""
+
+
+class BuildProgressView:
+    """
+    Live console view of the remote builds in flight, one row per module with its phase, elapsed time,
+    last log line and log throughput
+
+    Deployment threads only append events to a bounded deque (appends and pops are atomic, so no lock is
+    taken and the oldest events are dropped when the renderer falls behind). A single renderer thread drains
+    it and redraws the table at a fixed rate, so console output never slows down the builds. The log lines
+    of the modules in ``follow`` are also printed above the table.
+
+    Parameters
+    ----------
+    follow : Optional[List[str]], optional
+        The modules (<group_name>-<module_name>) whose log lines are printed, by default None
+    refresh_per_second : float, optional
+        The rate the table is redrawn at, by default 4
+    max_queued_events : int, optional
+        The number of events buffered between the deployment threads and the renderer, by default 10000
+    """
+
+    def __init__(
+        self,
+        follow: Optional[List[str]] = None,
+        refresh_per_second: float = BUILD_PROGRESS_REFRESH_PER_SECOND,
+        max_queued_events: int = BUILD_PROGRESS_MAX_QUEUED_EVENTS,
+    ) -> None:
+        self.follow = set(follow or [])
+        self.refresh_per_second = refresh_per_second
+        self._events: Deque[Tuple[str, str, str, str]] = deque(maxlen=max_queued_events)
+        self._rows: Dict[str, _BuildProgressRow] = {}
+        self._completed: Dict[str, str] = {}
+        self._stop = threading.Event()
+        self._renderer: Optional[threading.Thread] = None
+        self._live: Optional[Live] = None
+        self._log_streams: List[Tuple[logging.StreamHandler, Any]] = []  # type: ignore[type-arg]
+
+    def log_callback(self, module: str) -> Callable[[str], None]:
+        """Return the function a deployment thread calls with each log line of the build of ``module``"""
+        return lambda line: self._events.append((module, "log", line, ""))
+
+    def status_callback(self, module: str) -> Callable[["BuildInfo"], None]:
+        """Return the function a deployment thread calls with each status of the build of ``module``"""
+        return lambda build: self._events.append((module, "status", build.current_phase.value, build.status.value))
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                module, kind, value, status = self._events.popleft()
+            except IndexError:
+                return
+            row = self._rows.get(module)
+            if row is None:
+                if module in self._completed:
+                    continue
+                row = self._rows[module] = _BuildProgressRow(module)
+            if kind == "log":
+                row.lines += 1
+                row.last_line = value
+                if module in self.follow and self._live is not None:
+                    self._live.console.print(Text.assemble((f"[{module}] ", "cyan"), value), crop=False)
+            elif status != "IN_PROGRESS":
+                self._completed[module] = status
+                del self._rows[module]
+            else:
+                row.phase = value
+
+    def _render(self) -> Table:
+        failed = len([status for status in self._completed.values() if status != "SUCCEEDED"])
+        table = Table(
+            title=f"[bold yellow]Builds in progress: {len(self._rows)}",
+            caption=f"completed: {len(self._completed) - failed}  failed: {failed}",
+            title_justify="left",
+            caption_justify="left",
+        )
+        table.add_column("Module", justify="left", style="cyan", no_wrap=True)
+        table.add_column("Phase", justify="left", style="green", no_wrap=True)
+        table.add_column("Elapsed", justify="right", no_wrap=True)
+        table.add_column("Lines/s", justify="right", no_wrap=True)
+        table.add_column("Last Log Line", justify="left", no_wrap=True, overflow="ellipsis")
+        now = time.monotonic()
+        for row in sorted(self._rows.values(), key=lambda r: r.started):
+            elapsed = max(now - row.started, 1e-3)
+            table.add_row(
+                row.module,
+                row.phase,
+                f"{int(elapsed) // 60}:{int(elapsed) % 60:02d}",
+                f"{row.lines / elapsed:.1f}",
+                Text(row.last_line),
+            )
+        return table
+
+    def _render_loop(self) -> None:
+        while not self._stop.wait(1 / self.refresh_per_second):
+            self._drain()
+            live = self._live
+            if live is not None:
+                live.update(self._render(), refresh=True)
+
+    def __enter__(self) -> "BuildProgressView":
+        global _build_progress_view
+        stderr = sys.stderr
+        # Not the recording module console, the refreshes and log lines of a long apply would all be kept
+        self._live = Live(self._render(), console=Console(), auto_refresh=False, redirect_stderr=True)
+        self._live.start()
+        # Log records are printed above the table instead of through it
+        for handler in logging.getLogger().handlers:
+            if type(handler) is logging.StreamHandler and handler.stream is stderr:
+                self._log_streams.append((handler, handler.setStream(sys.stderr)))
+        self._renderer = threading.Thread(target=self._render_loop, name="BuildProgress", daemon=True)
+        self._renderer.start()
+        _build_progress_view = self
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        global _build_progress_view
+        _build_progress_view = None
+        self._stop.set()
+        if self._renderer is not None:
+            self._renderer.join()
+        self._drain()
+        for handler, stream in self._log_streams:
+            handler.setStream(stream)
+        self._log_streams = []
+        if self._live is not None:
+            self._live.update(self._render(), refresh=True)
+            self._live.stop()
+            self._live = None
+
+
+_build_progress_view: Optional[BuildProgressView] = None
+
+
+def get_build_progress_view() -> Optional[BuildProgressView]:
+    """
+    Get the live view of the remote builds in flight, if one is shown
+
+    Returns
+    -------
+    Optional[BuildProgressView]
+        The view remote deployments report their build status and log lines to
+    """
+    return _build_progress_view
+
+
+@contextmanager
+def show_build_progress(enabled: bool, follow: Optional[List[str]] = None) -> Iterator[Optional[BuildProgressView]]:
+    """
+    Show a live view of the remote builds started in the block when ``enabled``
+
+    Parameters
+    ----------
+    enabled : bool
+        Whether to show the view, nothing is shown otherwise
+    follow : Optional[List[str]], optional
+        The modules (<group_name>-<module_name>) whose log lines are also printed, by default None
+    """
+    if not enabled:
+        yield None
+        return
+    with BuildProgressView(follow=follow) as view:
+        yield view
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+"""
+Rebuild the full module bundle from a delta bundle at the start of a build.
+
+A delta bundle only holds the files that changed since the last deployed bundle, plus
+bundle-manifest.json (every file of the full bundle with its digest and mode) and
+bundle-delta.json (the S3 location of the last deployed bundle). The unchanged files
+are extracted from the last deployed bundle, the whole tree is verified against the
+manifest, and the full bundle is zipped to bundle-full.zip for `seedfarmer bundle store`.
+
+The script runs before the virtual environment is created, so it only uses the standard library
+and downloads the last deployed bundle with the AWS CLI.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import zipfile
+from typing import Any, Dict, List, Tuple
+
+MANIFEST_FILE = "bundle-manifest.json"
+DELTA_FILE = "bundle-delta.json"
+FULL_BUNDLE_FILE = "bundle-full.zip"
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+def _digest(path: str) -> str:
+    hash = hashlib.blake2b(digest_size=32)
+    with open(path, "rb") as fp:
+        for data in iter(lambda: fp.read(1024 * 1024), b""):
+            hash.update(data)
+    return f"blake2b:{hash.hexdigest()}"
+
+
+def _extract_unchanged(src_dir: str, base: str, files: Dict[str, List[Any]]) -> int:
+    missing = [path for path in files if not os.path.isfile(os.path.join(src_dir, "bundle", path))]
+    if not missing:
+        return 0
+    if shutil.which("aws") is None:
+        print("The AWS CLI is needed to download the last deployed bundle and is not installed in the build image")
+        print("Deploy again with bundleUploadMode other than 'delta' in seedfarmer.yaml to upload full bundles")
+        sys.exit(1)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        base_zip = os.path.join(tmp_dir, "base.zip")
+        subprocess.run(["aws", "s3", "cp", base, base_zip, "--only-show-errors"], check=True)
+        with zipfile.ZipFile(base_zip) as zf:
+            for path in missing:
+                zf.extract(f"bundle/{path}", src_dir)
+    return len(missing)
+
+
+def _write_full_bundle(src_dir: str, files: Dict[str, List[Any]]) -> None:
+    dir_names = {"bundle"}
+    for path in files:
+        parent = os.path.dirname(path)
+        while parent:
+            dir_names.add(f"bundle/{parent}")
+            parent = os.path.dirname(parent)
+    with zipfile.ZipFile(os.path.join(src_dir, FULL_BUNDLE_FILE), "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for dir_name in sorted(dir_names):
+            dir_info = zipfile.ZipInfo(f"{dir_name}/", date_time=ZIP_EPOCH)
+            dir_info.create_system = 3
+            dir_info.external_attr = ((stat.S_IFDIR | 0o755) << 16) | 0x10
+            zf.writestr(dir_info, b"")
+        for path in sorted(files):
+            file_info = zipfile.ZipInfo(f"bundle/{path}", date_time=ZIP_EPOCH)
+            file_info.create_system = 3
+            file_info.external_attr = (stat.S_IFREG | files[path][1]) << 16
+            file_info.compress_type = zipfile.ZIP_DEFLATED
+            with open(os.path.join(src_dir, "bundle", path), "rb") as fsrc, zf.open(file_info, "w") as fdst:
+                while True:
+                    data = fsrc.read(1024 * 1024)
+                    if not data:
+                        break
+                    fdst.write(data)
+
+
+def apply_delta(src_dir: str) -> Tuple[int, int]:
+    with open(os.path.join(src_dir, DELTA_FILE)) as f:
+        delta = json.load(f)
+    with open(os.path.join(src_dir, MANIFEST_FILE)) as f:
+        files: Dict[str, List[Any]] = json.load(f)["files"]
+
+    extracted = _extract_unchanged(src_dir=src_dir, base=delta["base"], files=files)
+
+    mismatched = [
+        path for path, (digest, _) in files.items() if _digest(os.path.join(src_dir, "bundle", path)) != digest
+    ]
+    if mismatched:
+        print(f"The last deployed bundle ({delta['base']}) does not match its manifest, these files differ:")
+        for path in mismatched:
+            print(f"  {path}")
+        print("Deploy again with bundleUploadMode other than 'delta' in seedfarmer.yaml to store a new full bundle")
+        sys.exit(1)
+    for path, (_, mode) in files.items():
+        os.chmod(os.path.join(src_dir, "bundle", path), mode)
+
+    _write_full_bundle(src_dir=src_dir, files=files)
+    return extracted, len(files)
+
+
+if __name__ == "__main__":
+    extracted, total = apply_delta(os.environ.get("CODEBUILD_SRC_DIR", os.getcwd()))
+    print(f"Bundle rebuilt from the last deployed bundle: {extracted} of {total} files unchanged")
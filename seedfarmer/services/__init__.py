@@ -15,9 +15,11 @@
 from seedfarmer.services._service_utils import (
     boto3_client,
     boto3_resource,
+    clear_client_cache,
     create_new_session,
     create_new_session_with_creds,
     get_botocore_config,
+    get_client_cache_stats,
     get_region,
     get_sts_identity_info,
 )
@@ -28,6 +30,8 @@ __all__ = [
     "get_region",
     "boto3_client",
     "boto3_resource",
+    "clear_client_cache",
+    "get_client_cache_stats",
     "create_new_session",
     "create_new_session_with_creds",
     "get_sts_identity_info",
@@ -12,13 +12,21 @@
 #    See the License for the specific language governing permissions and
 #    limitations under the License.
 
+import logging
+import os
 from datetime import datetime, timezone
-from typing import Callable, List, NamedTuple, Optional, Union
+from logging.handlers import RotatingFileHandler
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Union
 
 from boto3 import Session
 
 from seedfarmer.services._service_utils import boto3_client, try_it
 
+# Events read by one LogTailer.tail call, a chatty build is read over the following polls
+LOG_TAILER_MAX_EVENTS = 10_000
+LOG_FILE_MAX_BYTES = 10 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 3
+
 
 class CloudWatchEvent(NamedTuple):
     timestamp: datetime
@@ -129,3 +137,92 @@ def get_log_events(
         events=events,
         last_timestamp=events[-1].timestamp if events else None,
     )
+
+
+class LogTailer:
+    """Read the new events of a CloudWatch Logs stream on every call, keeping its position between calls
+
+    The ``nextForwardToken`` of the last page read is kept, so each call only fetches the events written
+    since the previous one, and events are yielded page by page instead of being collected. Events are also
+    written to a local, rotating, log file when ``log_file`` is set.
+
+    Parameters
+    ----------
+    group_name : str
+        Name of the CloudWatch Logs group
+    stream_name : str
+        Name of the CloudWatch Logs stream in the group
+    session: Optional[Union[Callable[[], Session], Session]], optional
+        Optional Session or function returning a Session to use for all boto3 operations, by default None
+    log_file : Optional[str], optional
+        Local file the events are appended to, by default None
+    max_events : int, optional
+        Maximum number of events read by one call of ``tail``, by default 10000
+    """
+
+    def __init__(
+        self,
+        group_name: str,
+        stream_name: str,
+        session: Optional[Union[Callable[[], Session], Session]] = None,
+        log_file: Optional[str] = None,
+        max_events: int = LOG_TAILER_MAX_EVENTS,
+    ) -> None:
+        self.group_name = group_name
+        self.stream_name = stream_name
+        self.session = session
+        self.max_events = max_events
+        self.next_token: Optional[str] = None
+        self._file_handler: Optional[RotatingFileHandler] = None
+        if log_file:
+            os.makedirs(os.path.dirname(log_file), exist_ok=True)
+            self._file_handler = RotatingFileHandler(
+                log_file, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUP_COUNT, encoding="utf-8"
+            )
+            self._file_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def tail(self) -> Iterator[CloudWatchEvent]:
+        """Read the events written since the previous call
+
+        Yields
+        -------
+        Iterator[CloudWatchEvent]
+            The new events, in the order they were written
+        """
+        client = boto3_client("logs", session=self.session)
+        read = 0
+        while read < self.max_events:
+            args: Dict[str, Any] = {
+                "logGroupName": self.group_name,
+                "logStreamName": self.stream_name,
+                "startFromHead": True,
+                "limit": min(self.max_events - read, 10_000),
+            }
+            if self.next_token is not None:
+                args["nextToken"] = self.next_token
+            response = client.get_log_events(**args)
+            events = response.get("events", [])
+            for event in events:
+                cloudwatch_event = CloudWatchEvent(
+                    timestamp=datetime.fromtimestamp(event["timestamp"] / 1000.0, tz=timezone.utc),
+                    message=str(event.get("message", "")),
+                )
+                self._write(cloudwatch_event)
+                read += 1
+                yield cloudwatch_event
+            # The forward token is returned unchanged once the end of the stream is reached
+            token = response.get("nextForwardToken")
+            reached_end = not events or token == self.next_token
+            self.next_token = token
+            if reached_end:
+                break
+
+    def _write(self, event: CloudWatchEvent) -> None:
+        if self._file_handler is not None:
+            message = event.message[:-1] if event.message.endswith("\n") else event.message
+            self._file_handler.emit(logging.makeLogRecord({"msg": f"{event.timestamp.isoformat()} {message}"}))
+
+    def close(self) -> None:
+        if self._file_handler is not None:
+            self._file_handler.close()
+            self._file_handler = None
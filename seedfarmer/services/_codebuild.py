@@ -14,10 +14,11 @@
 
 import io
 import logging
-import time
+import queue
+import threading
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Union, cast
+from typing import Any, Callable, Dict, Hashable, Iterable, List, NamedTuple, Optional, Union, cast
 
 import botocore.exceptions
 import yaml
@@ -29,6 +30,12 @@ from seedfarmer.utils import LiteralStr
 
 _logger: logging.Logger = logging.getLogger(__name__)
 _BUILD_WAIT_POLLING_DELAY: float = 5  # SECONDS
+_BUILD_WAIT_MAX_POLLING_DELAY: float = 60  # SECONDS, reached by backing off on throttling
+_BATCH_GET_BUILDS_MAX_IDS = 100
+_BATCH_GET_BUILDS_MAX_FAILURES = 5
+_THROTTLING_ERROR_CODES = ["ThrottlingException", "TooManyRequestsException", "RequestLimitExceeded"]
+# A waiting thread checks the poller is still alive when it gets no update for this long
+_BUILD_WAIT_UPDATE_TIMEOUT: float = 2 * _BUILD_WAIT_MAX_POLLING_DELAY  # SECONDS
 
 
 class BuildStatus(Enum):
@@ -225,7 +232,11 @@ def fetch_build_info(build_id: str, session: Optional[Union[Callable[[], Session
     )
     if not response["builds"]:
         raise RuntimeError(f"CodeBuild build {build_id} not found.")
-    build = response["builds"][0]
+    return _parse_build_info(build=response["builds"][0])
+
+
+def _parse_build_info(build: Dict[str, Any]) -> BuildInfo:
+    build_id = build["id"]
     now = datetime.now(timezone.utc)
     log_enabled = True if build.get("logs", {}).get("cloudWatchLogs", {}).get("status") == "ENABLED" else False
     return BuildInfo(
@@ -258,6 +269,175 @@ def fetch_build_info(build_id: str, session: Optional[Union[Callable[[], Session
     )
 
 
+class BuildPoller:
+    """Poll the CodeBuild executions of one account / region, shared by all the threads waiting on them
+
+    All tracked builds are fetched with ``batch_get_builds`` (up to 100 per call) on a single thread that
+    dispatches each update to the waiting thread. Builds in their last phases are polled more often so their
+    completion is noticed quickly, and the delay backs off when CodeBuild throttles the calls.
+    """
+
+    # Phases usually lasting seconds, where polling faster shortens the wait for the build result
+    PHASE_POLLING_DELAYS: Dict[BuildPhaseType, float] = {
+        BuildPhaseType.post_build: 2,
+        BuildPhaseType.upload_artifacts: 2,
+        BuildPhaseType.finalizing: 2,
+        BuildPhaseType.completed: 2,
+    }
+
+    def __init__(self, session: Optional[Union[Callable[[], Session], Session]] = None) -> None:
+        self.session = session
+        self.delay: float = _BUILD_WAIT_POLLING_DELAY
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._wake_up = threading.Event()
+        self._builds: Dict[str, "queue.Queue[Union[BuildInfo, Exception]]"] = {}
+        self._phases: Dict[str, BuildPhaseType] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def track(self, build_id: str) -> "queue.Queue[Union[BuildInfo, Exception]]":
+        """Start polling a build
+
+        Parameters
+        ----------
+        build_id : str
+            The CodeBuild Execution/Build Id
+
+        Returns
+        -------
+        queue.Queue[Union[BuildInfo, Exception]]
+            The queue receiving every update of the build, or the exception raised fetching it
+        """
+        with self._lock:
+            updates = self._builds.setdefault(build_id, queue.Queue())
+        self.ensure_polling()
+        return updates
+
+    def ensure_polling(self) -> None:
+        """Start the polling thread unless it is running"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._poll, daemon=True, name="CodeBuild-Poller")
+                self._thread.start()
+        self._wake_up.set()
+
+    def untrack(self, build_id: str) -> None:
+        with self._lock:
+            self._builds.pop(build_id, None)
+            self._phases.pop(build_id, None)
+
+    def _next_delay(self, throttled: bool) -> float:
+        if throttled:
+            self.delay = min(self.delay * 2, _BUILD_WAIT_MAX_POLLING_DELAY)
+            return self.delay
+        self.delay = max(self.delay / 2, _BUILD_WAIT_POLLING_DELAY)
+        phase_delays = [self.PHASE_POLLING_DELAYS.get(phase, self.delay) for phase in self._phases.values()]
+        return min([self.delay] + phase_delays)
+
+    def _dispatch(self, updates: Dict[str, Union[BuildInfo, Exception]]) -> None:
+        with self._lock:
+            for build_id, update in updates.items():
+                if build_id in self._builds:
+                    if isinstance(update, BuildInfo):
+                        self._phases[build_id] = update.current_phase
+                    self._builds[build_id].put(update)
+
+    def _poll(self) -> None:
+        try:
+            self._poll_builds()
+        except Exception as e:
+            # Handed to every waiting thread, a poller dying silently would leave them waiting forever
+            _logger.error("Failed to poll the CodeBuild builds - %s", e)
+            with self._lock:
+                for updates in self._builds.values():
+                    updates.put(e)
+        finally:
+            with self._lock:
+                if self._thread is threading.current_thread():
+                    self._thread = None
+
+    def _poll_builds(self) -> None:
+        client = boto3_client("codebuild", session=self.session)
+        failures = 0
+        while True:
+            self._wake_up.clear()
+            with self._lock:
+                build_ids = list(self._builds)
+                if not build_ids:
+                    # Cleared under the lock so that a build tracked from now on starts a new poller
+                    self._thread = None
+                    return
+            throttled = False
+            for start in range(0, len(build_ids), _BATCH_GET_BUILDS_MAX_IDS):
+                batch = build_ids[start : start + _BATCH_GET_BUILDS_MAX_IDS]
+                try:
+                    self.calls += 1
+                    response = client.batch_get_builds(ids=batch)
+                    failures = 0
+                except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+                    if (
+                        isinstance(e, botocore.exceptions.ClientError)
+                        and e.response["Error"]["Code"] in _THROTTLING_ERROR_CODES
+                    ):
+                        throttled = True
+                        continue
+                    failures += 1
+                    _logger.error("Failed to fetch the build info of %s - %s", batch, e)
+                    if failures >= _BATCH_GET_BUILDS_MAX_FAILURES:
+                        self._dispatch({build_id: e for build_id in batch})
+                    continue
+                builds = {build["id"]: _parse_build_info(cast(Dict[str, Any], build)) for build in response["builds"]}
+                self._dispatch(
+                    {
+                        build_id: builds.get(build_id) or RuntimeError(f"CodeBuild build {build_id} not found.")
+                        for build_id in batch
+                    }
+                )
+            delay = self._next_delay(throttled=throttled)
+            _logger.debug("Polled %s builds (%s calls in total), next poll in %ss", len(build_ids), self.calls, delay)
+            # New builds are polled right away instead of waiting for the other builds' delay
+            self._wake_up.wait(timeout=delay)
+
+
+_pollers: Dict[Hashable, BuildPoller] = {}
+_pollers_lock = threading.Lock()
+
+
+def get_build_poller(session: Optional[Union[Callable[[], Session], Session]] = None) -> BuildPoller:
+    """Get the poller shared by the builds of a session (an account / region)
+
+    Parameters
+    ----------
+    session: Optional[Union[Callable[[], Session], Session]], optional
+        Optional Session or function returning a Session to use for all boto3 operations, by default None
+
+    Returns
+    -------
+    BuildPoller
+        The poller of the session
+    """
+    with _pollers_lock:
+        return _pollers.setdefault(session, BuildPoller(session=session))
+
+
+def clear_build_pollers(session: Optional[Union[Callable[[], Session], Session]] = None) -> None:
+    """Drop the pollers of sessions no longer in use
+
+    The builds a dropped poller tracks are still polled until their waiting threads are done with them,
+    its polling thread then stops.
+
+    Parameters
+    ----------
+    session: Optional[Union[Callable[[], Session], Session]], optional
+        Only drop the poller of this session, by default None (all pollers)
+    """
+    with _pollers_lock:
+        if session is None:
+            _pollers.clear()
+        else:
+            _pollers.pop(session, None)
+
+
 def wait(build_id: str, session: Optional[Union[Callable[[], Session], Session]] = None) -> Iterable[BuildInfo]:
     """Wait for completion of a CodeBuild execution
 
@@ -279,20 +459,56 @@ def wait(build_id: str, session: Optional[Union[Callable[[], Session], Session]]
         Info on the CodeBuild execution
 
     """
-    build = fetch_build_info(build_id=build_id, session=session)
-    while build.status is BuildStatus.in_progress:
-        time.sleep(_BUILD_WAIT_POLLING_DELAY)
+    poller = get_build_poller(session=session)
+    updates = poller.track(build_id)
+
+    def _next_update() -> BuildInfo:
+        while True:
+            try:
+                update = updates.get(timeout=_BUILD_WAIT_UPDATE_TIMEOUT)
+                break
+            except queue.Empty:
+                poller.ensure_polling()
+        # Only the latest update matters when this thread falls behind the poller
+        while not updates.empty():
+            update = updates.get_nowait()
+        if isinstance(update, Exception):
+            raise update
+        return update
 
-        last_phase = build.current_phase
-        last_status = build.status
-        build = fetch_build_info(build_id=build_id, session=session)
+    try:
+        build = _next_update()
+        while build.status is BuildStatus.in_progress:
+            last_phase = build.current_phase
+            last_status = build.status
+            build = _next_update()
 
-        if build.current_phase is not last_phase or build.status is not last_status:
-            _logger.info("phase: %s %s (%s)", build.current_phase.value, build.build_id, build.status.value)
+            if build.current_phase is not last_phase or build.status is not last_status:
+                _logger.info("phase: %s %s (%s)", build.current_phase.value, build.build_id, build.status.value)
+
+            yield build
 
         yield build
+    finally:
+        poller.untrack(build_id)
+
 
-    yield build
+def stop(build_id: str, session: Optional[Union[Callable[[], Session], Session]] = None) -> None:
+    """Stop a CodeBuild execution
+
+    Parameters
+    ----------
+    build_id : str
+        The CodeBuild Execution/Build Id
+    session: Optional[Union[Callable[[], Session], Session]], optional
+        Optional Session or function returning a Session to use for all boto3 operations, by default None
+    """
+    _logger.info("Stopping build %s", build_id)
+    try:
+        boto3_client("codebuild", session=session).stop_build(id=build_id)
+    except botocore.exceptions.ClientError as e:
+        # The build may have completed in the meantime
+        _logger.debug("Cannot stop build %s - %s", build_id, e)
 
 
 def generate_spec(
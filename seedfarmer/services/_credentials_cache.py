@@ -0,0 +1,133 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License").
+#    You may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+On-disk cache of assumed role credentials shared by SeedFarmer processes.
+
+Enabled by setting SEEDFARMER_CREDENTIALS_CACHE=true. Like the AWS CLI cache, each assumed role
+is stored in its own file (readable by the owner only) named after a hash of what identifies the
+role and its caller, and is reused by other processes until it gets close to expiring.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional, cast
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows, files are still replaced atomically
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from mypy_boto3_sts.type_defs import AssumeRoleResponseTypeDef
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+CREDENTIALS_CACHE_ENV = "SEEDFARMER_CREDENTIALS_CACHE"
+CREDENTIALS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".seedfarmer", "cache", "credentials")
+# Cached credentials are only reused while they are valid for longer than botocore's advisory refresh window
+CREDENTIALS_MIN_REMAINING_SECONDS = 15 * 60
+
+
+def is_enabled() -> bool:
+    return os.getenv(CREDENTIALS_CACHE_ENV, "").lower() in ["1", "true", "yes", "on"]
+
+
+def _cache_path(key_parts: Dict[str, Optional[str]]) -> str:
+    key = hashlib.sha1(json.dumps(key_parts, sort_keys=True).encode("utf-8")).hexdigest()
+    return os.path.join(CREDENTIALS_CACHE_DIR, f"{key}.json")
+
+
+@contextmanager
+def _file_lock(path: str) -> Iterator[None]:
+    fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        os.close(fd)
+
+
+def _load(path: str) -> Optional["AssumeRoleResponseTypeDef"]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            response: Dict[str, Any] = json.load(f)
+        expiration = datetime.fromisoformat(response["Credentials"]["Expiration"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    if (expiration - datetime.now(timezone.utc)).total_seconds() < CREDENTIALS_MIN_REMAINING_SECONDS:
+        return None
+    response["Credentials"]["Expiration"] = expiration
+    return cast("AssumeRoleResponseTypeDef", response)
+
+
+def _store(path: str, response: "AssumeRoleResponseTypeDef") -> None:
+    cached = {
+        "Credentials": {**response["Credentials"], "Expiration": response["Credentials"]["Expiration"].isoformat()},
+        "AssumedRoleUser": response["AssumedRoleUser"],
+    }
+    # mkstemp creates the file readable and writable by the owner only
+    fd, tmp_path = tempfile.mkstemp(dir=CREDENTIALS_CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cached, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        _logger.debug("Cannot write the credentials cache %s - %s", path, e)
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def assume_role(
+    key_parts: Optional[Dict[str, Optional[str]]],
+    assume: Callable[[], "AssumeRoleResponseTypeDef"],
+) -> "AssumeRoleResponseTypeDef":
+    """Assume a role, reusing the credentials cached by another process when the cache is enabled
+
+    Credentials about to expire are never returned from the cache, so refreshing credentials either assumes
+    the role again or picks up the credentials another process refreshed.
+
+    Parameters
+    ----------
+    key_parts : Optional[Dict[str, Optional[str]]]
+        What identifies the role and the caller assuming it, hashed to name the cache file, None to not cache
+    assume : Callable[[], AssumeRoleResponseTypeDef]
+        Function calling STS AssumeRole
+
+    Returns
+    -------
+    AssumeRoleResponseTypeDef
+        The cached or new AssumeRole response
+    """
+    if key_parts is None or not is_enabled():
+        return assume()
+    os.makedirs(CREDENTIALS_CACHE_DIR, mode=0o700, exist_ok=True)
+    path = _cache_path(key_parts)
+    # The lock makes concurrent processes wait for the first one to assume the role instead of all assuming it
+    with _file_lock(path):
+        cached = _load(path)
+        if cached is not None:
+            _logger.debug("Using cached credentials of %s", cached["AssumedRoleUser"]["Arn"])
+            return cached
+        response = assume()
+        _store(path, response)
+        return response
@@ -0,0 +1,243 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License").
+#    You may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Concurrency governor shared by all deployment threads.
+
+Each (account, region, service) gets a token bucket limiting how fast operations are started and,
+when a limit is configured or discovered, a semaphore limiting how many run at the same time. Group
+`concurrency` only limits the modules of one group, this keeps a whole deployment (including other
+groups deployed by the DAG scheduler) under the account quotas.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple, Union
+
+import botocore.exceptions
+from boto3 import Session
+
+from seedfarmer.services._service_utils import boto3_client
+
+_logger: logging.Logger = logging.getLogger(__name__)
+
+GOVERNOR_CODEBUILD = "codebuild"
+GOVERNOR_CLOUDFORMATION = "cloudformation"
+# Operations started per second and burst, per account and region
+GOVERNOR_RATES: Dict[str, Tuple[float, int]] = {
+    GOVERNOR_CODEBUILD: (2.0, 5),
+    GOVERNOR_CLOUDFORMATION: (2.0, 5),
+}
+# Waits longer than this are logged at info level
+GOVERNOR_REPORT_DELAY: float = 1.0  # SECONDS
+CODEBUILD_CONCURRENT_BUILDS_QUOTA_PREFIX = "Concurrently running builds"
+# Environment and compute type of the seedkit CodeBuild project (LINUX_CONTAINER, BUILD_GENERAL1_SMALL)
+CODEBUILD_DEFAULT_ENVIRONMENT = "Linux/Small"
+
+
+class TokenBucket:
+    """Token bucket refilled at ``rate`` tokens per second up to ``capacity`` tokens
+
+    Parameters
+    ----------
+    rate : float
+        Tokens added per second
+    capacity : int
+        Maximum number of tokens, the size of a burst
+    """
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before it can be used"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # The token may be borrowed from the future, later callers then wait longer
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class _ServiceLimiter:
+    def __init__(self, service: str, concurrency: Optional[int]) -> None:
+        rate, capacity = GOVERNOR_RATES.get(service, (2.0, 5))
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate=rate, capacity=capacity)
+        self.semaphore = threading.BoundedSemaphore(concurrency) if concurrency else None
+        self.acquired = 0
+        self.delayed = 0
+        self.total_delay = 0.0
+        self.max_delay = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, delay: float, queued: bool) -> None:
+        with self._lock:
+            self.acquired += 1
+            if queued:
+                self.delayed += 1
+                self.total_delay += delay
+                self.max_delay = max(self.max_delay, delay)
+
+
+_limiters: Dict[Tuple[str, str, str], _ServiceLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def _limiter(account_id: str, region: str, service: str) -> _ServiceLimiter:
+    key = (account_id, region, service)
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = _ServiceLimiter(service=service, concurrency=None)
+        return _limiters[key]
+
+
+def configure_governor(account_id: str, region: str, service: str, concurrency: Optional[int]) -> None:
+    """Set the maximum number of concurrent operations of a service in an account and region
+
+    Parameters
+    ----------
+    account_id : str
+        The target account
+    region : str
+        The target region
+    service : str
+        The governed service, `codebuild` or `cloudformation`
+    concurrency : Optional[int]
+        The maximum number of concurrent operations, None to only limit their start rate
+    """
+    _logger.debug("Governor limit for %s in %s/%s: %s", service, account_id, region, concurrency)
+    with _limiters_lock:
+        _limiters[(account_id, region, service)] = _ServiceLimiter(service=service, concurrency=concurrency)
+
+
+@contextmanager
+def governed(account_id: str, region: str, service: str) -> Iterator[float]:
+    """Wait for a slot of a service in an account and region, held until the block exits
+
+    Parameters
+    ----------
+    account_id : str
+        The target account
+    region : str
+        The target region
+    service : str
+        The governed service, `codebuild` or `cloudformation`
+
+    Yields
+    -------
+    Iterator[float]
+        The seconds spent waiting for the slot
+    """
+    limiter = _limiter(account_id=account_id, region=region, service=service)
+    started = time.monotonic()
+    queued = False
+    if limiter.semaphore is not None and not limiter.semaphore.acquire(blocking=False):
+        queued = True
+        limiter.semaphore.acquire()
+    try:
+        wait = limiter.bucket.reserve()
+        if wait > 0:
+            queued = True
+            time.sleep(wait)
+        delay = time.monotonic() - started if queued else 0.0
+        limiter.record(delay=delay, queued=queued)
+        if delay >= GOVERNOR_REPORT_DELAY:
+            _logger.info("Waited %.1fs for a %s slot in %s/%s", delay, service, account_id, region)
+        yield delay
+    finally:
+        if limiter.semaphore is not None:
+            limiter.semaphore.release()
+
+
+def get_governor_stats() -> Dict[str, Dict[str, Union[int, float, None]]]:
+    """Get the queueing delay of each governed account, region and service
+
+    Returns
+    -------
+    Dict[str, Dict[str, Union[int, float, None]]]
+        For each `<account>/<region>/<service>`, the concurrency limit, the number of slots acquired,
+        how many had to wait and the total and maximum seconds waited
+    """
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {
+        "/".join(key): {
+            "limit": limiter.concurrency,
+            "acquired": limiter.acquired,
+            "delayed": limiter.delayed,
+            "total_delay": round(limiter.total_delay, 3),
+            "max_delay": round(limiter.max_delay, 3),
+        }
+        for key, limiter in limiters.items()
+        if limiter.acquired
+    }
+
+
+def reset_governor() -> None:
+    """Drop all the limits and statistics"""
+    with _limiters_lock:
+        _limiters.clear()
+
+
+def discover_codebuild_concurrency(
+    session: Optional[Union[Callable[[], Session], Session]] = None,
+    environment: str = CODEBUILD_DEFAULT_ENVIRONMENT,
+) -> Optional[int]:
+    """Read the concurrently running builds quota of CodeBuild from Service Quotas
+
+    CodeBuild has one quota per environment type and compute type. The quota of ``environment``, the
+    environment of the seedkit CodeBuild project, is used. When it is not listed, the largest Linux
+    container quota is used: the Windows, GPU, ARM and Lambda quotas do not limit the builds of the
+    seedkit project and are never used.
+
+    Parameters
+    ----------
+    session: Optional[Union[Callable[[], Session], Session]], optional
+        Optional Session or function returning a Session to use for all boto3 operations, by default None
+    environment: str, optional
+        The environment and compute type as named in the quota, by default `Linux/Small`
+
+    Returns
+    -------
+    Optional[int]
+        The quota, None when it cannot be read
+    """
+    try:
+        paginator = boto3_client("service-quotas", session=session).get_paginator("list_service_quotas")
+        quotas = {
+            quota["QuotaName"]: int(quota["Value"])
+            for page in paginator.paginate(ServiceCode="codebuild")
+            for quota in page.get("Quotas", [])
+            if quota.get("QuotaName", "").startswith(CODEBUILD_CONCURRENT_BUILDS_QUOTA_PREFIX) and quota.get("Value")
+        }
+    except (botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError) as e:
+        _logger.debug("Cannot read the CodeBuild quotas from Service Quotas - %s", e)
+        return None
+    quota_name = f"{CODEBUILD_CONCURRENT_BUILDS_QUOTA_PREFIX} for {environment} environment"
+    if quota_name in quotas:
+        return quotas[quota_name]
+    linux_quotas = [
+        value
+        for name, value in quotas.items()
+        if name.startswith(f"{CODEBUILD_CONCURRENT_BUILDS_QUOTA_PREFIX} for Linux/") and "Lambda" not in name
+    ]
+    return max(linux_quotas) if linux_quotas else None
@@ -15,18 +15,32 @@
 import concurrent.futures
 import logging
 import math
+import os
 import random
+import threading
 import time
 from itertools import repeat
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Tuple, TypeVar, Union, cast
 
+import botocore.config
 from boto3 import Session
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
-from seedfarmer.services._service_utils import boto3_client, boto3_resource
+import seedfarmer
+from seedfarmer.services._service_utils import boto3_client, boto3_resource, create_new_session, get_botocore_config
+
+if TYPE_CHECKING:
+    from mypy_boto3_s3 import S3Client
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+MIB = 1024 * 1024
+
+# Transfer clients, one per session, shared by every upload so they draw on a single connection pool
+_transfer_clients: Dict[Hashable, Tuple[Session, "S3Client"]] = {}
+_transfer_lock = threading.Lock()
+
 ChunkifyItemType = TypeVar("ChunkifyItemType")
 
 
@@ -136,11 +150,103 @@ def delete_bucket(bucket: str, session: Optional[Union[Callable[[], Session], Se
             raise ex
 
 
+def get_transfer_config(concurrency: int = 1) -> TransferConfig:
+    """Get the TransferConfig used by upload_file
+
+    Parameters
+    ----------
+    concurrency : int, optional
+        The number of uploads that may run at once, each gets an equal share of the transfer connection pool
+        unless ``uploadMaxConcurrency`` is set in seedfarmer.yaml, by default 1
+
+    Returns
+    -------
+    TransferConfig
+        Multipart threshold and chunk size from seedfarmer.yaml, max concurrency from ``uploadMaxConcurrency`` or
+        the share of the transfer connection pool for each concurrent upload
+    """
+    max_concurrency = seedfarmer.config.UPLOAD_MAX_CONCURRENCY or max(
+        1, seedfarmer.config.UPLOAD_MAX_POOL_CONNECTIONS // max(1, concurrency)
+    )
+    return TransferConfig(
+        multipart_threshold=seedfarmer.config.UPLOAD_MULTIPART_THRESHOLD * MIB,
+        multipart_chunksize=seedfarmer.config.UPLOAD_MULTIPART_CHUNKSIZE * MIB,
+        max_concurrency=max_concurrency,
+        use_threads=True,
+    )
+
+
+def _transfer_client(session: Optional[Union[Callable[[], Session], Session]] = None) -> "S3Client":
+    if callable(session) and not isinstance(session, Session):
+        session = session()
+    # The default session resolves the region and credentials from the environment, as in boto3_client
+    key: Hashable = (
+        id(session)
+        if session is not None
+        else (
+            "default",
+            os.getenv("AWS_PROFILE"),
+            os.getenv("AWS_ACCESS_KEY_ID"),
+            os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION"),
+        )
+    )
+    with _transfer_lock:
+        if key not in _transfer_clients:
+            pool_config = get_botocore_config().merge(
+                botocore.config.Config(max_pool_connections=seedfarmer.config.UPLOAD_MAX_POOL_CONNECTIONS)
+            )
+            transfer_session = session if session is not None else create_new_session()
+            # Hold on to the session so its id is not reused while the client is cached
+            _transfer_clients[key] = (
+                transfer_session,
+                transfer_session.client("s3", use_ssl=True, config=pool_config),
+            )
+        return _transfer_clients[key][1]
+
+
+class _TransferProgress:
+    """Upload callback logging progress (debug) every 25% and the throughput once complete"""
+
+    def __init__(self, src: str, destination: str) -> None:
+        self._destination = destination
+        self._size = os.path.getsize(src)
+        self._transferred = 0
+        self._next_report = 25
+        self._start = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __call__(self, bytes_transferred: int) -> None:
+        with self._lock:
+            self._transferred += bytes_transferred
+            percent = 100 * self._transferred // self._size if self._size else 100
+            while percent >= self._next_report and self._next_report < 100:
+                _logger.debug("Uploading %s: %d%%", self._destination, self._next_report)
+                self._next_report += 25
+
+    def report(self) -> None:
+        elapsed = max(time.monotonic() - self._start, 1e-6)
+        _logger.info(
+            "Uploaded %s (%.1f MiB in %.1fs, %.1f MiB/s)",
+            self._destination,
+            self._size / MIB,
+            elapsed,
+            self._size / MIB / elapsed,
+        )
+
+
 def upload_file(
-    src: str, bucket: str, key: str, session: Optional[Union[Callable[[], Session], Session]] = None
+    src: str,
+    bucket: str,
+    key: str,
+    session: Optional[Union[Callable[[], Session], Session]] = None,
+    metadata: Optional[Dict[str, str]] = None,
+    concurrency: int = 1,
 ) -> None:
     """Upload file to S3 Bucket
 
+    Uses a multipart transfer configured by get_transfer_config, on a client shared by all uploads with the
+    same session
+
     Parameters
     ----------
     src : str
@@ -151,9 +257,78 @@ def upload_file(
         Key name to upload to
     session: Optional[Union[Callable[[], Session], Session]], optional
         Optional Session or function returning a Session to use for all boto3 operations, by default None
+    metadata: Optional[Dict[str, str]], optional
+        User metadata to store with the object, by default None
+    concurrency: int, optional
+        The number of uploads that may run at once, sharing the connection pool of the session, by default 1
+    """
+    client_s3 = _transfer_client(session=session)
+    progress = _TransferProgress(src=src, destination=f"s3://{bucket}/{key}")
+    client_s3.upload_file(
+        Filename=src,
+        Bucket=bucket,
+        Key=key,
+        ExtraArgs={"Metadata": metadata} if metadata else None,
+        Callback=progress,
+        Config=get_transfer_config(concurrency=concurrency),
+    )
+    progress.report()
+
+
+def head_object(
+    bucket: str, key: str, session: Optional[Union[Callable[[], Session], Session]] = None
+) -> Optional[Dict[str, Any]]:
+    """Get the metadata of an object in an S3 Bucket without fetching it
+
+    Parameters
+    ----------
+    bucket : str
+        S3 Bucket name
+    key : str
+        Key to check
+    session: Optional[Union[Callable[[], Session], Session]], optional
+        Optional Session or function returning a Session to use for all boto3 operations, by default None
+
+    Returns
+    -------
+    Optional[Dict[str, Any]]
+        The HeadObject response, None if the object does not exist
+    """
+    client_s3 = boto3_client("s3", session=session)
+    try:
+        return cast(Dict[str, Any], client_s3.head_object(Bucket=bucket, Key=key))
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ["404", "NoSuchKey"]:
+            return None
+        raise
+
+
+def get_object(
+    bucket: str, key: str, session: Optional[Union[Callable[[], Session], Session]] = None
+) -> Optional[bytes]:
+    """Read the content of an object in an S3 Bucket
+
+    Parameters
+    ----------
+    bucket : str
+        S3 Bucket name
+    key : str
+        Key to read
+    session: Optional[Union[Callable[[], Session], Session]], optional
+        Optional Session or function returning a Session to use for all boto3 operations, by default None
+
+    Returns
+    -------
+    Optional[bytes]
+        The content of the object, None if the object does not exist
     """
     client_s3 = boto3_client("s3", session=session)
-    client_s3.upload_file(Filename=src, Bucket=bucket, Key=key)
+    try:
+        return client_s3.get_object(Bucket=bucket, Key=key)["Body"].read()
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ["404", "NoSuchKey"]:
+            return None
+        raise
 
 
 def list_s3_objects(
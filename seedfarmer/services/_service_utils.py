@@ -15,8 +15,9 @@
 import logging
 import os
 import random
+import threading
 import time
-from typing import TYPE_CHECKING, Any, Callable, Dict, Literal, Optional, Tuple, Union, cast, overload
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Literal, Optional, Tuple, Union, cast, overload
 
 import boto3
 import botocore.config
@@ -62,6 +63,64 @@ def get_botocore_config() -> botocore.config.Config:
     )
 
 
+# Clients are thread safe and expensive to create (service model loading), so they are shared per
+# (session, service, region, config) until the SessionManager drops the sessions they were created from
+_client_cache: Dict[Tuple[Hashable, ...], "BaseClient"] = {}
+_client_cache_lock = threading.Lock()
+_client_cache_stats: Dict[str, int] = {"hits": 0, "misses": 0}
+
+
+# GetCallerIdentity responses, keyed by the access key of the session used to call it, or by the profile
+# when called without a session
+_identity_cache: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+_identity_cache_lock = threading.Lock()
+
+
+def _config_key() -> Tuple[Optional[str], ...]:
+    return (os.getenv("HTTP_PROXY", None), os.getenv("HTTPS_PROXY", None), seedfarmer.config.PROJECT)
+
+
+def _cached_client(key: Tuple[Hashable, ...], create: Callable[[], "BaseClient"]) -> "BaseClient":
+    key = key + _config_key()
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is not None:
+            _client_cache_stats["hits"] += 1
+            return client
+        _client_cache_stats["misses"] += 1
+        # boto3 sessions are not thread safe, clients are created while holding the lock
+        client = _client_cache[key] = create()
+    _logger.debug("Created %s client, client cache: %s", key[1], get_client_cache_stats())
+    return client
+
+
+def get_client_cache_stats() -> Dict[str, int]:
+    """Get the hits, misses and size of the boto3 client cache
+
+    Returns
+    -------
+    Dict[str, int]
+        The number of ``hits`` and ``misses`` since the process started and the ``size`` of the cache
+    """
+    return {**_client_cache_stats, "size": len(_client_cache)}
+
+
+def clear_client_cache(session: Optional[Session] = None) -> None:
+    """Drop cached boto3 clients
+
+    Parameters
+    ----------
+    session : Optional[Session], optional
+        Only drop the clients created from this session, by default None (all clients)
+    """
+    with _client_cache_lock:
+        if session is None:
+            _client_cache.clear()
+        else:
+            for key in [key for key in _client_cache if key[0] is session]:
+                del _client_cache[key]
+
+
 def create_new_session(region_name: Optional[str] = None, profile: Optional[str] = None) -> Session:
     return Session(region_name=region_name, profile_name=profile)
 
@@ -195,16 +254,33 @@ def boto3_client(
     aws_session_token: Optional[str] = None,
 ) -> "BaseClient":
     if aws_access_key_id and aws_secret_access_key and aws_session_token:
-        return create_new_session_with_creds(  # type: ignore[call-overload,no-any-return]
-            aws_access_key_id, aws_secret_access_key, aws_session_token, region_name
-        ).client(service_name=service_name, use_ssl=True, config=get_botocore_config())
+        return _cached_client(
+            ((aws_access_key_id, aws_secret_access_key, aws_session_token), service_name, region_name),
+            lambda: create_new_session_with_creds(  # type: ignore[call-overload]
+                aws_access_key_id, aws_secret_access_key, aws_session_token, region_name
+            ).client(service_name=service_name, use_ssl=True, config=get_botocore_config()),
+        )
     elif not session:
-        return create_new_session(region_name, profile).client(  # type: ignore[call-overload,no-any-return]
-            service_name=service_name, use_ssl=True, config=get_botocore_config()
+        # The default session resolves the region and credentials from the environment
+        default_region = region_name or os.getenv("AWS_REGION") or os.getenv("AWS_DEFAULT_REGION")
+        return _cached_client(
+            (
+                ("default", profile or os.getenv("AWS_PROFILE"), os.getenv("AWS_ACCESS_KEY_ID")),
+                service_name,
+                default_region,
+            ),
+            lambda: create_new_session(region_name, profile).client(  # type: ignore[call-overload]
+                service_name=service_name, use_ssl=True, config=get_botocore_config()
+            ),
         )
     else:
         if isinstance(session, Session):
-            return session.client(service_name=service_name, use_ssl=True, config=get_botocore_config())  # type: ignore
+            return _cached_client(
+                (session, service_name, session.region_name),
+                lambda: session.client(  # type: ignore[call-overload]
+                    service_name=service_name, use_ssl=True, config=get_botocore_config()
+                ),
+            )
         else:
             raise TypeError(f"Expected boto3.Session instance, got {type(session)}")
 
@@ -265,8 +341,36 @@ def get_region(session: Optional[Union[Callable[[], Session], Session]] = None,
     return str(sess.region_name)
 
 
+def _credentials_key(
+    session: Optional[Union[Callable[[], Session], Session]] = None, profile: Optional[str] = None
+) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    if not session:
+        # Resolving the credentials of a new session walks the whole provider chain (IMDS, SSO...),
+        # the profile alone identifies them for the life of the process
+        return (profile, None)
+    sess = session() if callable(session) else session
+    credentials = sess.get_credentials()
+    return (None, credentials.access_key) if credentials else None
+
+
 def _call_sts(
     session: Optional[Union[Callable[[], Session], Session]] = None, profile: Optional[str] = None
+) -> Dict[str, Any]:
+    # The identity behind an access key never changes, so GetCallerIdentity is called once per set of credentials
+    key = _credentials_key(session=session, profile=profile)
+    with _identity_cache_lock:
+        if key is not None and key in _identity_cache:
+            return _identity_cache[key]
+    identity = _get_caller_identity(session=session, profile=profile)
+    _logger.debug("Caller identity is %s", identity.get("Arn"))
+    if key is not None:
+        with _identity_cache_lock:
+            _identity_cache[key] = identity
+    return identity
+
+
+def _get_caller_identity(
+    session: Optional[Union[Callable[[], Session], Session]] = None, profile: Optional[str] = None
 ) -> Dict[str, Any]:
     try:
         if not session:
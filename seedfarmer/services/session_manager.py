@@ -17,25 +17,78 @@ from __future__ import annotations
 
 import logging
 import threading
+import time
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import update_wrapper
 from threading import Thread
 from time import sleep
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, cast
 
 import botocore.exceptions
+import botocore.session
 from boto3 import Session
-from botocore.credentials import Credentials
+from botocore.credentials import Credentials, RefreshableCredentials
 
 import seedfarmer.errors
-from seedfarmer.services import boto3_client, create_new_session, create_new_session_with_creds, get_sts_identity_info
+import seedfarmer.services._credentials_cache as credentials_cache
+from seedfarmer.services import (
+    boto3_client,
+    clear_client_cache,
+    create_new_session,
+    get_sts_identity_info,
+)
+from seedfarmer.services._codebuild import clear_build_pollers
 from seedfarmer.utils import get_deployment_role_arn, get_toolchain_role_arn, get_toolchain_role_name
 
 if TYPE_CHECKING:
+    from mypy_boto3_sts.client import STSClient
     from mypy_boto3_sts.type_defs import AssumeRoleResponseTypeDef
 
 _logger: logging.Logger = logging.getLogger(__name__)
 
+SESSION_WARM_UP_WORKERS = 8
+
+
+def _credentials_metadata(role: "AssumeRoleResponseTypeDef") -> Dict[str, str]:
+    return {
+        "access_key": role["Credentials"]["AccessKeyId"],
+        "secret_key": role["Credentials"]["SecretAccessKey"],
+        "token": role["Credentials"]["SessionToken"],
+        "expiry_time": role["Credentials"]["Expiration"].isoformat(),
+    }
+
+
+def _refreshable_session(
+    role: "AssumeRoleResponseTypeDef",
+    assume_role: Callable[[], "AssumeRoleResponseTypeDef"],
+    region_name: Optional[str],
+) -> Session:
+    """Create a session whose credentials re-assume the role shortly before they expire
+
+    Parameters
+    ----------
+    role : AssumeRoleResponseTypeDef
+        The response of the initial AssumeRole call
+    assume_role : Callable[[], AssumeRoleResponseTypeDef]
+        Function assuming the role again, called by botocore when the credentials are about to expire
+    region_name : Optional[str]
+        The region of the session
+
+    Returns
+    -------
+    Session
+        A boto3 Session with RefreshableCredentials
+    """
+    credentials = RefreshableCredentials.create_from_metadata(
+        metadata=_credentials_metadata(role),
+        refresh_using=lambda: _credentials_metadata(assume_role()),
+        method="sts-assume-role",
+    )
+    botocore_session = botocore.session.get_session()
+    botocore_session._credentials = credentials  # type: ignore[attr-defined]
+    return Session(botocore_session=botocore_session, region_name=region_name)
+
 
 class SingletonMeta(type):
     """
@@ -83,6 +136,69 @@ class ISessionManager(object):
     @abstractmethod
     def get_toolchain_credentials(self) -> Credentials: ...
 
+    def warm_up_deployment_sessions(
+        self, accounts_regions: List[Tuple[str, str]], max_workers: int = SESSION_WARM_UP_WORKERS
+    ) -> Dict[str, float]:
+        """Create the deployment sessions of all target accounts / regions concurrently
+
+        Parameters
+        ----------
+        accounts_regions : List[Tuple[str, str]]
+            The (account id, region) pairs to create deployment sessions for
+        max_workers : int, optional
+            The number of sessions created at the same time, by default 8
+
+        Returns
+        -------
+        Dict[str, float]
+            The time, in seconds, taken to create the session of each ``<account id>-<region>``
+
+        Raises
+        ------
+        seedfarmer.errors.InvalidSessionError
+            If any deployment role cannot be assumed, listing every account / region that failed
+        """
+        latencies: Dict[str, float] = {}
+        errors: Dict[str, Exception] = {}
+
+        def _create_session(account_id: str, region_name: str) -> float:
+            start = time.perf_counter()
+            self.get_deployment_session(account_id=account_id, region_name=region_name)
+            return time.perf_counter() - start
+
+        unique_accounts_regions = sorted(set(accounts_regions))
+        if not unique_accounts_regions:
+            return latencies
+        with ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(unique_accounts_regions))), thread_name_prefix="Session-Warm-Up"
+        ) as executor:
+            futures = {
+                executor.submit(_create_session, account_id, region_name): f"{account_id}-{region_name}"
+                for account_id, region_name in unique_accounts_regions
+            }
+            for future in as_completed(futures):
+                session_key = futures[future]
+                try:
+                    latencies[session_key] = future.result()
+                    _logger.info("Deployment session for %s created in %.2fs", session_key, latencies[session_key])
+                except Exception as e:
+                    errors[session_key] = e
+
+        if errors:
+            # The trust policy hints of InvalidSessionError are the same for every account, keep the cause only
+            failures = "\n".join(
+                f"    {session_key}: {str(error).strip().splitlines()[0] if str(error).strip() else repr(error)}"
+                for session_key, error in sorted(errors.items())
+            )
+            raise seedfarmer.errors.InvalidSessionError(
+                f"""Cannot create the deployment sessions of {len(errors)} of {len(unique_accounts_regions)} target
+                account / region mappings:
+{failures}
+                Make sure that the toolchain role is in the trust policy of these deployment roles and that the
+                account ids in the targetAccountMappings of the deployment manifest are correct."""
+            )
+        return latencies
+
 
 class SessionManager(ISessionManager):
     _real_instance: Optional[ISessionManager] = None
@@ -120,6 +236,8 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
     created: bool = False
     reaper: Thread = None  # type: ignore
     reaper_interval: int = 900  # every 15 minutes
+    _session_locks: Dict[str, threading.Lock] = {}
+    _session_locks_guard: threading.Lock = threading.Lock()
 
     def __init__(self) -> None:
         super().__init__()
@@ -176,12 +294,9 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
                 "The SessionManager object was never properly created...)"
             )
 
-        toolchain_role = self.sessions[self.TOOLCHAIN_KEY][self.ROLE]
-        creds = Credentials(
-            access_key=toolchain_role["Credentials"]["AccessKeyId"],
-            secret_key=toolchain_role["Credentials"]["SecretAccessKey"],
-            token=toolchain_role["Credentials"]["SessionToken"],
-        )
+        # The toolchain session refreshes its credentials, freeze the current ones
+        frozen = self.toolchain_session.get_credentials().get_frozen_credentials()  # type: ignore[union-attr]
+        creds = Credentials(access_key=str(frozen.access_key), secret_key=str(frozen.secret_key), token=frozen.token)
         return creds
 
     def get_deployment_session(self, account_id: str, region_name: str) -> Session:
@@ -192,19 +307,28 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
         toolchain_region = self.config.get("toolchain_region")
         if not self.created:
             raise seedfarmer.errors.InvalidConfigurationError("The SessionManager object was never properly created...")
-        if session_key not in self.sessions.keys():
+        if session_key in self.sessions:
+            return self.sessions[session_key][self.SESSION]  # type: ignore[no-any-return]
+        # Each account / region assumes its deployment role once, concurrent callers wait for that session
+        with self._session_lock(session_key):
+            if session_key in self.sessions:
+                return self.sessions[session_key][self.SESSION]  # type: ignore[no-any-return]
             _logger.info(f"Creating Session for {session_key}")
             self._check_for_toolchain()
+            sts_region = toolchain_region if toolchain_region else region_name
+
+            def _toolchain_sts_client() -> "STSClient":
+                toolchain_creds = self.get_toolchain_credentials()
+                return boto3_client(
+                    service_name="sts",
+                    aws_access_key_id=toolchain_creds.access_key,
+                    aws_secret_access_key=toolchain_creds.secret_key,
+                    aws_session_token=toolchain_creds.token,
+                    region_name=sts_region,
+                )
+
             toolchain_role = self.sessions[self.TOOLCHAIN_KEY][self.ROLE]
-            # the boto sessions are not thread safe, so create a new one for the toolchain role every time to be sure
-            sts_toolchain_client = boto3_client(
-                service_name="sts",
-                aws_access_key_id=toolchain_role["Credentials"]["AccessKeyId"],
-                aws_secret_access_key=toolchain_role["Credentials"]["SecretAccessKey"],
-                aws_session_token=toolchain_role["Credentials"]["SessionToken"],
-                region_name=toolchain_region if toolchain_region else region_name,
-            )
-            partition = sts_toolchain_client.get_caller_identity()["Arn"].split(":")[1]
+            partition = toolchain_role["AssumedRoleUser"]["Arn"].split(":")[1]
             deployment_role_arn = get_deployment_role_arn(
                 partition=partition,
                 deployment_account_id=account_id,
@@ -216,11 +340,24 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
                 f"""The assumed toolchain role {toolchain_role["AssumedRoleUser"]["Arn"]} will
                  try and assume the deployment role: {deployment_role_arn}"""
             )
-            try:
-                deployment_role = sts_toolchain_client.assume_role(
-                    RoleArn=deployment_role_arn,
-                    RoleSessionName="deployment_role",
+
+            cache_key = {
+                "role_arn": deployment_role_arn,
+                "source_arn": toolchain_role["AssumedRoleUser"]["Arn"],
+                "session_name": "deployment_role",
+            }
+
+            def _assume_deployment_role() -> "AssumeRoleResponseTypeDef":
+                return _toolchain_sts_client().assume_role(
+                    RoleArn=deployment_role_arn, RoleSessionName="deployment_role"
                 )
+
+            def _refresh_deployment_role() -> "AssumeRoleResponseTypeDef":
+                _logger.info(f"Refreshing the deployment role credentials for {session_key}")
+                return credentials_cache.assume_role(cache_key, _assume_deployment_role)
+
+            try:
+                deployment_role = credentials_cache.assume_role(cache_key, _assume_deployment_role)
             except botocore.exceptions.ClientError as ce:
                 raise seedfarmer.errors.InvalidSessionError(
                     f"""
@@ -233,24 +370,27 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
                    This is gotten from the deployment manifest under the targetAccountMappings section.)
                 """
                 )
-            deployment_session = create_new_session_with_creds(
-                aws_access_key_id=deployment_role["Credentials"]["AccessKeyId"],
-                aws_secret_access_key=deployment_role["Credentials"]["SecretAccessKey"],
-                aws_session_token=deployment_role["Credentials"]["SessionToken"],
-                region_name=region_name,
+            deployment_session = _refreshable_session(
+                role=deployment_role, assume_role=_refresh_deployment_role, region_name=region_name
             )
             self.sessions[session_key] = {self.SESSION: deployment_session, self.ROLE: deployment_role}
             return deployment_session
-        else:
-            return self.sessions[session_key][self.SESSION]  # type: ignore[no-any-return]
 
     # These methods below should not be called outside of this class
 
+    def _session_lock(self, session_key: str) -> threading.Lock:
+        with self._session_locks_guard:
+            return self._session_locks.setdefault(session_key, threading.Lock())
+
     def _check_for_toolchain(self) -> None:
-        if self.TOOLCHAIN_KEY not in self.sessions.keys():
-            _logger.info("Creating toolchain session")
-            session, role = self._get_toolchain()
-            self.sessions = {self.TOOLCHAIN_KEY: {self.SESSION: session, self.ROLE: role}}
+        if self.TOOLCHAIN_KEY in self.sessions:
+            return
+        with self._session_lock(self.TOOLCHAIN_KEY):
+            if self.TOOLCHAIN_KEY not in self.sessions:
+                _logger.info("Creating toolchain session")
+                session, role = self._get_toolchain()
+                self.sessions = {self.TOOLCHAIN_KEY: {self.SESSION: session, self.ROLE: role}}
+                self._clear_session_caches()
 
     def _get_toolchain(self) -> Tuple[Session, "AssumeRoleResponseTypeDef"]:
         region_name = self.config.get("region_name")
@@ -271,26 +411,43 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
                       """
         )
         user_session = create_new_session(region_name=region_name, profile=profile_name)
-        user_account_id, _, partition = get_sts_identity_info(session=user_session)
-        toolchain_role_arn = get_toolchain_role_arn(
-            partition=partition,
-            toolchain_account_id=user_account_id,
-            project_name=cast(str, project_name),
-            qualifier=cast(str, qualifier),
-            role_prefix=role_prefix,
-        )
-        _logger.debug(
-            f"""The active user session will assume the toolchain role
+        user_client = boto3_client(service_name="sts", session=user_session)
+        user_credentials = user_session.get_credentials()
+        # The active credentials identify the caller without an STS call, the role ARN is only needed to assume it
+        cache_key: Optional[Dict[str, Optional[str]]] = {
+            "source_access_key": user_credentials.access_key if user_credentials else None,
+            "profile": profile_name,
+            "project": project_name,
+            "qualifier": qualifier,
+            "role_prefix": role_prefix,
+            "session_name": "toolchainrole",
+        }
+        if user_credentials is None:
+            cache_key = None
+
+        def _assume_toolchain_role() -> "AssumeRoleResponseTypeDef":
+            user_account_id, _, partition = get_sts_identity_info(session=user_session)
+            toolchain_role_arn = get_toolchain_role_arn(
+                partition=partition,
+                toolchain_account_id=user_account_id,
+                project_name=cast(str, project_name),
+                qualifier=cast(str, qualifier),
+                role_prefix=role_prefix,
+            )
+            _logger.debug(
+                f"""The active user session will assume the toolchain role
                       arn = {toolchain_role_arn}
                       toolchain_region = {toolchain_region}
                       """
-        )
-        user_client = boto3_client(service_name="sts", session=user_session)
-        try:
-            toolchain_role = user_client.assume_role(
-                RoleArn=toolchain_role_arn,
-                RoleSessionName="toolchainrole",
             )
+            return user_client.assume_role(RoleArn=toolchain_role_arn, RoleSessionName="toolchainrole")
+
+        def _refresh_toolchain_role() -> "AssumeRoleResponseTypeDef":
+            _logger.info("Refreshing the toolchain role credentials")
+            return credentials_cache.assume_role(cache_key, _assume_toolchain_role)
+
+        try:
+            toolchain_role = credentials_cache.assume_role(cache_key, _assume_toolchain_role)
         except botocore.exceptions.ClientError as ce:
             raise seedfarmer.errors.InvalidSessionError(
                 f"""
@@ -300,10 +457,9 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
             or use a session that DOES have that user.
             """
             )
-        toolchain_session = create_new_session_with_creds(
-            aws_access_key_id=toolchain_role["Credentials"]["AccessKeyId"],
-            aws_secret_access_key=toolchain_role["Credentials"]["SecretAccessKey"],
-            aws_session_token=toolchain_role["Credentials"]["SessionToken"],
+        toolchain_session = _refreshable_session(
+            role=toolchain_role,
+            assume_role=_refresh_toolchain_role,
             region_name=toolchain_region if toolchain_region else region_name,
         )
 
@@ -321,6 +477,13 @@ class SessionManagerRemoteImpl(ISessionManager, metaclass=SingletonMeta):
             sleep(interval)
             _logger.info(f"Reaping Sessions - sleeping for {interval} seconds")
             self.sessions = {}
+            self._clear_session_caches()
+
+    @staticmethod
+    def _clear_session_caches() -> None:
+        # The boto3 clients and CodeBuild pollers are cached per session, drop those of the replaced sessions
+        clear_client_cache()
+        clear_build_pollers()
 
 
 class SessionManagerLocalImpl(ISessionManager, metaclass=SingletonMeta):
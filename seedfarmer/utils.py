@@ -18,6 +18,7 @@ import logging
 import os
 import re
 import shutil
+import threading
 from typing import Any, Dict, List, Optional, Union
 
 import humps
@@ -34,6 +35,9 @@ _logger: logging.Logger = logging.getLogger(__name__)
 
 NoDatesSafeLoader = yaml.SafeLoader
 
+_path_locks: Dict[str, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
 
 class CfnSafeYamlLoader(yaml.SafeLoader):
     """
@@ -327,6 +331,28 @@ def create_output_dir(name: str, path_override: Optional[str] = None) -> str:
     return out_dir
 
 
+def get_path_lock(path: str) -> threading.Lock:
+    """Get a process-wide lock for a local path
+
+    Used to serialize work (clone, pull, extract) on a shared directory when modules are processed concurrently
+
+    Parameters
+    ----------
+    path : str
+        The local path to lock
+
+    Returns
+    -------
+    threading.Lock
+        The lock associated with the normalized path
+    """
+    key = os.path.abspath(path)
+    with _path_locks_guard:
+        if key not in _path_locks:
+            _path_locks[key] = threading.Lock()
+        return _path_locks[key]
+
+
 def delete_all_output_dir(name: str = ".seedfarmerlocal-") -> None:
     pattern = os.path.join(os.getcwd(), f"{name}-*")
     for path in glob.glob(pattern):
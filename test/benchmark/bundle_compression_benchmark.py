@@ -0,0 +1,90 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License").
+#    You may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Micro-benchmark of the bundle compression policy used by ``bundle.stream_bundle``.
+
+Builds a synthetic module (source files, vendored archives and incompressible model
+weights, 200 MB by default) and compares deflating every file, as bundles were
+previously built, against the policy storing already-compressed files.
+
+    python test/benchmark/bundle_compression_benchmark.py [--size-mb 200] [--level 6]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import zipfile
+from typing import Dict
+
+import seedfarmer.mgmt.bundle as bundle
+
+
+def _build_module(root: str, size_mb: int) -> str:
+    module_path = os.path.join(root, "module")
+    mb = 1024 * 1024
+    # ~10% source, ~30% vendored archives, ~60% model weights
+    for i in range(max(1, size_mb // 10) * 20):
+        path = os.path.join(module_path, "src", f"pkg{i % 20}", f"file{i}.py")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(f"def function_{i}(value):\n    return value * {i}\n" * 1200)
+    os.makedirs(os.path.join(module_path, "vendor"))
+    for i in range(max(1, size_mb * 3 // 10 // 10)):
+        with zipfile.ZipFile(os.path.join(module_path, "vendor", f"lib{i}.jar"), "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("payload.bin", os.urandom(10 * mb))
+    os.makedirs(os.path.join(module_path, "weights"))
+    for i in range(max(1, size_mb * 6 // 10 // 20)):
+        with open(os.path.join(module_path, "weights", f"shard{i}.bin"), "wb") as f:
+            f.write(os.urandom(20 * mb))
+    return module_path
+
+
+def _deflate_all(zip_filename: str, entries: Dict[str, str]) -> None:
+    with zipfile.ZipFile(zip_filename, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for path in sorted(entries):
+            zf.write(entries[path], f"bundle/{path}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size-mb", type=int, default=200)
+    parser.add_argument("--level", type=int, default=bundle.BUNDLE_DEFAULT_COMPRESSION_LEVEL)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        module_path = _build_module(root, args.size_mb)
+        entries = bundle._bundle_entries(dirs=[(module_path, "module")])
+        total_size = sum(os.path.getsize(src) for src in entries.values())
+
+        deflate_zip = os.path.join(root, "deflate-all.zip")
+        start = time.perf_counter()
+        _deflate_all(deflate_zip, entries)
+        deflate_time = time.perf_counter() - start
+
+        policy_zip = os.path.join(root, "policy.zip")
+        start = time.perf_counter()
+        bundle._write_zipfile(zip_filename=policy_zip, base_dir="bundle", entries=entries, compresslevel=args.level)
+        policy_time = time.perf_counter() - start
+
+        mb = 1024 * 1024
+        print(f"files in bundle:   {len(entries)} ({total_size / mb:.1f} MiB)")
+        print(f"deflate all:       {deflate_time:.2f}s, {os.path.getsize(deflate_zip) / mb:.1f} MiB")
+        print(f"policy (level {args.level}):  {policy_time:.2f}s, {os.path.getsize(policy_zip) / mb:.1f} MiB")
+        print(f"speedup:           {deflate_time / policy_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
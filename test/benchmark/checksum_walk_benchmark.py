@@ -0,0 +1,119 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License").
+#    You may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+"""
+Micro-benchmark of the module file walk used by ``checksum.get_module_md5``.
+
+Builds a synthetic module tree (50k files by default, most of them in ignored
+``node_modules`` / ``cdk.out`` trees, as is typical for node / CDK modules) and times
+the previous nested-scandir walk against the single-pass pruning walker.
+
+    python test/benchmark/checksum_walk_benchmark.py [--files 50000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import seedfarmer.checksum as checksum
+
+
+def _build_tree(root: str, total_files: int) -> None:
+    module_path = os.path.join(root, "modules", "module-bench")
+    ignored_files = int(total_files * 0.9)
+    kept_files = total_files - ignored_files
+    with open(os.path.join(root, ".gitignore"), "w") as gitignore:
+        gitignore.write("*.tmp\n__pycache__/\n")
+    os.makedirs(module_path)
+    with open(os.path.join(module_path, ".gitignore"), "w") as gitignore:
+        gitignore.write("node_modules/\ncdk.out/\n*.log\n!keep.log\n")
+
+    for i in range(ignored_files):
+        tree = "node_modules" if i % 2 else "cdk.out"
+        path = os.path.join(module_path, tree, f"pkg{i % 500}", f"lib{i % 7}", f"file{i}.js")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write("x")
+    for i in range(kept_files):
+        path = os.path.join(module_path, "src", f"pkg{i % 100}", f"file{i}.py")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write("x")
+
+
+def _legacy_walk(project_path: str, module_path: str, excluded_files: List[str]) -> List[str]:
+    ignore_maps: Dict[str, Any] = checksum._evaluate_gitignore(project_path=project_path, module_path=module_path)
+    all_files: List[str] = []
+
+    def scandir(dirname: str) -> List[str]:
+        files = [
+            f.path
+            for f in os.scandir(dirname)
+            if f.is_file()
+            and os.path.split(f)[1] not in excluded_files
+            and not checksum._evaluate_file(f.path, ignore_maps)
+        ]
+        all_files.extend(files)
+        subfolders = [f.path for f in os.scandir(dirname) if f.is_dir()]
+        for dirname in list(subfolders):
+            (
+                subfolders.extend(scandir(dirname))
+                if not os.path.split(dirname)[1].startswith(".") and not checksum._evaluate_file(dirname, ignore_maps)
+                else None
+            )
+        return subfolders
+
+    scandir(os.path.join(project_path, module_path))
+    return all_files
+
+
+def _walk(project_path: str, module_path: str, excluded_files: List[str]) -> List[str]:
+    is_ignored = checksum._GitignoreMatcher(
+        checksum._get_gitignore_paths(project_path=project_path, module_path=module_path)
+    )
+    return checksum._walk_module_files(
+        root=os.path.join(project_path, module_path), excluded_files=set(excluded_files), is_ignored=is_ignored
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=50000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        _build_tree(root, args.files)
+        module_path = os.path.join("modules", "module-bench")
+        excluded_files = [".gitignore"]
+
+        start = time.perf_counter()
+        legacy = _legacy_walk(root, module_path, excluded_files)
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        walked = _walk(root, module_path, excluded_files)
+        walk_time = time.perf_counter() - start
+
+        assert sorted(os.path.abspath(f) for f in legacy) == sorted(walked), "walkers disagree"
+        print(f"files in tree:   {args.files}")
+        print(f"files selected:  {len(walked)}")
+        print(f"nested scandir:  {legacy_time:.3f}s")
+        print(f"single pass:     {walk_time:.3f}s")
+        print(f"speedup:         {legacy_time / walk_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -41,3 +41,236 @@ def test_private_methods_checksum():
 
     _check_non = checksum._generate_file_hash(filepath=f"{file_tst}_bak")
     assert _check_non == "d41d8cd98f00b204e9800998ecf8427e"
+
+
+def _copy_module_test(tmp_path):
+    import shutil
+
+    project_path = os.path.join(os.getcwd(), "test", "unit-test", "mock_data")
+    shutil.copytree(os.path.join(project_path, "modules", "module-test"), tmp_path / "modules" / "module-test")
+    for dirpath, _, filenames in os.walk(tmp_path):
+        for filename in filenames:
+            os.utime(os.path.join(dirpath, filename), ns=(1_000_000_000, 1_000_000_000))
+    return str(tmp_path), os.path.join(str(tmp_path), "modules", "module-test")
+
+
+@pytest.mark.checksum
+def test_checksum_hash_cache(tmp_path, mocker):
+    import seedfarmer.checksum as checksum
+
+    project_path, module_path = _copy_module_test(tmp_path)
+    _checksum = checksum.get_module_md5(project_path=project_path, module_path=module_path)
+    assert checksum.get_module_md5(project_path=project_path, module_path=module_path, use_hash_cache=True) == _checksum
+    assert os.path.isfile(os.path.join(project_path, checksum.HASH_CACHE_FILE))
+
+    # A fresh cache loaded from disk should not re-hash unchanged files
+    checksum._hash_caches.clear()
+    hash_spy = mocker.spy(checksum, "_generate_file_hash")
+    assert checksum.get_module_md5(project_path=project_path, module_path=module_path, use_hash_cache=True) == _checksum
+    assert hash_spy.call_count == 0
+
+    # A changed stat signature forces a re-hash
+    with open(os.path.join(module_path, "app.py"), "a") as app_file:
+        app_file.write("\n# changed\n")
+    _changed = checksum.get_module_md5(project_path=project_path, module_path=module_path, use_hash_cache=True)
+    assert hash_spy.call_count == 1
+    assert _changed != _checksum
+    assert _changed == checksum.get_module_md5(project_path=project_path, module_path=module_path)
+
+
+@pytest.mark.checksum
+def test_checksum_hash_cache_invalid(tmp_path, mocker):
+    import json
+
+    import seedfarmer.checksum as checksum
+
+    project_path, module_path = _copy_module_test(tmp_path)
+    cache_path = os.path.join(project_path, checksum.HASH_CACHE_FILE)
+    os.makedirs(os.path.dirname(cache_path))
+    with open(cache_path, "w") as cache_file:
+        cache_file.write("{not json")
+    assert checksum._FileHashCache(cache_path)._entries == {}
+
+    with open(cache_path, "w") as cache_file:
+        json.dump({"version": 0, "entries": {os.path.join(module_path, "app.py"): [0, 0, 0, "stale"]}}, cache_file)
+    assert checksum._FileHashCache(cache_path)._entries == {}
+
+
+@pytest.mark.checksum
+def test_gitignore_matcher_parity(tmp_path):
+    import seedfarmer.checksum as checksum
+
+    module_path = tmp_path / "modules" / "module-a"
+    for rel_path in [
+        "app.py",
+        "debug.log",
+        "keep.log",
+        "build/out.js",
+        "cdk.out/manifest.json",
+        "src/node_modules/dep/index.js",
+        "src/lib/handler.py",
+        "src/lib/handler.pyc",
+        "docs/notes.tmp",
+    ]:
+        (module_path / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (module_path / rel_path).write_text(rel_path)
+    (tmp_path / ".gitignore").write_text("node_modules/\n*.tmp\n")
+    (tmp_path / "modules" / ".gitignore").write_text("# comment\n\n*.pyc\n")
+    (module_path / ".gitignore").write_text("*.log\n!keep.log\n/build\ncdk.out/\n")
+
+    project_path, module_rel_path = str(tmp_path), os.path.join("modules", "module-a")
+    ignore_maps = checksum._evaluate_gitignore(project_path=project_path, module_path=module_rel_path)
+    is_ignored = checksum._GitignoreMatcher(
+        checksum._get_gitignore_paths(project_path=project_path, module_path=module_rel_path)
+    )
+    for dirpath, dirnames, filenames in os.walk(module_path):
+        for name in dirnames + filenames:
+            path = os.path.join(dirpath, name)
+            assert is_ignored(path) == checksum._evaluate_file(path, ignore_maps), path
+
+    all_files = checksum._walk_module_files(
+        root=os.path.join(project_path, module_rel_path), excluded_files={".gitignore"}, is_ignored=is_ignored
+    )
+    assert sorted(os.path.relpath(f, module_path) for f in all_files) == [
+        "app.py",
+        "keep.log",
+        os.path.join("src", "lib", "handler.py"),
+    ]
+
+
+@pytest.mark.checksum
+def test_checksum_hash_workers():
+    import seedfarmer.checksum as checksum
+
+    root = pathlib.Path(os.getcwd())
+    project_path = os.path.join(root, "test", "unit-test", "mock_data")
+    module_path = os.path.join(project_path, "modules", "module-test")
+    _checksum = checksum.get_module_md5(project_path=project_path, module_path=module_path, hash_workers=4)
+    assert _checksum == "6320bfae9c91bed55ac6f3dc6f752f88"
+
+
+@pytest.mark.checksum
+def test_generate_file_hash_mmap(tmp_path, mocker):
+    import hashlib
+
+    import seedfarmer.checksum as checksum
+
+    large_file = tmp_path / "large.bin"
+    large_file.write_bytes(os.urandom(256 * 1024))
+    expected = hashlib.md5(large_file.read_bytes(), usedforsecurity=False).hexdigest()
+    assert checksum._generate_file_hash(str(large_file)) == expected
+
+    mocker.patch("seedfarmer.checksum._MMAP_THRESHOLD", 1024)
+    mmap_spy = mocker.spy(checksum.mmap, "mmap")
+    assert checksum._generate_file_hash(str(large_file)) == expected
+    assert mmap_spy.call_count == 1
+
+
+@pytest.mark.checksum
+def test_checksum_git_index(tmp_path, mocker):
+    import shutil
+
+    import git
+
+    import seedfarmer.checksum as checksum
+
+    project_path, module_path = _copy_module_test(tmp_path / "repo")
+    repo = git.Repo.init(project_path)
+    repo.index.add(
+        [
+            os.path.relpath(os.path.join(dirpath, f), project_path)
+            for dirpath, _, files in os.walk(module_path)
+            for f in files
+        ]
+    )
+    repo.index.write()
+
+    # The same content outside of a git repo is hashed from the files and must give the same digest
+    shutil.copytree(project_path, tmp_path / "plain", ignore=shutil.ignore_patterns(".git"))
+    plain_project_path = str(tmp_path / "plain")
+    plain_module_path = os.path.join(plain_project_path, "modules", "module-test")
+
+    blob_spy = mocker.spy(checksum, "_generate_git_blob_hash")
+    _checksum = checksum.get_module_md5(
+        project_path=project_path, module_path=module_path, checksum_mode=checksum.CHECKSUM_MODE_GIT_INDEX
+    )
+    assert blob_spy.call_count == 0
+    assert _checksum.startswith(checksum.GIT_INDEX_DIGEST_PREFIX)
+    assert checksum.get_digest_mode(_checksum) == checksum.CHECKSUM_MODE_GIT_INDEX
+    assert _checksum == checksum.get_module_md5(
+        project_path=plain_project_path,
+        module_path=plain_module_path,
+        checksum_mode=checksum.CHECKSUM_MODE_GIT_INDEX,
+    )
+
+    # Modified and untracked files are read from the working tree
+    for path in [module_path, plain_module_path]:
+        with open(os.path.join(path, "app.py"), "a") as app_file:
+            app_file.write("\n# changed\n")
+        with open(os.path.join(path, "new.py"), "w") as new_file:
+            new_file.write("print('new')\n")
+    blob_spy.reset_mock()
+    _changed = checksum.get_module_md5(
+        project_path=project_path, module_path=module_path, checksum_mode=checksum.CHECKSUM_MODE_GIT_INDEX
+    )
+    assert blob_spy.call_count == 2
+    assert _changed != _checksum
+    assert _changed == checksum.get_module_md5(
+        project_path=plain_project_path,
+        module_path=plain_module_path,
+        checksum_mode=checksum.CHECKSUM_MODE_GIT_INDEX,
+    )
+    assert (
+        checksum.get_digest_mode(checksum.get_module_md5(project_path=project_path, module_path=module_path))
+        == checksum.CHECKSUM_MODE_CONTENT
+    )
+
+
+@pytest.mark.checksum
+def test_generate_git_blob_hash(tmp_path):
+    import seedfarmer.checksum as checksum
+
+    blob = tmp_path / "hello.txt"
+    blob.write_bytes(b"hello\n")
+    # git hash-object hello.txt
+    assert checksum._generate_git_blob_hash(str(blob)) == "ce013625030ba8dba906f756967f9e9ca394464a"
+    assert checksum._generate_git_blob_hash(str(tmp_path / "missing")) == "e69de29bb2d1d6434b8b29ae775ad8c2e48c5391"
+
+
+@pytest.mark.checksum
+@pytest.mark.parametrize("algorithm", ["md5", "blake2b", "xxh3"])
+def test_checksum_algorithm(algorithm):
+    import seedfarmer.checksum as checksum
+
+    if algorithm == "xxh3":
+        pytest.importorskip("xxhash")
+    root = pathlib.Path(os.getcwd())
+    project_path = os.path.join(root, "test", "unit-test", "mock_data")
+    module_path = os.path.join(project_path, "modules", "module-test")
+    _checksum = checksum.get_module_md5(project_path=project_path, module_path=module_path, algorithm=algorithm)
+    assert checksum.get_digest_algorithm(_checksum) == algorithm
+    assert _checksum.startswith(f"{algorithm}:") == (algorithm != "md5")
+    _git_checksum = checksum.get_module_md5(
+        project_path=project_path,
+        module_path=module_path,
+        algorithm=algorithm,
+        checksum_mode=checksum.CHECKSUM_MODE_GIT_INDEX,
+    )
+    assert checksum.get_digest_algorithm(_git_checksum) == algorithm
+    assert checksum.get_digest_mode(_git_checksum) == checksum.CHECKSUM_MODE_GIT_INDEX
+    assert checksum.get_digest_algorithm(checksum.get_digest(b"data", algorithm)) == algorithm
+
+
+@pytest.mark.checksum
+def test_checksum_algorithm_unavailable(mocker):
+    import sys
+
+    import seedfarmer.checksum as checksum
+    from seedfarmer.errors import InvalidConfigurationError
+
+    assert checksum.get_digest(b"data") == "8d777f385d3dfec8815d20f7496026dc"
+    mocker.patch.dict(sys.modules, {"xxhash": None})
+    with pytest.raises(InvalidConfigurationError):
+        checksum.get_digest(b"data", "xxh3")
+    with pytest.raises(InvalidConfigurationError):
+        checksum.get_digest(b"data", "sha0")
@@ -454,7 +454,7 @@ def test_deploy_deployment(session_manager, mocker):
         return_value="test/unit-test/mock_data/mock_deployspec.yaml",
     )
     mocker.patch("seedfarmer.commands._deployment_commands.checksum.get_module_md5", return_value="asfsadfsdfa")
-    mocker.patch("seedfarmer.commands._deployment_commands.hashlib.md5", return_value=mock_hashlib)
+    mocker.patch("seedfarmer.commands._deployment_commands.checksum.get_digest", return_value=mock_hashlib.hexdigest())
 
     mocker.patch("seedfarmer.commands._deployment_commands._deploy_validated_deployment", return_value=None)
     mocker.patch("seedfarmer.commands._deployment_commands.du.need_to_build", return_value=None)
@@ -468,6 +468,448 @@ def test_deploy_deployment(session_manager, mocker):
     )
 
 
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+def test_get_module_rehash(session_manager, mocker):
+    from seedfarmer.mgmt.module_info import ModuleConst
+
+    mocker.patch("seedfarmer.Config.CHECKSUM_ALGORITHM", new_callable=mocker.PropertyMock, return_value="blake2b")
+    mocker.patch(
+        "seedfarmer.commands._deployment_commands.get_deployspec_path",
+        return_value="test/unit-test/mock_data/mock_deployspec.yaml",
+    )
+    dep = DeploymentManifest(**mock_deployment_manifest_huge.deployment_manifest)
+    module = dep.groups[0].modules[0]
+    module.set_local_path("test/unit-test/mock_data/modules/module-test")
+
+    # Digests as an earlier md5 deployment generated them
+    module.bundle_md5 = dc._get_bundle_md5(module=module, use_hash_cache=False, algorithm="md5")
+    md5_digests = {
+        ModuleConst.BUNDLE: module.bundle_md5,
+        ModuleConst.MANIFEST: dc._get_manifest_md5(module=module, algorithm="md5"),
+        ModuleConst.DEPLOYSPEC: dc._get_deployspec_md5(module=module, algorithm="md5"),
+    }
+
+    # Digests with the configured algorithm
+    module.bundle_md5 = dc._get_bundle_md5(module=module, use_hash_cache=False)
+    module.manifest_md5 = dc._get_manifest_md5(module=module)
+    module.deployspec_md5 = dc._get_deployspec_md5(module=module)
+    assert module.bundle_md5.startswith("blake2b:")
+    assert module.manifest_md5.startswith("blake2b:")
+
+    rehash = dc._get_module_rehash(module=module, use_hash_cache=False)
+    for module_const, digest in md5_digests.items():
+        assert rehash[module_const]("md5") == digest
+
+
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+def test_deploy_deployment_verify_workers(session_manager, mocker):
+    import seedfarmer.mgmt.deploy_utils as du
+
+    mocker.patch(
+        "seedfarmer.mgmt.deploy_utils.mi.get_parameter_data_cache",
+        return_value=mock_module_info_huge.module_index_info_huge,
+    )
+    module_info_index = du.populate_module_info_index(
+        deployment_manifest=DeploymentManifest(**mock_manifests.deployment_manifest)
+    )
+    mocker.patch("seedfarmer.commands._deployment_commands.print_manifest_inventory", return_value=None)
+    mocker.patch("seedfarmer.commands._deployment_commands.du.validate_group_parameters", return_value=None)
+    mocker.patch(
+        "seedfarmer.commands._deployment_commands.get_deployspec_path",
+        return_value="test/unit-test/mock_data/mock_deployspec.yaml",
+    )
+    mocker.patch("seedfarmer.commands._deployment_commands.checksum.get_module_md5", return_value="asfsadfsdfa")
+    mocker.patch("seedfarmer.commands._deployment_commands.du.need_to_build", return_value=True)
+    mocker.patch("seedfarmer.commands._deployment_commands.print_bolded", return_value=None)
+
+    deployed = []
+    for verify_workers in [1, 8]:
+        validated_mock = mocker.patch(
+            "seedfarmer.commands._deployment_commands._deploy_validated_deployment", return_value=None
+        )
+        dc.deploy_deployment(
+            deployment_manifest=DeploymentManifest(**mock_deployment_manifest_huge.deployment_manifest),
+            module_info_index=module_info_index,
+            module_upstream_dep={},
+            verify_workers=verify_workers,
+        )
+        groups_to_deploy = validated_mock.call_args.kwargs["groups_to_deploy"]
+        deployed.append(
+            [(group.name, module.name, module.bundle_md5) for group in groups_to_deploy for module in group.modules]
+        )
+    assert deployed[0] == deployed[1]
+    assert len(deployed[0]) > 1
+
+
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+def test_deploy_deployment_resume(session_manager, mocker):
+    import seedfarmer.mgmt.deploy_utils as du
+    import seedfarmer.mgmt.journal as journal
+    from seedfarmer.models.deploy_responses import ModuleDeploymentResponse
+
+    mocker.patch(
+        "seedfarmer.mgmt.deploy_utils.mi.get_parameter_data_cache",
+        return_value=mock_module_info_huge.module_index_info_huge,
+    )
+    module_info_index = du.populate_module_info_index(
+        deployment_manifest=DeploymentManifest(**mock_manifests.deployment_manifest)
+    )
+    mocker.patch("seedfarmer.commands._deployment_commands.print_manifest_inventory", return_value=None)
+    mocker.patch("seedfarmer.commands._deployment_commands.du.validate_group_parameters", return_value=None)
+    mocker.patch("seedfarmer.commands._deployment_commands.print_bolded", return_value=None)
+    verified = []
+
+    def _verify(group_name, module, **kwargs):
+        verified.append(f"{group_name}-{module.name}")
+        module.bundle_md5 = f"md5-{group_name}-{module.name}"
+
+    mocker.patch("seedfarmer.commands._deployment_commands._verify_module", side_effect=_verify)
+    mocker.patch("seedfarmer.commands._deployment_commands._get_module_rehash", return_value={})
+    need_to_build = mocker.patch("seedfarmer.commands._deployment_commands.du.need_to_build", return_value=True)
+    validated_mock = mocker.patch(
+        "seedfarmer.commands._deployment_commands._deploy_validated_deployment", return_value=None
+    )
+
+    def _reattach(self, build_id, stream_name_prefix, log_file):
+        if build_id == "build-efs":
+            return None
+        return ModuleDeploymentResponse(
+            deployment="mlops",
+            group=self.mdo.group_name,
+            module=self.mdo.module_name,
+            status="SUCCESS" if build_id == "build-buckets" else "ERROR",
+        )
+
+    reattach = mocker.patch(
+        "seedfarmer.commands._deployment_commands.DeployRemoteModule.reattach_build",
+        autospec=True,
+        side_effect=_reattach,
+    )
+    resume_state = journal.JournalState(
+        [
+            {"event": "plan", "manifest_digest": "blake2b:abc"},
+            {"event": "build_started", "module": "optionals-networking", "build_id": "build-networking"},
+            {
+                "event": "module_completed",
+                "module": "optionals-networking",
+                "status": "SUCCESS",
+                "bundle_md5": "md5-optionals-networking",
+            },
+            {
+                "event": "build_started",
+                "module": "optionals-datalake-buckets",
+                "build_id": "build-buckets",
+                "bundle_md5": "md5-optionals-datalake-buckets",
+            },
+            # Changed since the interrupted apply deployed it
+            {
+                "event": "module_completed",
+                "module": "platform-kubeflow-platform",
+                "status": "SUCCESS",
+                "bundle_md5": "md5-stale",
+            },
+            {"event": "build_started", "module": "core-eks", "build_id": "build-eks"},
+            {"event": "build_started", "module": "core-efs", "build_id": "build-efs"},
+        ]
+    )
+    for build in resume_state.running_builds.values():
+        build.update({"stream_name_prefix": "codeseeder-prefix", "log_file": "build.log"})
+    dep = DeploymentManifest(**mock_deployment_manifest_huge.deployment_manifest)
+    dep.validate_and_set_module_defaults()
+    execution_journal = mocker.MagicMock()
+    with journal.record_execution(execution_journal):
+        dc.deploy_deployment(
+            deployment_manifest=dep,
+            module_info_index=module_info_index,
+            module_upstream_dep={},
+            resume_state=resume_state,
+        )
+
+    assert reattach.call_count == 3
+    execution_journal.module_completed.assert_any_call(
+        module="optionals-datalake-buckets",
+        status="SUCCESS",
+        build_id="build-buckets",
+        bundle_md5="md5-optionals-datalake-buckets",
+    )
+    execution_journal.module_completed.assert_any_call(
+        module="core-eks", status="ERROR", build_id="build-eks", bundle_md5=None
+    )
+    execution_journal.module_completed.assert_any_call(
+        module="core-efs", status="ERROR", build_id="build-efs", bundle_md5=None
+    )
+    resumed = ["optionals-networking", "optionals-datalake-buckets"]
+    # Every module is verified to tell whether it changed since the interrupted apply
+    assert set(verified) == {f"{group.name}-{module.name}" for group in dep.groups for module in group.modules}
+    # Failed and missing builds and changed modules are deployed again
+    groups_to_deploy = validated_mock.call_args.kwargs["groups_to_deploy"]
+    to_deploy = [f"{group.name}-{module.name}" for group in groups_to_deploy for module in group.modules]
+    assert {"core-eks", "core-efs", "platform-kubeflow-platform"} <= set(to_deploy)
+    assert not set(resumed) & set(to_deploy)
+    # The modules deployed before the interruption still count as redeployed for their dependents
+    assert set(resumed) <= set(need_to_build.call_args.kwargs["active_modules"])
+
+
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+def test_module_deploy_object_cancel_event(session_manager):
+    import threading
+
+    dep = DeploymentManifest(**mock_deployment_manifest_huge.deployment_manifest)
+    dep.validate_and_set_module_defaults()
+    cancel_event = threading.Event()
+    mdo = ModuleDeployObject(deployment_manifest=dep, group_name="core", module_name="eks", cancel_event=cancel_event)
+    # Runtime state, never dumped, and kept by copies of the deploy object
+    assert "cancel_event" not in mdo.model_dump() and "upload_concurrency" not in mdo.model_dump()
+    assert mdo.model_copy().cancel_event is cancel_event
+    assert (
+        ModuleDeployObject(deployment_manifest=dep, group_name="core", module_name="eks", upload_concurrency=4)
+        .model_copy()
+        .upload_concurrency
+        == 4
+    )
+
+
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+def test_reattach_build(session_manager, mocker):
+    import seedfarmer.deployment.deploy_remote as deploy_remote
+    import seedfarmer.services._codebuild as codebuild
+
+    dep = DeploymentManifest(**mock_deployment_manifest_huge.deployment_manifest)
+    dep.validate_and_set_module_defaults()
+    dep._partition = "aws"
+    mdo = ModuleDeployObject(deployment_manifest=dep, group_name="core", module_name="eks")
+    governed = mocker.patch.object(deploy_remote, "governed")
+    reattach = mocker.patch.object(
+        deploy_remote.codebuild_remote,
+        "reattach",
+        return_value=codebuild.BuildInfo(
+            build_id="build-eks",
+            status=codebuild.BuildStatus.succeeded,
+            current_phase=codebuild.BuildPhaseType.completed,
+            start_time=None,
+            end_time=None,
+            duration_in_seconds=0,
+            exported_env_vars={},
+            phases=[],
+            logs=codebuild.BuildCloudWatchLogs(enabled=False, group_name=None, stream_name=None),
+        ),
+    )
+    response = deploy_remote.DeployRemoteModule(mdo).reattach_build("build-eks", "codeseeder-prefix", "build.log")
+    assert response.status == "SUCCESS"
+    assert response.codebuild_metadata.codebuild_build_id == "build-eks"
+    # Re-attached builds count against the CodeBuild concurrency limit
+    governed.assert_called_once_with(account_id="123456789012", region="us-east-1", service="codebuild")
+
+    # A build that expired or cannot be found leaves the module to be deployed again
+    reattach.side_effect = seedfarmer.errors.RemoteDeploymentRuntimeError("CodeBuild build build-eks not found.")
+    assert deploy_remote.DeployRemoteModule(mdo).reattach_build("build-eks", "codeseeder-prefix", "build.log") is None
+
+
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+def test_deploy_validated_deployment_dag(session_manager, mocker):
+    import seedfarmer.mgmt.deploy_utils as du
+    from seedfarmer.models.deploy_responses import ModuleDeploymentResponse
+
+    dep = DeploymentManifest(**mock_manifests.deployment_manifest)
+    dep.validate_and_set_module_defaults()
+    for group in dep.groups:
+        for module in group.modules:
+            module.deploy_spec = DeploySpec(**mock_deployspec.dummy_deployspec)
+    module_upstream_dep, _ = du.generate_dependency_maps(dep)
+
+    deployed = []
+
+    def _deploy(mdo):
+        deployed.append(f"{mdo.group_name}-{mdo.module_name}")
+        return ModuleDeploymentResponse(
+            deployment="mlops", group=mdo.group_name, module=mdo.module_name, status="SUCCESS"
+        )
+
+    mocker.patch("seedfarmer.commands._deployment_commands._execute_deploy", side_effect=_deploy)
+    mocker.patch("seedfarmer.commands._deployment_commands.print_manifest_inventory", return_value=None)
+    mocker.patch("seedfarmer.commands._deployment_commands.print_bolded", return_value=None)
+    dc._deploy_validated_deployment(
+        deployment_manifest=dep,
+        deployment_manifest_wip=dep.model_copy(),
+        groups_to_deploy=dep.groups,
+        dryrun=False,
+        module_upstream_dep=module_upstream_dep,
+        dag_scheduler=True,
+    )
+    assert len(deployed) == 7
+    for module, upstream in module_upstream_dep.items():
+        for upstream_module in upstream:
+            assert deployed.index(upstream_module) < deployed.index(module)
+
+    # Group by group, uploads share the pool between the modules of the group that may run at once
+    dep = DeploymentManifest(**mock_manifests.deployment_manifest)
+    dep.validate_and_set_module_defaults()
+    for group in dep.groups:
+        for module in group.modules:
+            module.deploy_spec = DeploySpec(**mock_deployspec.dummy_deployspec)
+    dep.groups[0].concurrency = 1
+    group_limits = {
+        group.name: min(len(group.modules), group.concurrency or len(group.modules)) for group in dep.groups
+    }
+    mdos = []
+    mocker.patch(
+        "seedfarmer.commands._deployment_commands._execute_deploy",
+        side_effect=lambda mdo: mdos.append(mdo) or _deploy(mdo),
+    )
+    dc._deploy_validated_deployment(
+        deployment_manifest=dep,
+        deployment_manifest_wip=dep.model_copy(),
+        groups_to_deploy=dep.groups,
+        dryrun=False,
+        module_upstream_dep=module_upstream_dep,
+        dag_scheduler=False,
+    )
+    assert len(mdos) == 7
+    assert all(mdo.upload_concurrency == group_limits[mdo.group_name] for mdo in mdos)
+    assert group_limits[dep.groups[0].name] == 1
+
+
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+def test_deploy_validated_deployment_dag_error(session_manager, mocker):
+    import seedfarmer.mgmt.deploy_utils as du
+    from seedfarmer.models.deploy_responses import ModuleDeploymentResponse
+
+    dep = DeploymentManifest(**mock_manifests.deployment_manifest)
+    dep.validate_and_set_module_defaults()
+    for group in dep.groups:
+        for module in group.modules:
+            module.deploy_spec = DeploySpec(**mock_deployspec.dummy_deployspec)
+    module_upstream_dep, _ = du.generate_dependency_maps(dep)
+
+    deployed = []
+
+    def _deploy(mdo):
+        deployed.append(f"{mdo.group_name}-{mdo.module_name}")
+        return ModuleDeploymentResponse(
+            deployment="mlops",
+            group=mdo.group_name,
+            module=mdo.module_name,
+            status="ERROR" if mdo.module_name == "networking" else "SUCCESS",
+        )
+
+    mocker.patch("seedfarmer.commands._deployment_commands._execute_deploy", side_effect=_deploy)
+    mocker.patch("seedfarmer.commands._deployment_commands.print_manifest_inventory", return_value=None)
+    mocker.patch("seedfarmer.commands._deployment_commands.print_errored_modules_build_info", return_value=None)
+    with pytest.raises(seedfarmer.errors.ModuleDeploymentError):
+        dc._deploy_validated_deployment(
+            deployment_manifest=dep,
+            deployment_manifest_wip=dep.model_copy(),
+            groups_to_deploy=dep.groups,
+            dryrun=False,
+            module_upstream_dep=module_upstream_dep,
+            dag_scheduler=True,
+        )
+    assert "core-eks" not in deployed
+    assert "core-efs" not in deployed
+
+
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+@pytest.mark.parametrize(
+    ("on_failure", "buckets_status"),
+    [("continue", "SUCCESS"), ("drain", "CANCELLED"), ("stop", "CANCELLED")],
+)
+def test_deploy_module_dag_on_failure(session_manager, mocker, on_failure, buckets_status):
+    import seedfarmer.mgmt.deploy_utils as du
+    from seedfarmer.models.deploy_responses import ModuleDeploymentResponse
+
+    dep = DeploymentManifest(**mock_manifests.deployment_manifest)
+    dep.validate_and_set_module_defaults()
+    for group in dep.groups:
+        for module in group.modules:
+            module.deploy_spec = DeploySpec(**mock_deployspec.dummy_deployspec)
+    # datalake-buckets only starts once networking has failed
+    dep.groups[0].concurrency = 1
+    module_upstream_dep, _ = du.generate_dependency_maps(dep)
+    upload_concurrency = set()
+
+    def _deploy(mdo):
+        upload_concurrency.add(mdo.upload_concurrency)
+        return ModuleDeploymentResponse(
+            deployment="mlops",
+            group=mdo.group_name,
+            module=mdo.module_name,
+            status="ERROR" if mdo.module_name == "networking" else "SUCCESS",
+        )
+
+    mocker.patch("seedfarmer.commands._deployment_commands._execute_deploy", side_effect=_deploy)
+    responses = dc._deploy_module_dag(
+        deployment_manifest_wip=dep, module_upstream_dep=module_upstream_dep, on_failure=on_failure
+    )
+    statuses = {f"{response.group}-{response.module}": response.status for response in responses}
+    assert len(statuses) == 7
+    assert statuses.pop("optionals-networking") == "ERROR"
+    assert statuses.pop("optionals-datalake-buckets") == buckets_status
+    # The modules depending on networking are never started, and reported
+    assert set(statuses.values()) == {"CANCELLED"}
+    # Uploads share the pool between every module that may run at once across the groups
+    assert upload_concurrency == {min(7, sum(group.concurrency or len(group.modules) for group in dep.groups))}
+
+
+@pytest.mark.commands
+@pytest.mark.commands_deployment
+@pytest.mark.parametrize(
+    ("on_failure", "expected_status", "expected_executed"),
+    [
+        ("stop", ["ERROR", "CANCELLED", "CANCELLED"], ["fail", "slow"]),
+        ("drain", ["ERROR", "SUCCESS", "CANCELLED"], ["fail", "slow"]),
+        ("continue", ["ERROR", "SUCCESS", "SUCCESS"], ["fail", "slow", "queued"]),
+    ],
+)
+def test_execute_modules_on_failure(mocker, on_failure, expected_status, expected_executed):
+    import threading
+
+    from seedfarmer.models.deploy_responses import ModuleDeploymentResponse
+
+    slow_started = threading.Event()
+    executed = []
+
+    def _execute(mdo):
+        executed.append(mdo.module_name)
+        status = "SUCCESS"
+        if mdo.module_name == "fail":
+            slow_started.wait(timeout=5)
+            status = "ERROR"
+        elif mdo.module_name == "slow":
+            slow_started.set()
+            # Stands in for a build stopped through the cancel event
+            status = "CANCELLED" if mdo.cancel_event.wait(timeout=0.5) else "SUCCESS"
+        return ModuleDeploymentResponse(deployment="dep", group="group", module=mdo.module_name, status=status)
+
+    cancel_event = threading.Event()
+    mdos = []
+    for name in ["fail", "slow", "queued"]:
+        mdo = mocker.MagicMock(group_name="group", module_name=name, cancel_event=cancel_event)
+        mdo.deployment_manifest.name = "dep"
+        mdos.append(mdo)
+    responses = dc._execute_modules(
+        _execute, mdos, max_workers=2, thread_name_prefix="Test", cancel_event=cancel_event, on_failure=on_failure
+    )
+    assert [response.status for response in responses] == expected_status
+    assert sorted(executed) == sorted(expected_executed)
+
+    with pytest.raises(ValueError):
+        dc._execute_modules(
+            mocker.MagicMock(side_effect=ValueError),
+            mdos[:1],
+            max_workers=1,
+            thread_name_prefix="T",
+            cancel_event=threading.Event(),
+        )
+
+
 @pytest.mark.commands
 @pytest.mark.commands_deployment
 @pytest.mark.parametrize(
@@ -196,6 +196,18 @@ class TestSessionTimeoutValidation:
             InputValidator.validate_session_timeout(50000)
 
 
+class TestWorkerCountValidation:
+    """Test worker count validation."""
+
+    def test_valid_worker_count(self):
+        # Should not raise
+        InputValidator.validate_worker_count(1)
+
+    def test_worker_count_zero(self):
+        with pytest.raises(ValueError, match=r"at least 1"):
+            InputValidator.validate_worker_count(0)
+
+
 class TestRoleNameLengthValidation:
     """Test role name length validation."""
 
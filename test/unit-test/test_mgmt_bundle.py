@@ -347,3 +347,302 @@ def test_extract_zip_file_not_found():
     """Test extract_zip with non-existent file."""
     with pytest.raises(FileNotFoundError, match="Zip file not found"):
         bundle.extract_zip("/nonexistent/file.zip", "/some/path")
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_stream_bundle_matches_generate_bundle(sample_files_structure, tmp_path, monkeypatch):
+    """Test stream_bundle produces the same archive as the staged generate_bundle."""
+    temp_dir = str(tmp_path)
+    monkeypatch.chdir(temp_dir)
+    data_file = Path(temp_dir) / "data.txt"
+    data_file.write_text("data content")
+    overlay_file = Path(temp_dir) / "overlay.txt"
+    overlay_file.write_text("overlay content")
+    dirs = [(sample_files_structure["temp_dir"], "module")]
+    files = [
+        (str(data_file), "seedfarmer.yaml"),
+        (str(data_file), "module/data/data.txt"),
+        (str(overlay_file), "module/regular.txt"),
+    ]
+
+    staged_zip = bundle.generate_bundle(dirs=dirs, files=files, bundle_id="staged", path_override="out")
+    with patch("seedfarmer.mgmt.bundle.shutil.copy") as mock_copy:
+        streamed_zip = bundle.stream_bundle(dirs=dirs, files=files, bundle_id="streamed", path_override="out")
+        mock_copy.assert_not_called()
+
+    assert streamed_zip == os.path.join(temp_dir, "out", "streamed", "bundle.zip")
+    assert not os.path.exists(os.path.join(temp_dir, "out", "streamed", "bundle"))
+    with zipfile.ZipFile(staged_zip) as staged, zipfile.ZipFile(streamed_zip) as streamed:
+        assert sorted(staged.namelist()) == sorted(streamed.namelist())
+        assert "bundle/module/subdir/" in streamed.namelist()
+        assert "bundle/module/build/ignored.txt" not in streamed.namelist()
+        for name in staged.namelist():
+            assert staged.read(name) == streamed.read(name)
+        assert streamed.read("bundle/module/regular.txt") == b"overlay content"
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_stream_bundle_empty_directory(temp_dir, monkeypatch):
+    """Test stream_bundle with empty directory."""
+    monkeypatch.chdir(temp_dir)
+    empty_dir = os.path.join(temp_dir, "empty")
+    os.makedirs(empty_dir)
+
+    with pytest.raises(ValueError, match="is empty"):
+        bundle.stream_bundle(dirs=[(empty_dir, "module")], path_override="out")
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+@patch("seedfarmer.mgmt.bundle.create_output_dir")
+@patch("seedfarmer.mgmt.bundle.shutil.copy")
+def test_generate_bundle_no_archive(mock_copy, mock_create_output_dir, temp_dir):
+    """Test generate_bundle only stages the directory when archive=False."""
+    bundle_dir = os.path.join(temp_dir, "bundle")
+    mock_create_output_dir.return_value = bundle_dir
+
+    with patch("seedfarmer.mgmt.bundle._make_zipfile") as mock_make_zip:
+        assert bundle.generate_bundle(archive=False) == bundle_dir
+        mock_make_zip.assert_not_called()
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_cached_bundle(sample_files_structure, tmp_path, monkeypatch):
+    """Test cached_bundle reuses bundles with the same content and keys on the extra files."""
+    monkeypatch.chdir(tmp_path)
+    config_file = tmp_path / "seedfarmer.yaml"
+    config_file.write_text("project: one")
+    dirs = [(sample_files_structure["temp_dir"], "module")]
+    files = [(str(config_file), "seedfarmer.yaml")]
+
+    first_zip = bundle.cached_bundle(bundle_md5="12345678", max_size=1024 * 1024, dirs=dirs, files=files)
+    assert os.path.dirname(first_zip) == os.path.join(str(tmp_path), bundle.BUNDLE_CACHE_DIR)
+    with zipfile.ZipFile(first_zip) as zf:
+        assert zf.read("bundle/seedfarmer.yaml") == b"project: one"
+        assert "bundle/module/regular.txt" in zf.namelist()
+
+    with patch("seedfarmer.mgmt.bundle._write_zipfile") as mock_write:
+        assert bundle.cached_bundle(bundle_md5="12345678", max_size=1024 * 1024, dirs=dirs, files=files) == first_zip
+        mock_write.assert_not_called()
+
+    assert bundle.cached_bundle(bundle_md5="87654321", max_size=1024 * 1024, dirs=dirs, files=files) != first_zip
+    config_file.write_text("project: two")
+    second_zip = bundle.cached_bundle(bundle_md5="12345678", max_size=1024 * 1024, dirs=dirs, files=files)
+    assert second_zip != first_zip
+    assert len(os.listdir(os.path.join(str(tmp_path), bundle.BUNDLE_CACHE_DIR))) == 3
+
+    # Files left out of the module checksum are still bundled, editing them changes the bundle
+    setup_cfg = os.path.join(sample_files_structure["temp_dir"], "setup.cfg")
+    with open(setup_cfg, "w") as f:
+        f.write("[metadata]\nname = one\n")
+    third_zip = bundle.cached_bundle(bundle_md5="12345678", max_size=1024 * 1024, dirs=dirs, files=files)
+    assert third_zip != second_zip
+    with open(setup_cfg, "w") as f:
+        f.write("[metadata]\nname = two\n")
+    fourth_zip = bundle.cached_bundle(bundle_md5="12345678", max_size=1024 * 1024, dirs=dirs, files=files)
+    assert fourth_zip != third_zip
+    with zipfile.ZipFile(fourth_zip) as zf:
+        assert zf.read("bundle/module/setup.cfg") == b"[metadata]\nname = two\n"
+
+    # The cache key is the digest of the bundle, uploads reuse it instead of hashing the zip
+    digest = bundle.get_cached_bundle_digest(fourth_zip)
+    assert digest == os.path.basename(fourth_zip)[: -len(".zip")].replace("-", ":", 1)
+    assert digest.startswith("blake2b:")
+    assert bundle.get_cached_bundle_digest(str(config_file)) is None
+    assert (
+        bundle.cached_bundle(bundle_md5="12345678", max_size=1024 * 1024, dirs=dirs, files=files, compresslevel=0)
+        != fourth_zip
+    )
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_cached_bundle_eviction(sample_files_structure, tmp_path, monkeypatch):
+    """Test least recently used bundles are evicted once the cache is over its size."""
+    monkeypatch.chdir(tmp_path)
+    cache_dir = tmp_path / bundle.BUNDLE_CACHE_DIR
+    cache_dir.mkdir(parents=True)
+    for i, name in enumerate(["oldest", "older", "in-use"]):
+        stale = cache_dir / f"{name}.zip"
+        stale.write_bytes(b"x" * 1000)
+        os.utime(stale, ns=(i * 1_000_000_000, i * 1_000_000_000))
+    monkeypatch.setattr(bundle, "_cached_bundles_in_use", {str(cache_dir / "in-use.zip")})
+
+    new_zip = bundle.cached_bundle(
+        bundle_md5="12345678", max_size=1500, dirs=[(sample_files_structure["temp_dir"], "module")]
+    )
+
+    assert sorted(os.listdir(cache_dir)) == sorted(["in-use.zip", os.path.basename(new_zip)])
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_compress_type(temp_dir):
+    """Test the bundle compression policy."""
+    text_file = Path(temp_dir) / "large.txt"
+    text_file.write_text("compressible content\n" * 10000)
+    random_file = Path(temp_dir) / "weights.bin"
+    random_file.write_bytes(os.urandom(128 * 1024))
+    small_random_file = Path(temp_dir) / "small.bin"
+    small_random_file.write_bytes(os.urandom(1024))
+    archive_file = Path(temp_dir) / "lib.JAR"
+    archive_file.write_text("compressible content\n" * 10000)
+
+    assert bundle._compress_type(str(text_file)) == zipfile.ZIP_DEFLATED
+    assert bundle._compress_type(str(random_file)) == zipfile.ZIP_STORED
+    assert bundle._compress_type(str(small_random_file)) == zipfile.ZIP_DEFLATED
+    assert bundle._compress_type(str(archive_file)) == zipfile.ZIP_STORED
+    assert bundle._compress_type(str(text_file), compresslevel=0) == zipfile.ZIP_STORED
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_stream_bundle_compression(tmp_path, monkeypatch):
+    """Test stream_bundle stores incompressible files and deflates the rest."""
+    monkeypatch.chdir(tmp_path)
+    module_dir = tmp_path / "module"
+    module_dir.mkdir()
+    (module_dir / "app.py").write_text("print('hello')\n" * 1000)
+    (module_dir / "model.onnx").write_bytes(os.urandom(1024))
+
+    zip_path = bundle.stream_bundle(dirs=[(str(module_dir), "module")], compresslevel=9)
+
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.getinfo("bundle/module/app.py").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("bundle/module/model.onnx").compress_type == zipfile.ZIP_STORED
+        assert zf.read("bundle/module/model.onnx") == (module_dir / "model.onnx").read_bytes()
+
+    # The deflate level applies to each entry
+    (module_dir / "data.csv").write_text("".join(f"{i},{i * i % 977},{i % 13}\n" for i in range(20000)))
+    sizes = {}
+    for level in [1, 9]:
+        with zipfile.ZipFile(bundle.stream_bundle(dirs=[(str(module_dir), "module")], compresslevel=level)) as zf:
+            sizes[level] = zf.getinfo("bundle/module/data.csv").compress_size
+    assert sizes[9] < sizes[1]
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_stream_bundle_reads_in_chunks(tmp_path, monkeypatch):
+    """Test stream_bundle copies source files in chunks instead of reading them whole."""
+    import builtins
+
+    monkeypatch.chdir(tmp_path)
+    module_dir = tmp_path / "module"
+    module_dir.mkdir()
+    (module_dir / "model.bin").write_bytes(os.urandom(3 * 1024 * 1024))
+
+    class _ChunkedReader:
+        def __init__(self, file):
+            self._file = file
+
+        def read(self, size=-1):
+            assert size is not None and size > 0, "the whole file was read at once"
+            return self._file.read(size)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            self._file.close()
+
+    real_open = builtins.open
+
+    def _open(file, mode="r", *args, **kwargs):
+        opened = real_open(file, mode, *args, **kwargs)
+        return _ChunkedReader(opened) if mode == "rb" and str(file).startswith(str(module_dir)) else opened
+
+    monkeypatch.setattr(bundle, "open", _open, raising=False)
+    zip_path = bundle.stream_bundle(dirs=[(str(module_dir), "module")], compresslevel=1)
+    with zipfile.ZipFile(zip_path) as zf:
+        assert zf.read("bundle/module/model.bin") == (module_dir / "model.bin").read_bytes()
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_stream_bundle_reproducible(sample_files_structure, tmp_path, monkeypatch):
+    """Test stream_bundle produces identical bytes for identical content."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    dirs = [(sample_files_structure["temp_dir"], "module")]
+    script = Path(sample_files_structure["temp_dir"]) / "deploy.sh"
+    script.write_text("#!/bin/bash\n")
+    script.chmod(0o700)
+
+    with open(bundle.stream_bundle(dirs=dirs, bundle_id="first"), "rb") as f:
+        first = f.read()
+    os.utime(sample_files_structure["regular_file"], (1_000_000_000, 1_000_000_000))
+    os.chmod(sample_files_structure["sub_file"], 0o600)
+    second_zip = bundle.stream_bundle(dirs=dirs, bundle_id="second")
+    with open(second_zip, "rb") as f:
+        assert f.read() == first
+
+    with zipfile.ZipFile(second_zip) as zf:
+        infos = {info.filename: info for info in zf.infolist()}
+        assert list(infos) == sorted(infos, key=lambda name: (not name.endswith("/"), name))
+        assert {info.date_time for info in infos.values()} == {(1980, 1, 1, 0, 0, 0)}
+        assert infos["bundle/module/subdir/sub.txt"].external_attr >> 16 == 0o100644
+        assert infos["bundle/module/deploy.sh"].external_attr >> 16 == 0o100755
+        assert infos["bundle/module/subdir/"].external_attr >> 16 == 0o40755
+
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    with zipfile.ZipFile(bundle.stream_bundle(dirs=dirs, bundle_id="third")) as zf:
+        assert zf.getinfo("bundle/module/regular.txt").date_time == (2023, 11, 14, 22, 13, 20)
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_bundle
+def test_delta_bundle(sample_files_structure, tmp_path, monkeypatch):
+    """Test delta_bundle only adds changed files and apply_bundle_delta.py rebuilds the full bundle."""
+    import importlib.util
+    import json
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    dirs = [(sample_files_structure["temp_dir"], "module")]
+
+    full_zip = bundle.delta_bundle(base=None, base_manifest=None, dirs=dirs, bundle_id="full")
+    with zipfile.ZipFile(full_zip) as zf:
+        names = zf.namelist()
+        manifest = json.loads(zf.read(bundle.BUNDLE_MANIFEST_FILE))
+    assert "bundle/module/regular.txt" in names
+    assert bundle.BUNDLE_DELTA_FILE not in names
+    assert set(manifest["files"]) == {
+        name[len("bundle/") :] for name in names if name.startswith("bundle/") and not name.endswith("/")
+    }
+
+    Path(sample_files_structure["sub_file"]).write_text("changed content")
+    base = "s3://seedfarmer-bucket/bundle/dep/group/module/bundle.zip"
+    delta_zip = bundle.delta_bundle(base=base, base_manifest=manifest, dirs=dirs, bundle_id="delta")
+    src_dir = tmp_path / "src"
+    with zipfile.ZipFile(delta_zip) as zf:
+        assert [name for name in zf.namelist() if not name.endswith("/") and name.startswith("bundle/")] == [
+            "bundle/module/subdir/sub.txt"
+        ]
+        assert json.loads(zf.read(bundle.BUNDLE_DELTA_FILE)) == {"version": 1, "base": base}
+        zf.extractall(src_dir)
+
+    spec = importlib.util.spec_from_file_location("apply_bundle_delta", src_dir / bundle.BUNDLE_DELTA_SCRIPT)
+    apply_bundle_delta = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(apply_bundle_delta)
+    with (
+        patch.object(apply_bundle_delta.shutil, "which", return_value="/usr/bin/aws"),
+        patch.object(apply_bundle_delta.subprocess, "run") as mock_run,
+    ):
+        mock_run.side_effect = lambda args, check: Path(args[4]).write_bytes(Path(full_zip).read_bytes())
+        extracted, total = apply_bundle_delta.apply_delta(str(src_dir))
+    mock_run.assert_called_once()
+    assert mock_run.call_args.args[0][:4] == ["aws", "s3", "cp", base]
+    assert (extracted, total) == (len(manifest["files"]) - 1, len(manifest["files"]))
+    assert (src_dir / "bundle" / "module" / "subdir" / "sub.txt").read_text() == "changed content"
+
+    with open(bundle.stream_bundle(dirs=dirs, bundle_id="stream"), "rb") as f:
+        assert (src_dir / bundle.BUNDLE_FULL_FILE).read_bytes() == f.read()
+
+    # Without the AWS CLI the build stops with a hint instead of an import error
+    (src_dir / "bundle" / "module" / "regular.txt").unlink()
+    with patch.object(apply_bundle_delta.shutil, "which", return_value=None), pytest.raises(SystemExit):
+        apply_bundle_delta.apply_delta(str(src_dir))
@@ -70,6 +70,28 @@ def test_dependency_maps():
     assert "core-eks" in list(module_dependencies["optionals-networking"])
 
 
+@pytest.mark.mgmt
+@pytest.mark.mgmt_deployment_utils
+def test_generate_module_dag():
+    manifest = DeploymentManifest(**mock_manifests.deployment_manifest)
+    module_depends_on, _ = du.generate_dependency_maps(manifest)
+    module_dag = du.generate_module_dag(groups=manifest.groups, module_upstream_dep=module_depends_on)
+    assert module_dag["optionals-networking"] == []
+    assert module_dag["core-eks"] == ["optionals-networking"]
+    assert module_dag["platform-efs-on-eks"] == ["core-eks", "core-efs"]
+    assert module_dag["users-kubeflow-users"] == ["core-eks"]
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_deployment_utils
+def test_generate_module_dag_no_references():
+    manifest = DeploymentManifest(**mock_manifests.deployment_manifest)
+    module_dag = du.generate_module_dag(groups=manifest.groups, module_upstream_dep={})
+    assert module_dag["optionals-datalake-buckets"] == []
+    assert module_dag["core-efs"] == ["optionals-networking", "optionals-datalake-buckets"]
+    assert len(module_dag["users-kubeflow-users"]) == 6
+
+
 @pytest.mark.mgmt
 @pytest.mark.mgmt_deployment_utils
 def test_validate_group_parameters():
@@ -0,0 +1,94 @@
+#  Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#    Licensed under the Apache License, Version 2.0 (the "License").
+#    You may not use this file except in compliance with the License.
+#    You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS,
+#    WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#    See the License for the specific language governing permissions and
+#    limitations under the License.
+
+import mock_data.mock_deployment_manifest_huge as mock_deployment_manifest_huge
+import pytest
+
+import seedfarmer.errors
+import seedfarmer.mgmt.journal as journal
+from seedfarmer.models.manifests import DeploymentManifest
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_journal
+def test_journal_replay(tmp_path):
+    path = journal.get_journal_path(str(tmp_path), "mlops")
+    execution_journal = journal.ExecutionJournal(path)
+    assert execution_journal.load() is None
+
+    execution_journal.start(deployment_name="mlops", manifest_digest="blake2b:abc", modules=["g-a", "g-b", "g-c"])
+    execution_journal.account_primed(account_id="123456789012", region="us-east-1", seedkit_outputs={"Bucket": "b"})
+    for module in ["g-a", "g-b", "g-c"]:
+        execution_journal.build_started_callback(
+            module=module, account_id="123456789012", region="us-east-1", bundle_md5=f"md5-{module}"
+        )(f"build-{module}", f"codeseeder-{module}", f"/logs/{module}.log")
+    execution_journal.module_completed(module="g-a", status="SUCCESS", build_id="build-g-a", bundle_md5="md5-g-a")
+    execution_journal.module_completed(module="g-b", status="ERROR", build_id="build-g-b")
+    # A line cut short by the process being killed
+    with open(path, "a", encoding="utf-8") as journal_file:
+        journal_file.write('{"event": "module_comp')
+
+    state = journal.ExecutionJournal(path).load()
+    assert state is not None
+    assert state.manifest_digest == "blake2b:abc"
+    assert not state.completed
+    assert state.primed_accounts == {("123456789012", "us-east-1"): {"Bucket": "b"}}
+    assert state.deployed_modules == {"g-a": "md5-g-a"}
+    assert list(state.running_builds.keys()) == ["g-c"]
+    assert state.running_builds["g-c"]["build_id"] == "build-g-c"
+    assert state.running_builds["g-c"]["stream_name_prefix"] == "codeseeder-g-c"
+    assert state.running_builds["g-c"]["bundle_md5"] == "md5-g-c"
+
+    execution_journal.completed()
+    assert journal.ExecutionJournal(path).load().completed
+
+    # A new apply starts a new journal
+    execution_journal.start(deployment_name="mlops", manifest_digest="blake2b:def", modules=["g-a"])
+    state = execution_journal.load()
+    assert state.manifest_digest == "blake2b:def"
+    assert state.deployed_modules == {} and state.running_builds == {} and not state.completed
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_journal
+def test_journal_resume_state(tmp_path, mocker):
+    import seedfarmer.commands._deployment_commands as dc
+
+    mocker.patch("seedfarmer.Config.OPS_ROOT", new_callable=mocker.PropertyMock, return_value=str(tmp_path))
+    dep = DeploymentManifest(**mock_deployment_manifest_huge.deployment_manifest)
+    assert journal.get_manifest_digest(dep.model_dump()) == journal.get_manifest_digest(
+        DeploymentManifest(**mock_deployment_manifest_huge.deployment_manifest).model_dump()
+    )
+
+    # Nothing to resume, the apply starts a new journal
+    execution_journal, resume_state = dc._start_execution_journal(deployment_manifest=dep, resume=True)
+    assert resume_state is None
+    assert execution_journal.path == journal.get_journal_path(str(tmp_path), "mlops")
+    execution_journal.module_completed(module="optionals-networking", status="SUCCESS", bundle_md5="md5")
+
+    with journal.record_execution(execution_journal):
+        assert journal.get_execution_journal() is execution_journal
+    assert journal.get_execution_journal() is None
+
+    execution_journal, resume_state = dc._start_execution_journal(deployment_manifest=dep, resume=True)
+    assert resume_state.deployed_modules == {"optionals-networking": "md5"}
+
+    # Without --resume the journal of the interrupted apply is replaced
+    execution_journal, resume_state = dc._start_execution_journal(deployment_manifest=dep, resume=False)
+    assert resume_state is None
+    assert execution_journal.load().deployed_modules == {}
+
+    dep.groups[0].modules[0].path = "modules/changed"
+    with pytest.raises(seedfarmer.errors.InvalidConfigurationError):
+        dc._start_execution_journal(deployment_manifest=dep, resume=True)
@@ -192,6 +192,51 @@ def test_does_md5_match(aws_credentials, session, mocker):
     )
 
 
+@pytest.mark.mgmt
+@pytest.mark.mgmt_module_info
+def test_does_md5_match_checksum_mode(aws_credentials, session, mocker):
+    import seedfarmer.mgmt.module_info as mi
+
+    mocker.patch("seedfarmer.mgmt.module_info.ssm.get_parameter_if_exists", return_value={"hash": "12345678"})
+    assert not mi.does_md5_match(
+        deployment="myapp",
+        group="test",
+        module="mymodule",
+        hash="git-index-v1:12345678",
+        type=mi.ModuleConst.BUNDLE,
+        session=session,
+    )
+    mocker.patch(
+        "seedfarmer.mgmt.module_info.ssm.get_parameter_if_exists", return_value={"hash": "git-index-v1:12345678"}
+    )
+    assert mi.does_md5_match(
+        deployment="myapp",
+        group="test",
+        module="mymodule",
+        hash="git-index-v1:12345678",
+        type=mi.ModuleConst.BUNDLE,
+        session=session,
+    )
+
+
+@pytest.mark.mgmt
+@pytest.mark.mgmt_module_info
+def test_does_md5_match_rehash(aws_credentials, session, mocker):
+    import seedfarmer.errors
+    import seedfarmer.mgmt.module_info as mi
+
+    mocker.patch("seedfarmer.mgmt.module_info.ssm.get_parameter_if_exists", return_value={"hash": "12345678"})
+    md5_match = dict(deployment="myapp", group="test", module="mymodule", type=mi.ModuleConst.BUNDLE, session=session)
+    assert not mi.does_md5_match(hash="blake2b:abcdef", **md5_match)
+    assert mi.does_md5_match(hash="blake2b:abcdef", rehash=lambda algorithm: "12345678", **md5_match)
+    assert not mi.does_md5_match(hash="blake2b:abcdef", rehash=lambda algorithm: "87654321", **md5_match)
+
+    rehash = mocker.Mock(side_effect=seedfarmer.errors.InvalidConfigurationError("xxhash missing"))
+    mocker.patch("seedfarmer.mgmt.module_info.ssm.get_parameter_if_exists", return_value={"hash": "xxh3:12345678"})
+    assert not mi.does_md5_match(hash="blake2b:abcdef", rehash=rehash, **md5_match)
+    rehash.assert_called_once_with("xxh3")
+
+
 @pytest.mark.mgmt
 @pytest.mark.mgmt_module_info
 def test_does_md5_match_no(aws_credentials, session, mocker):
@@ -76,6 +76,32 @@ def test_deployment_manifest_with_custom_mirrors():
     assert manifest.target_account_mappings[0].pypi_mirror_secret == "user-mirror-credentials"
 
 
+@pytest.mark.models
+@pytest.mark.models_deployment_manifest
+def test_get_region_concurrency_limits():
+    manifest_yaml = deepcopy(deployment_yaml)
+    manifest_yaml["targetAccountMappings"][0]["concurrencyLimits"] = {"codebuild": 20, "cloudformation": 10}
+    manifest_yaml["targetAccountMappings"][0]["regionMappings"][0]["concurrencyLimits"] = {"codebuild": 5}
+    manifest_yaml["targetAccountMappings"][0]["regionMappings"].append({"region": "us-east-1"})
+    manifest = DeploymentManifest(**manifest_yaml)
+    assert manifest.get_region_concurrency_limits(account_id="000000000000", region="us-west-2") == {
+        "codebuild": 5,
+        "cloudformation": 10,
+    }
+    assert manifest.get_region_concurrency_limits(account_alias="primary", region="us-east-1") == {
+        "codebuild": 20,
+        "cloudformation": 10,
+    }
+    assert manifest.get_region_concurrency_limits(account_id="111111111111", region="us-west-2") == {
+        "codebuild": None,
+        "cloudformation": None,
+    }
+
+    manifest_yaml["targetAccountMappings"][0]["concurrencyLimits"] = {"codebuild": 0}
+    with pytest.raises(InvalidManifestError):
+        DeploymentManifest(**manifest_yaml)
+
+
 @pytest.mark.models
 @pytest.mark.models_deployment_manifest
 def test_get_region_mirror_secret():
@@ -729,3 +755,67 @@ parameters:
     )
     with pytest.raises(InvalidManifestError, match="Environment variable not set: VAR"):
         ModuleManifest(**module_yaml)
+
+
+@pytest.mark.models
+def test_project_spec_checksum_workers():
+    from seedfarmer.models import ProjectSpec
+
+    assert ProjectSpec(project="test").checksum_workers == 8
+    assert ProjectSpec(**{"project": "test", "checksumWorkers": 2}).checksum_workers == 2
+    with pytest.raises(InvalidManifestError):
+        ProjectSpec(**{"project": "test", "checksumWorkers": 0})
+
+
+@pytest.mark.models
+def test_project_spec_checksum_algorithm():
+    from seedfarmer.models import ProjectSpec
+
+    assert ProjectSpec(project="test").checksum_algorithm == "md5"
+    assert ProjectSpec(**{"project": "test", "checksumAlgorithm": "blake2b"}).checksum_algorithm == "blake2b"
+    with pytest.raises(InvalidManifestError):
+        ProjectSpec(**{"project": "test", "checksumAlgorithm": "sha0"})
+
+
+@pytest.mark.models
+def test_project_spec_bundle_cache_size():
+    from seedfarmer.models import ProjectSpec
+
+    assert ProjectSpec(project="test").bundle_cache_size == 2048
+    assert ProjectSpec(**{"project": "test", "bundleCacheSize": 0}).bundle_cache_size == 0
+    with pytest.raises(InvalidManifestError):
+        ProjectSpec(**{"project": "test", "bundleCacheSize": -1})
+
+
+@pytest.mark.models
+def test_project_spec_bundle_upload_mode():
+    from seedfarmer.models import ProjectSpec
+
+    assert ProjectSpec(project="test").bundle_upload_mode == "execution"
+    assert ProjectSpec(**{"project": "test", "bundleUploadMode": "content"}).bundle_upload_mode == "content"
+    assert ProjectSpec(**{"project": "test", "bundleUploadMode": "delta"}).bundle_upload_mode == "delta"
+    with pytest.raises(InvalidManifestError):
+        ProjectSpec(**{"project": "test", "bundleUploadMode": "digest"})
+
+
+@pytest.mark.models
+def test_project_spec_upload_settings():
+    from seedfarmer.models import ProjectSpec
+
+    spec = ProjectSpec(project="test")
+    assert (spec.upload_max_pool_connections, spec.upload_max_concurrency) == (50, None)
+    spec = ProjectSpec(**{"project": "test", "uploadMaxConcurrency": 4, "uploadMultipartChunksize": 64})
+    assert (spec.upload_max_concurrency, spec.upload_multipart_chunksize) == (4, 64)
+    for invalid in [{"uploadMaxPoolConnections": 0}, {"uploadMaxConcurrency": 0}, {"uploadMultipartChunksize": 1}]:
+        with pytest.raises(InvalidManifestError):
+            ProjectSpec(**{"project": "test", **invalid})
+
+
+@pytest.mark.models
+def test_project_spec_bundle_compression_level():
+    from seedfarmer.models import ProjectSpec
+
+    assert ProjectSpec(project="test").bundle_compression_level == 6
+    assert ProjectSpec(**{"project": "test", "bundleCompressionLevel": 0}).bundle_compression_level == 0
+    with pytest.raises(InvalidManifestError):
+        ProjectSpec(**{"project": "test", "bundleCompressionLevel": 10})
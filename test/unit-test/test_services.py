@@ -12,6 +12,7 @@ import logging
 import os
 
 import boto3
+import botocore.exceptions
 import pytest
 from moto import mock_aws
 
@@ -66,6 +67,30 @@ def test_utils_boto3_client(aws_credentials, session):
     _service_utils.boto3_client("s3", session)
 
 
+def test_utils_boto3_client_cache(aws_credentials):
+    _service_utils.clear_client_cache()
+    session = boto3.Session(region_name="us-east-1")
+    stats = _service_utils.get_client_cache_stats()
+
+    client = _service_utils.boto3_client("s3", session)
+    assert _service_utils.boto3_client("s3", session) is client
+    assert _service_utils.boto3_client("ssm", session) is not client
+    assert _service_utils.boto3_client("s3", boto3.Session(region_name="us-east-1")) is not client
+    assert _service_utils.boto3_client("s3", region_name="us-west-2") is not client
+    assert _service_utils.boto3_client("s3", region_name="us-west-2").meta.region_name == "us-west-2"
+    assert _service_utils.get_client_cache_stats() == {
+        "hits": stats["hits"] + 2,
+        "misses": stats["misses"] + 4,
+        "size": 4,
+    }
+
+    _service_utils.clear_client_cache(session=session)
+    assert _service_utils.get_client_cache_stats()["size"] == 2
+    assert _service_utils.boto3_client("s3", session) is not client
+    _service_utils.clear_client_cache()
+    assert _service_utils.get_client_cache_stats()["size"] == 0
+
+
 @pytest.mark.parametrize("session", [None, boto3.Session()])
 def test_utils_boto3_resource(aws_credentials, session):
     _service_utils.boto3_resource("s3", session)
@@ -84,6 +109,30 @@ def test_utils_get_account_id(sts_client, mocker):
     assert account_id == "123456789012"
 
 
+def test_utils_sts_identity_cache(sts_client, mocker):
+    _service_utils._identity_cache.clear()
+    get_caller_identity = mocker.spy(_service_utils, "_get_caller_identity")
+    create_new_session = mocker.spy(_service_utils, "create_new_session")
+    get_credentials = mocker.spy(boto3.Session, "get_credentials")
+    session = boto3.Session(region_name="us-east-1")
+
+    for _ in range(3):
+        assert _service_utils.get_sts_identity_info(session=session)[0] == "123456789012"
+        assert _service_utils.get_sts_identity_info()[2] == "aws"
+    assert (
+        _service_utils.get_sts_identity_info(
+            session=boto3.Session(aws_access_key_id="other", aws_secret_access_key="other", region_name="us-east-1")
+        )[0]
+        == "123456789012"
+    )
+    assert get_caller_identity.call_count == 3
+    # Without a session, no session is created to resolve its credentials
+    assert create_new_session.call_count == 0
+    assert get_credentials.call_count == 4
+    assert len(_service_utils._identity_cache) == 3
+    assert (None, "other") in _service_utils._identity_cache and (None, None) in _service_utils._identity_cache
+
+
 @pytest.fixture(scope="function")
 def iam_client(aws_credentials):
     with mock_aws():
@@ -220,6 +269,493 @@ def test_get_ssm_metadata(session) -> None:
         ssm.describe_parameter(name="/myapp/test/", session=session)
 
 
+def _codebuild_build(build_id, status="IN_PROGRESS", phase="BUILD"):
+    from datetime import datetime, timezone
+
+    return {
+        "id": build_id,
+        "buildStatus": status,
+        "currentPhase": phase,
+        "startTime": datetime.now(timezone.utc),
+        "phases": [],
+        "logs": {"cloudWatchLogs": {"status": "DISABLED"}},
+    }
+
+
+@pytest.mark.service
+def test_codebuild_poller_batches_builds(mocker) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    import botocore.exceptions
+
+    import seedfarmer.services._codebuild as codebuild
+
+    mocker.patch.object(codebuild, "_BUILD_WAIT_POLLING_DELAY", 0.01)
+    polls = {"count": 0}
+    throttling = botocore.exceptions.ClientError(
+        {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, "BatchGetBuilds"
+    )
+
+    def _batch_get_builds(ids):
+        polls["count"] += 1
+        if polls["count"] == 2:
+            raise throttling
+        # Builds complete on the fourth successful poll, unknown builds are not returned
+        status = "SUCCEEDED" if polls["count"] >= 8 else "IN_PROGRESS"
+        return {"builds": [_codebuild_build(build_id, status=status) for build_id in ids if build_id != "missing"]}
+
+    client = mocker.MagicMock()
+    client.batch_get_builds.side_effect = _batch_get_builds
+    mocker.patch.object(codebuild, "boto3_client", return_value=client)
+    session = object()
+
+    build_ids = [f"build-{i}" for i in range(150)]
+    with ThreadPoolExecutor(max_workers=len(build_ids)) as executor:
+        results = list(executor.map(lambda build_id: list(codebuild.wait(build_id, session=session))[-1], build_ids))
+    assert {build.status for build in results} == {codebuild.BuildStatus.succeeded}
+    assert [build.build_id for build in results] == build_ids
+    assert all(len(call.kwargs["ids"]) <= 100 for call in client.batch_get_builds.call_args_list)
+    assert client.batch_get_builds.call_count < 2 * len(build_ids)
+    assert codebuild.get_build_poller(session=session)._builds == {}
+
+    with pytest.raises(RuntimeError, match="missing not found"):
+        list(codebuild.wait("missing", session=session))
+
+
+@pytest.mark.service
+def test_codebuild_clear_build_pollers() -> None:
+    import seedfarmer.services._codebuild as codebuild
+
+    session, other_session = object(), object()
+    poller = codebuild.get_build_poller(session=session)
+    other_poller = codebuild.get_build_poller(session=other_session)
+    assert codebuild.get_build_poller(session=session) is poller
+
+    codebuild.clear_build_pollers(session=session)
+    assert session not in codebuild._pollers
+    assert codebuild.get_build_poller(session=other_session) is other_poller
+    assert codebuild.get_build_poller(session=session) is not poller
+
+    codebuild.clear_build_pollers()
+    assert codebuild._pollers == {}
+
+
+@pytest.mark.service
+def test_codebuild_poller_errors(mocker) -> None:
+    import botocore.exceptions
+
+    import seedfarmer.services._codebuild as codebuild
+
+    mocker.patch.object(codebuild, "_BUILD_WAIT_POLLING_DELAY", 0.01)
+    mocker.patch.object(codebuild, "_BUILD_WAIT_UPDATE_TIMEOUT", 0.5)
+    client = mocker.MagicMock()
+    client.batch_get_builds.side_effect = botocore.exceptions.EndpointConnectionError(endpoint_url="https://codebuild")
+    mocker.patch.object(codebuild, "boto3_client", return_value=client)
+    session = object()
+
+    # Connection errors are retried, then raised in the waiting thread
+    with pytest.raises(botocore.exceptions.EndpointConnectionError):
+        list(codebuild.wait("build-1", session=session))
+    assert client.batch_get_builds.call_count == codebuild._BATCH_GET_BUILDS_MAX_FAILURES
+
+    # Any other error stops the poller, which is started again for the next build
+    client.batch_get_builds.side_effect = None
+    client.batch_get_builds.return_value = {"builds": [{"id": "build-2"}]}
+    with pytest.raises(KeyError):
+        list(codebuild.wait("build-2", session=session))
+    poller = codebuild.get_build_poller(session=session)
+    thread = poller._thread
+    if thread is not None:
+        thread.join(timeout=5)
+    assert poller._thread is None
+
+    client.batch_get_builds.return_value = {"builds": [_codebuild_build("build-3", status="SUCCEEDED")]}
+    assert list(codebuild.wait("build-3", session=session))[-1].status is codebuild.BuildStatus.succeeded
+
+
+@pytest.mark.service
+def test_codebuild_poller_delay(mocker) -> None:
+    import seedfarmer.services._codebuild as codebuild
+
+    poller = codebuild.BuildPoller()
+    assert poller._next_delay(throttled=True) == 10
+    assert poller._next_delay(throttled=True) == 20
+    assert poller._next_delay(throttled=False) == 10
+    poller._phases = {"a": codebuild.BuildPhaseType.build, "b": codebuild.BuildPhaseType.finalizing}
+    assert poller._next_delay(throttled=False) == 2
+
+
+@pytest.mark.service
+def test_codebuild_remote_stops_cancelled_build(mocker) -> None:
+    import threading
+
+    import seedfarmer.deployment.codebuild_remote as codebuild_remote
+    import seedfarmer.services._codebuild as codebuild
+
+    cancel_event = threading.Event()
+    statuses = [codebuild.BuildStatus.in_progress, codebuild.BuildStatus.in_progress, codebuild.BuildStatus.stopped]
+
+    def _wait(build_id, session=None):
+        for status in statuses:
+            yield mocker.MagicMock(status=status, logs=mocker.MagicMock(enabled=False))
+            cancel_event.set()
+
+    mocker.patch.object(codebuild, "wait", side_effect=_wait)
+    stop = mocker.patch.object(codebuild, "stop")
+    build = codebuild_remote._wait_execution("build-1", "prefix", cancel_event=cancel_event)
+    assert build.status is codebuild.BuildStatus.stopped
+    stop.assert_called_once_with(build_id="build-1", session=None)
+
+    mocker.stop(stop)
+    client = mocker.MagicMock()
+    client.stop_build.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "InvalidInputException", "Message": "Build already complete"}}, "StopBuild"
+    )
+    mocker.patch.object(codebuild, "boto3_client", return_value=client)
+    codebuild.stop("build-1")
+    client.stop_build.assert_called_once_with(id="build-1")
+
+
+@pytest.mark.service
+def test_codebuild_remote_reattach(mocker) -> None:
+    import seedfarmer.deployment.codebuild_remote as codebuild_remote
+    import seedfarmer.errors
+    import seedfarmer.services._codebuild as codebuild
+
+    mocker.patch.object(codebuild, "start", return_value="build-1")
+    wait_execution = mocker.patch.object(codebuild_remote, "_wait_execution", return_value=None)
+    started = mocker.MagicMock()
+    codebuild_remote._execute_codebuild(
+        stack_outputs={"CodeBuildProject": "project"},
+        bundle_location="bucket/key",
+        execution_id="abcdefgh",
+        buildspec={},
+        timeout=10,
+        log_file="/logs/dep-group-module.log",
+        build_started_callback=started,
+    )
+    started.assert_called_once_with("build-1", "codeseeder-abcdefgh", "/logs/dep-group-module.log")
+
+    codebuild_remote.reattach("build-1", "codeseeder-abcdefgh", log_file="/logs/dep-group-module.log")
+    assert wait_execution.call_args.kwargs["build_id"] == "build-1"
+    assert wait_execution.call_args.kwargs["log_file"] == "/logs/dep-group-module.resumed.log"
+
+    wait_execution.side_effect = ValueError("boom")
+    with pytest.raises(seedfarmer.errors.RemoteDeploymentRuntimeError):
+        codebuild_remote.reattach("build-1", "codeseeder-abcdefgh", log_file="/logs/dep-group-module.log")
+
+
+### Governor
+@pytest.mark.service
+def test_governor_limits_and_stats(mocker) -> None:
+    import threading
+    import time
+
+    import seedfarmer.services._governor as governor
+
+    bucket = governor.TokenBucket(rate=10.0, capacity=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert 0.05 < bucket.reserve() <= 0.1
+
+    governor.reset_governor()
+    governor.configure_governor("123456789012", "us-east-1", governor.GOVERNOR_CODEBUILD, concurrency=1)
+    running = []
+    overlapped = []
+
+    def _build() -> None:
+        with governor.governed("123456789012", "us-east-1", governor.GOVERNOR_CODEBUILD):
+            running.append(1)
+            overlapped.append(len(running) > 1)
+            time.sleep(0.1)
+            running.pop()
+
+    threads = [threading.Thread(target=_build) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    with governor.governed("123456789012", "us-west-2", governor.GOVERNOR_CLOUDFORMATION) as delay:
+        assert delay == 0.0
+
+    stats = governor.get_governor_stats()
+    assert overlapped == [False, False, False]
+    assert stats["123456789012/us-east-1/codebuild"]["limit"] == 1
+    assert stats["123456789012/us-east-1/codebuild"]["acquired"] == 3
+    assert stats["123456789012/us-east-1/codebuild"]["delayed"] == 2
+    assert stats["123456789012/us-east-1/codebuild"]["max_delay"] >= 0.15
+    assert stats["123456789012/us-west-2/cloudformation"] == {
+        "limit": None,
+        "acquired": 1,
+        "delayed": 0,
+        "total_delay": 0.0,
+        "max_delay": 0.0,
+    }
+    governor.reset_governor()
+    assert governor.get_governor_stats() == {}
+
+
+@pytest.mark.service
+def test_governor_discover_codebuild_concurrency(mocker) -> None:
+    import seedfarmer.services._governor as governor
+
+    client = mocker.MagicMock()
+    client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Quotas": [
+                {"QuotaName": "Concurrently running builds for Linux/Small environment", "Value": 60.0},
+                {"QuotaName": "Concurrently running builds for ARM/Large environment", "Value": 15.0},
+                {"QuotaName": "Build projects per region per account", "Value": 5000.0},
+            ]
+        }
+    ]
+    mocker.patch.object(governor, "boto3_client", return_value=client)
+    # The quota of the seedkit project environment, not the lowest one
+    assert governor.discover_codebuild_concurrency() == 60
+    client.get_paginator.return_value.paginate.assert_called_once_with(ServiceCode="codebuild")
+
+    # Without it, the largest Linux container quota
+    client.get_paginator.return_value.paginate.return_value = [
+        {
+            "Quotas": [
+                {"QuotaName": "Concurrently running builds for Linux/Medium environment", "Value": 20.0},
+                {"QuotaName": "Concurrently running builds for Linux/Large environment", "Value": 40.0},
+                {"QuotaName": "Concurrently running builds for Linux/Lambda 1GB environment", "Value": 90.0},
+                {"QuotaName": "Concurrently running builds for Windows Server 2019/Medium environment", "Value": 1.0},
+            ]
+        }
+    ]
+    assert governor.discover_codebuild_concurrency() == 40
+
+    client.get_paginator.side_effect = botocore.exceptions.ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "denied"}}, "ListServiceQuotas"
+    )
+    assert governor.discover_codebuild_concurrency() is None
+    client.get_paginator.side_effect = botocore.exceptions.EndpointConnectionError(endpoint_url="https://servicequotas")
+    assert governor.discover_codebuild_concurrency() is None
+    client.get_paginator.side_effect = botocore.exceptions.NoCredentialsError()
+    assert governor.discover_codebuild_concurrency() is None
+
+
+### CloudWatch
+@pytest.mark.service
+def test_cloudwatch_log_tailer(mocker, tmp_path) -> None:
+    import seedfarmer.services._cloudwatch as cloudwatch
+
+    stream = [{"timestamp": 1700000000000 + i, "message": f"line {i}\n"} for i in range(7)]
+
+    def _get_log_events(**kwargs):
+        start = int(kwargs.get("nextToken", "f/0").split("/")[1])
+        end = min(start + min(kwargs["limit"], 2), len(stream))
+        return {"events": stream[start:end], "nextForwardToken": f"f/{end}"}
+
+    client = mocker.MagicMock()
+    client.get_log_events.side_effect = _get_log_events
+    mocker.patch.object(cloudwatch, "boto3_client", return_value=client)
+    mocker.patch.object(cloudwatch, "LOG_FILE_MAX_BYTES", 100)
+    log_file = tmp_path / "logs" / "module.log"
+
+    tailer = cloudwatch.LogTailer(group_name="group", stream_name="stream", log_file=str(log_file), max_events=5)
+    assert [event.message for event in tailer.tail()] == [f"line {i}\n" for i in range(5)]
+    assert tailer.next_token == "f/5"
+    assert [event.message for event in tailer.tail()] == ["line 5\n", "line 6\n"]
+    calls = client.get_log_events.call_count
+    assert list(tailer.tail()) == []
+    assert client.get_log_events.call_count == calls + 1
+    assert client.get_log_events.call_args.kwargs["nextToken"] == "f/7"
+    tailer.close()
+
+    assert log_file.read_text().splitlines()[-1].endswith(" line 6")
+    assert (tmp_path / "logs" / "module.log.1").exists()
+
+
+@pytest.mark.service
+def test_codebuild_remote_slot_held_by_build(mocker, tmp_path) -> None:
+    from contextlib import contextmanager
+
+    import seedfarmer.deployment.codebuild_remote as codebuild_remote
+
+    bundle_zip = tmp_path / "bundle.zip"
+    bundle_zip.write_bytes(b"bundle content")
+    calls = []
+
+    @contextmanager
+    def _acquire_slot():
+        calls.append("acquire")
+        yield
+        calls.append("release")
+
+    mocker.patch.object(codebuild_remote.s3, "upload_file", side_effect=lambda **_: calls.append("upload"))
+    mocker.patch.object(codebuild_remote.s3, "delete_objects")
+    mocker.patch.object(codebuild_remote.codebuild, "start", side_effect=lambda **_: calls.append("start") or "b-1")
+    mocker.patch.object(codebuild_remote, "_wait_execution", side_effect=lambda **_: calls.append("wait"))
+    codebuild_remote.run(
+        stack_outputs={"Bucket": "seedkit-bucket", "CodeBuildProject": "codebuild-project"},
+        bundle_path=str(bundle_zip),
+        buildspec={},
+        timeout=10,
+        acquire_slot=_acquire_slot,
+    )
+    # The upload does not hold a CodeBuild slot, the build holds it until it is done
+    assert calls == ["upload", "acquire", "start", "wait", "release"]
+
+
+### S3
+@pytest.mark.service
+def test_codebuild_remote_content_addressed_upload(session, mocker, tmp_path) -> None:
+    import seedfarmer.deployment.codebuild_remote as codebuild_remote
+    import seedfarmer.services._s3 as s3
+
+    bundle_zip = tmp_path / "bundle.zip"
+    bundle_zip.write_bytes(b"bundle content")
+    mocker.patch("seedfarmer.deployment.codebuild_remote._execute_codebuild", return_value=None)
+    run_args = dict(stack_outputs={"Bucket": "seedkit-bucket"}, bundle_path=str(bundle_zip), buildspec={}, timeout=10)
+
+    with mock_aws():
+        boto3_client("s3", session=session).create_bucket(Bucket="seedkit-bucket")
+        upload_file = mocker.spy(s3, "upload_file")
+        delete_objects = mocker.spy(s3, "delete_objects")
+
+        codebuild_remote.run(**run_args, bundle_id="dep-group-module", content_addressed=True)
+        codebuild_remote.run(**run_args, bundle_id="dep-group-module-other-region", content_addressed=True)
+        assert upload_file.call_count == 1
+        key = upload_file.call_args.kwargs["key"]
+        assert key.startswith(f"{codebuild_remote.BUNDLE_OBJECT_PREFIX}/blake2b-")
+        assert s3.head_object(bucket="seedkit-bucket", key=key, session=session)["Metadata"] == {
+            codebuild_remote.BUNDLE_DIGEST_METADATA: key.split("/")[-1][: -len(".zip")].replace("-", ":", 1)
+        }
+        delete_objects.assert_not_called()
+
+        bundle_zip.write_bytes(b"changed bundle content")
+        codebuild_remote.run(**run_args, content_addressed=True)
+        assert upload_file.call_count == 2
+        assert upload_file.call_args.kwargs["key"] != key
+
+        # A digest known from the bundle cache names the object without hashing the zip
+        get_file_digest = mocker.spy(codebuild_remote.checksum, "get_file_digest")
+        codebuild_remote.run(**run_args, content_addressed=True, bundle_digest="blake2b:1234")
+        assert upload_file.call_args.kwargs["key"] == f"{codebuild_remote.BUNDLE_OBJECT_PREFIX}/blake2b-1234.zip"
+
+        # Execution uploads only store a digest that is already known
+        codebuild_remote.run(**run_args, bundle_id="dep-group-module")
+        assert upload_file.call_count == 4
+        assert upload_file.call_args.kwargs["metadata"] is None
+        delete_objects.assert_called_once()
+        codebuild_remote.run(**run_args, bundle_id="dep-group-module", bundle_digest="blake2b:1234")
+        assert upload_file.call_args.kwargs["metadata"] == {codebuild_remote.BUNDLE_DIGEST_METADATA: "blake2b:1234"}
+        get_file_digest.assert_not_called()
+        assert s3.head_object(bucket="seedkit-bucket", key="missing.zip", session=session) is None
+
+
+@pytest.mark.service
+def test_s3_transfer_config(mocker, tmp_path, caplog) -> None:
+    import seedfarmer.services._s3 as s3
+
+    mocker.patch("seedfarmer.Config.UPLOAD_MAX_POOL_CONNECTIONS", new_callable=mocker.PropertyMock, return_value=40)
+    mocker.patch("seedfarmer.Config.UPLOAD_MAX_CONCURRENCY", new_callable=mocker.PropertyMock, return_value=None)
+    mocker.patch("seedfarmer.Config.UPLOAD_MULTIPART_THRESHOLD", new_callable=mocker.PropertyMock, return_value=5)
+    mocker.patch("seedfarmer.Config.UPLOAD_MULTIPART_CHUNKSIZE", new_callable=mocker.PropertyMock, return_value=16)
+    mocker.patch.object(s3, "_transfer_clients", {})
+
+    transfer_config = s3.get_transfer_config(concurrency=20)
+    assert transfer_config.max_concurrency == 2
+    assert transfer_config.multipart_threshold == 5 * s3.MIB
+    assert transfer_config.multipart_chunksize == 16 * s3.MIB
+    assert s3.get_transfer_config(concurrency=0).max_concurrency == 40
+    assert s3.get_transfer_config().max_concurrency == 40
+
+    bundle_zip = tmp_path / "bundle.zip"
+    bundle_zip.write_bytes(b"x" * (6 * s3.MIB))
+    with mock_aws():
+        session = boto3.Session()
+        boto3_client("s3", session=session).create_bucket(Bucket="seedkit-bucket")
+        get_transfer_config = mocker.spy(s3, "get_transfer_config")
+        with caplog.at_level(logging.INFO, logger="seedfarmer.services._s3"):
+            s3.upload_file(src=str(bundle_zip), bucket="seedkit-bucket", key="a.zip", session=session, concurrency=4)
+            s3.upload_file(src=str(bundle_zip), bucket="seedkit-bucket", key="b.zip", session=lambda: session)
+        assert "Uploaded s3://seedkit-bucket/a.zip (6.0 MiB" in caplog.text
+        assert [c.kwargs["concurrency"] for c in get_transfer_config.call_args_list] == [4, 1]
+        assert s3.object_exists(bucket="seedkit-bucket", key="b.zip", session=session)
+        assert len(s3._transfer_clients) == 1
+        assert s3._transfer_client(session).meta.config.max_pool_connections == 40
+
+        # Uploads on the default session get the same pool
+        s3.upload_file(src=str(bundle_zip), bucket="seedkit-bucket", key="c.zip")
+        assert len(s3._transfer_clients) == 2
+        assert s3._transfer_client().meta.config.max_pool_connections == 40
+
+
+@pytest.mark.service
+def test_copy_bundle_to_sf_unchanged(session, mocker, tmp_path) -> None:
+    import seedfarmer.mgmt.bundle_support as bundle_support
+    import seedfarmer.services._s3 as s3
+
+    bundle_zip = tmp_path / "bundle.zip"
+    bundle_zip.write_bytes(b"bundle content")
+    copy_args = dict(deployment="dep", group="group", module="module", bucket="seedfarmer-bucket")
+
+    with mock_aws():
+        client = boto3_client("s3", session=session)
+        client.create_bucket(Bucket="seedkit-bucket")
+        client.create_bucket(Bucket="seedfarmer-bucket")
+        copy_s3_object = mocker.spy(s3, "copy_s3_object")
+        for key, digest in [("a.zip", "blake2b:1234"), ("b.zip", "blake2b:1234"), ("c.zip", "blake2b:5678")]:
+            s3.upload_file(
+                src=str(bundle_zip),
+                bucket="seedkit-bucket",
+                key=key,
+                session=session,
+                metadata={bundle_support.BUNDLE_DIGEST_METADATA: digest},
+            )
+
+        bundle_support.copy_bundle_to_sf(**copy_args, bundle_src_path="seedkit-bucket/a.zip")
+        bundle_support.copy_bundle_to_sf(**copy_args, bundle_src_path="seedkit-bucket/b.zip")
+        assert copy_s3_object.call_count == 1
+        bundle_support.copy_bundle_to_sf(**copy_args, bundle_src_path="seedkit-bucket/c.zip")
+        assert copy_s3_object.call_count == 2
+        stored = s3.head_object(bucket="seedfarmer-bucket", key="bundle/dep/group/module/bundle.zip", session=session)
+        assert stored["Metadata"] == {bundle_support.BUNDLE_DIGEST_METADATA: "blake2b:5678"}
+
+
+@pytest.mark.service
+def test_store_bundle_manifest(session, tmp_path) -> None:
+    import seedfarmer.mgmt.bundle_support as bundle_support
+    import seedfarmer.services._s3 as s3
+
+    bundle_zip = tmp_path / "bundle.zip"
+    bundle_zip.write_bytes(b"bundle content")
+    manifest = tmp_path / "bundle-manifest.json"
+    manifest.write_text('{"version": 1, "files": {}}')
+    bundle_args = dict(deployment="dep", group="group", module="module", bucket="seedfarmer-bucket")
+
+    with mock_aws():
+        client = boto3_client("s3", session=session)
+        client.create_bucket(Bucket="seedkit-bucket")
+        client.create_bucket(Bucket="seedfarmer-bucket")
+        s3.upload_file(src=str(bundle_zip), bucket="seedkit-bucket", key="a.zip", session=session)
+        assert bundle_support.get_bundle_manifest(**bundle_args, session=session) is None
+
+        bundle_support.store_bundle_in_sf(
+            **bundle_args, bundle_file=str(bundle_zip), manifest_file=str(manifest), session=session
+        )
+        assert bundle_support.get_bundle_manifest(**bundle_args, session=session) == {"version": 1, "files": {}}
+        assert s3.object_exists(bucket="seedfarmer-bucket", key="bundle/dep/group/module/bundle.zip", session=session)
+
+        # A copied bundle without a manifest drops the manifest of the previous bundle
+        bundle_support.copy_bundle_to_sf(**bundle_args, bundle_src_path="seedkit-bucket/a.zip", session=session)
+        assert bundle_support.get_bundle_manifest(**bundle_args, session=session) is None
+        bundle_support.copy_bundle_to_sf(
+            **bundle_args, bundle_src_path="seedkit-bucket/a.zip", session=session, manifest_file=str(manifest)
+        )
+        assert bundle_support.get_bundle_manifest(**bundle_args, session=session) == {"version": 1, "files": {}}
+
+        bundle_support.delete_bundle_from_sf(**bundle_args, session=session)
+        assert (
+            s3.get_object(bucket="seedfarmer-bucket", key="bundle/dep/group/module/bundle.zip", session=session) is None
+        )
+        assert bundle_support.get_bundle_manifest(**bundle_args, session=session) is None
+
+
 # ### SecretsManager
 # @pytest.mark.service
 # def test_secrets_manager(session_manager, mocker, secretsmanager_client)->None:
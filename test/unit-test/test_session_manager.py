@@ -79,3 +79,133 @@ def test_deployment_session(session_manager, sts_client):
     SessionManager().get_or_create(project_name="test").get_deployment_session(
         account_id="111111111111", region_name="us-east-1"
     )
+
+
+@pytest.mark.session_manager
+def test_reaper_clears_client_cache(session_manager, sts_client, mocker):
+    from seedfarmer.services import _codebuild, _service_utils
+
+    session = (
+        SessionManager()
+        .get_or_create(project_name="test")
+        .get_deployment_session(account_id="111111111111", region_name="us-east-1")
+    )
+    boto3_client(service_name="s3", session=session)
+    assert _service_utils.get_client_cache_stats()["size"] > 0
+    poller = _codebuild.get_build_poller(session=session)
+
+    mocker.patch("seedfarmer.services.session_manager.sleep", side_effect=[None, InterruptedError])
+    with pytest.raises(InterruptedError):
+        SessionManagerRemoteImpl()._reap_sessions(interval=0)
+    assert SessionManagerRemoteImpl().sessions == {}
+    assert _service_utils.get_client_cache_stats()["size"] == 0
+    assert session not in _codebuild._pollers
+    assert _codebuild.get_build_poller(session=session) is not poller
+
+
+@pytest.mark.session_manager
+def test_deployment_session_created_once(session_manager, sts_client, mocker):
+    from concurrent.futures import ThreadPoolExecutor
+
+    import seedfarmer.services.session_manager as sm
+
+    role_arn = mocker.spy(sm, "get_deployment_role_arn")
+    manager = SessionManager().get_or_create(project_name="test")
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(
+            executor.map(
+                lambda region: manager.get_deployment_session(account_id="111111111111", region_name=region),
+                ["us-east-1", "us-west-2"] * 8,
+            )
+        )
+    assert role_arn.call_count == 2
+    assert len({id(session) for session in sessions}) == 2
+
+
+@pytest.mark.session_manager
+def test_deployment_session_refreshes_credentials(session_manager, sts_client):
+    from datetime import datetime, timezone
+
+    session = (
+        SessionManager()
+        .get_or_create(project_name="test")
+        .get_deployment_session(account_id="111111111111", region_name="us-east-1")
+    )
+    credentials = session.get_credentials()
+    access_key = credentials.get_frozen_credentials().access_key
+
+    # Credentials past their mandatory refresh window re-assume the deployment role
+    credentials._expiry_time = datetime.now(timezone.utc)
+    assert credentials.get_frozen_credentials().access_key != access_key
+    assert credentials.method == "sts-assume-role"
+
+
+@pytest.mark.session_manager
+def test_warm_up_deployment_sessions(session_manager, sts_client, mocker):
+    manager = SessionManager().get_or_create(project_name="test")
+    latencies = manager.warm_up_deployment_sessions(
+        accounts_regions=[("111111111111", "us-east-1"), ("111111111111", "us-west-2"), ("111111111111", "us-east-1")]
+    )
+    assert set(latencies) == {"111111111111-us-east-1", "111111111111-us-west-2"}
+    assert "111111111111-us-west-2" in SessionManagerRemoteImpl().sessions
+
+    def _get_deployment_session(account_id, region_name):
+        if account_id != "111111111111":
+            raise seedfarmer.errors.InvalidSessionError(f"\n    AccessDenied for {account_id}\n    HINT")
+        return None
+
+    mocker.patch.object(manager, "get_deployment_session", side_effect=_get_deployment_session)
+    with pytest.raises(seedfarmer.errors.InvalidSessionError) as e:
+        manager.warm_up_deployment_sessions(
+            accounts_regions=[
+                ("111111111111", "us-east-1"),
+                ("222222222222", "us-east-1"),
+                ("333333333333", "eu-west-1"),
+            ]
+        )
+    assert "2 of 3" in str(e.value)
+    assert "222222222222-us-east-1: AccessDenied for 222222222222" in str(e.value)
+    assert "333333333333-eu-west-1: AccessDenied for 333333333333" in str(e.value)
+    assert "HINT" not in str(e.value)
+
+
+@pytest.mark.session_manager
+def test_credentials_cache(session_manager, sts_client, tmp_path, monkeypatch):
+    import json
+    import stat
+    from datetime import datetime, timedelta, timezone
+
+    import seedfarmer.services._credentials_cache as credentials_cache
+
+    cache_dir = tmp_path / "credentials"
+    monkeypatch.setattr(credentials_cache, "CREDENTIALS_CACHE_DIR", str(cache_dir))
+    monkeypatch.setenv(credentials_cache.CREDENTIALS_CACHE_ENV, "true")
+
+    def _new_process_session():
+        type(SessionManagerRemoteImpl)._instances.pop(SessionManagerRemoteImpl, None)
+        SessionManager.bind(SessionManagerRemoteImpl())
+        session = (
+            SessionManager()
+            .get_or_create(project_name="test")
+            .get_deployment_session(account_id="111111111111", region_name="us-east-1")
+        )
+        return session.get_credentials().get_frozen_credentials().access_key
+
+    access_key = _new_process_session()
+    cached_files = sorted(cache_dir.glob("*.json"))
+    assert len(cached_files) == 2  # toolchain and deployment roles
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+    assert {stat.S_IMODE(path.stat().st_mode) for path in cached_files} == {0o600}
+    assert _new_process_session() == access_key
+
+    # Credentials close to expiring are assumed again
+    for path in cached_files:
+        cached = json.loads(path.read_text())
+        cached["Credentials"]["Expiration"] = (datetime.now(timezone.utc) + timedelta(minutes=5)).isoformat()
+        path.write_text(json.dumps(cached))
+    assert _new_process_session() != access_key
+
+    monkeypatch.delenv(credentials_cache.CREDENTIALS_CACHE_ENV)
+    mtimes = [path.stat().st_mtime_ns for path in cached_files]
+    _new_process_session()
+    assert [path.stat().st_mtime_ns for path in cached_files] == mtimes
@@ -69,3 +69,52 @@ def test_role_names_are_lowercase():
         utils.get_deployment_role_name("FalconProject", qualifier="abc123")
         == "seedfarmer-falconproject-deployment-role-abc123"
     )
+
+
+@pytest.mark.utils_test
+def test_get_path_lock():
+    lock = utils.get_path_lock("seedfarmer.gitmodules/repo")
+    assert lock is utils.get_path_lock(os.path.abspath("seedfarmer.gitmodules/repo"))
+    assert lock is not utils.get_path_lock("seedfarmer.gitmodules/other-repo")
+
+
+@pytest.mark.utils_test
+def test_build_progress_view(mocker):
+    from rich.console import Console
+
+    import seedfarmer.output_utils as output_utils
+    import seedfarmer.services._codebuild as codebuild
+
+    mocker.patch.object(output_utils, "console", Console(record=True, width=200))
+    live_console = Console(record=True, width=200)
+    mocker.patch.object(output_utils, "Console", return_value=live_console)
+
+    def _build(phase: codebuild.BuildPhaseType, status: codebuild.BuildStatus):
+        return mocker.MagicMock(current_phase=phase, status=status)
+
+    assert output_utils.get_build_progress_view() is None
+    with output_utils.show_build_progress(enabled=False) as view:
+        assert view is None
+
+    with output_utils.show_build_progress(enabled=True, follow=["group-one"]) as view:
+        assert output_utils.get_build_progress_view() is view
+        one, two = view.status_callback("group-one"), view.status_callback("group-two")
+        one(_build(codebuild.BuildPhaseType.build, codebuild.BuildStatus.in_progress))
+        two(_build(codebuild.BuildPhaseType.install, codebuild.BuildStatus.in_progress))
+        view.log_callback("group-one")("followed line")
+        view.log_callback("group-two")("other line")
+        view._drain()
+        assert view._rows["group-one"].phase == "BUILD"
+        assert view._rows["group-two"].last_line == "other line"
+        assert view._render().row_count == 2
+        one(_build(codebuild.BuildPhaseType.completed, codebuild.BuildStatus.succeeded))
+        two(_build(codebuild.BuildPhaseType.completed, codebuild.BuildStatus.failed))
+    assert output_utils.get_build_progress_view() is None
+    assert view._rows == {}
+    assert view._completed == {"group-one": "SUCCEEDED", "group-two": "FAILED"}
+    # The view draws on its own console, the output of the apply recorded by the module console is left alone
+    assert "followed line" not in output_utils.console.export_text()
+    output = live_console.export_text()
+    assert "[group-one] followed line" in output
+    assert "[group-two] other line" not in output
+    assert "completed: 1  failed: 1" in output